@@ -7,41 +7,416 @@ import random
 import time
 import os
 import sys
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+
+# Игры из отдельных модулей (minesweeper.py и другие) берут out, ask, rng и
+# прочее отсюда. Под `python Littleminigames.py` этот файл — модуль __main__,
+# и без этой строки их import загрузил бы его второй раз, с отдельной
+# консолью и отдельным сидом.
+sys.modules.setdefault('Littleminigames', sys.modules[__name__])
+
+# -------------------------
+# Clock (время)
+# Все паузы и замеры времени идут через sleep()/now()/perf(). RealClock —
+# настоящее время; VirtualClock — перемотка: sleep не ждёт, а только сдвигает
+# виртуальное время, так что игры на реакцию считают очки так же.
+# -------------------------
+class RealClock:
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def now(self):
+        return time.time()
+
+    def perf(self):
+        return time.perf_counter()
+
+class VirtualClock:
+    """
+    Виртуальные часы без ожидания. Время двигается только через sleep()/advance().
+    """
+    def __init__(self, start=0.0):
+        self.start = start
+        self.elapsed = 0.0
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.elapsed += seconds
+
+    advance = sleep
+
+    def now(self):
+        return self.start + self.elapsed
+
+    def perf(self):
+        return self.elapsed
+
+class FastClock(RealClock):
+    """
+    Настоящее время, но без пауз: пропущенные секунды прибавляются к now()/perf(),
+    поэтому игры на реакцию по-прежнему меряют реальное время ввода.
+    """
+    def __init__(self):
+        self.skipped = 0.0
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.skipped += seconds
+
+    def now(self):
+        return time.time() + self.skipped
+
+    def perf(self):
+        return time.perf_counter() + self.skipped
+
+_default_clock = RealClock()
+_clock = contextvars.ContextVar('clock', default=None)
+
+def get_clock():
+    return _clock.get() or _default_clock
+
+@contextmanager
+def use_clock(clock):
+    """
+    Сделать clock текущими часами внутри блока with.
+    """
+    token = _clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _clock.reset(token)
+
+def sleep(seconds):
+    get_console().flush()
+    get_clock().sleep(seconds)
+
+def now():
+    return get_clock().now()
+
+def perf():
+    return get_clock().perf()
+
+# -------------------------
+# RNG (случайность)
+# У каждой сессии и у каждого запуска игры свой random.Random, заданный сидом.
+# Игры обращаются к rng.randint(...), rng.choice(...) и т.д.: rng передаёт
+# вызов генератору текущей сессии (тоже через contextvars), поэтому
+# параллельные сессии не мешают друг другу, а прогон по сиду воспроизводим.
+# -------------------------
+def new_seed():
+    return int.from_bytes(os.urandom(4), 'big')
+
+_default_rng = random.Random()
+_rng = contextvars.ContextVar('rng', default=None)
+
+def get_rng():
+    return _rng.get() or _default_rng
+
+@contextmanager
+def use_rng(seed):
+    """
+    Сделать генератором внутри блока with random.Random(seed)
+    (или сам seed, если это уже объект random.Random).
+    """
+    gen = seed if isinstance(seed, random.Random) else random.Random(seed)
+    token = _rng.set(gen)
+    try:
+        yield gen
+    finally:
+        _rng.reset(token)
+
+class _SessionRandom:
+    def __getattr__(self, name):
+        return getattr(get_rng(), name)
+
+rng = _SessionRandom()
+
+# -------------------------
+# Console (ввод/вывод)
+# Все игры общаются с игроком только через out()/ask()/clear(), а те — через
+# текущую консоль. Консоль хранится в contextvars, поэтому у каждого потока
+# или задачи asyncio может быть своя.
+# -------------------------
+class TerminalConsole:
+    """
+    Обычный терминал: stdin/stdout процесса.
+    Вывод буферизуется и уходит одним write при flush() — перед вводом, паузой
+    или очисткой экрана, то есть один системный вызов на кадр.
+    Если stdout — настоящий терминал, clear() не запускает внешнюю команду,
+    а начинает новый кадр: при flush() он сравнивается с прошлым экраном и
+    перерисовываются только изменившиеся строки (ANSI escape-последовательности).
+    """
+    def __init__(self, stdin=None, stdout=None, ansi=None, size=None):
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self.size = size      # os.terminal_size; None — спросить у терминала
+        if ansi is None:
+            ansi = hasattr(self.stdout, 'isatty') and self.stdout.isatty()
+            if ansi and os.name == 'nt':
+                os.system('')  # включает VT-режим консоли Windows
+        self.ansi = ansi
+        self._screen = None   # строки на экране с последнего кадра (None — неизвестно)
+        self._frame = None    # накопленный вывод нового кадра (None — кадра нет)
+        self._pending = []    # вывод вне кадра, ещё не отправленный
+
+    def write(self, text):
+        if self._frame is not None:
+            self._frame.append(text)
+        else:
+            self._pending.append(text)
+
+    def read_line(self, prompt=''):
+        if prompt:
+            self.write(prompt)
+        self.flush()
+        line = self.stdin.readline()
+        if not line:
+            raise EOFError
+        line = line.rstrip('\r\n')
+        if self._screen is not None:
+            self._track(line + '\n')
+        return line
+
+    def realtime(self):
+        """
+        Можно ли читать клавиши без Enter: stdin — настоящий терминал и есть termios.
+        """
+        try:
+            import termios, tty  # noqa: F401 (нет на Windows)
+            return self.stdin.isatty()
+        except (ImportError, AttributeError, ValueError):
+            return False
+
+    @contextmanager
+    def cbreak(self):
+        """
+        Перевести терминал в cbreak (клавиши приходят сразу, без эха);
+        на выходе вернуть прежний режим и выбросить непрочитанные клавиши.
+        """
+        import termios, tty
+        fd = self.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        try:
+            yield
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+            termios.tcflush(fd, termios.TCIFLUSH)
+
+    def read_keys(self, timeout):
+        """
+        Подождать клавиши не дольше timeout секунд и вернуть всё, что пришло
+        (пустая строка — ничего). Работает только внутри cbreak().
+        """
+        import select
+        self.flush()
+        fd = self.stdin.fileno()
+        ready, _, _ = select.select([fd], [], [], max(0.0, timeout))
+        if not ready:
+            return ''
+        return os.read(fd, 64).decode('utf-8', 'ignore')
+
+    def clear(self):
+        self.flush()
+        if not self.ansi:
+            os.system('cls' if os.name == 'nt' else 'clear')
+            return
+        self._frame = []
+
+    def flush(self):
+        if self._frame is not None:
+            text = self._render(''.join(self._frame).split('\n'))
+            self._frame = None
+        elif self._pending:
+            text = ''.join(self._pending)
+            if self._screen is not None:
+                self._track(text)
+        else:
+            return
+        self._pending = []
+        self.stdout.write(text)
+        self.stdout.flush()
+
+    def _track(self, text):
+        parts = text.split('\n')
+        self._screen[-1] += parts[0]
+        self._screen.extend(parts[1:])
+
+    def _render(self, lines):
+        """
+        Вернуть escape-последовательность, превращающую текущий экран в lines.
+        """
+        import shutil
+        old = self._screen
+        self._screen = lines
+        size = self.size or shutil.get_terminal_size()
+        if (old is None or len(old) > size.lines or len(lines) > size.lines
+                or any(len(l) >= size.columns for l in old)
+                or any(len(l) >= size.columns for l in lines)):
+            # экран прокручивался или строки переносятся — номера строк не совпадут
+            return '\x1b[H\x1b[2J' + '\n'.join(lines)
+        buf = []
+        last = len(lines) - 1
+        for i in range(last):
+            if i >= len(old) or old[i] != lines[i]:
+                buf.append(f'\x1b[{i+1};1H{lines[i]}\x1b[K')
+        buf.append(f'\x1b[{last+1};1H{lines[last]}\x1b[J')
+        return ''.join(buf)
+
+class HeadlessConsole:
+    """
+    Консоль без терминала: ввод берётся из заранее заданных строк,
+    вывод копится в памяти. Когда строки кончаются, read_line бросает EOFError.
+    think_time — сколько секунд (по текущим часам) «думает» игрок перед каждым
+    ответом; с VirtualClock это даёт играм на время реалистичные замеры.
+    """
+    def __init__(self, inputs=(), think_time=0.0):
+        self.inputs = deque(inputs)
+        self.output = []
+        self.clears = 0
+        self.reads = 0
+        self.think_time = think_time
+
+    def feed(self, *lines):
+        self.inputs.extend(lines)
+
+    def write(self, text):
+        self.output.append(text)
+
+    def read_line(self, prompt=''):
+        if prompt:
+            self.output.append(prompt)
+        if not self.inputs:
+            raise EOFError
+        self.reads += 1
+        sleep(self.think_time)
+        return str(self.inputs.popleft())
+
+    def realtime(self):
+        return True
+
+    @contextmanager
+    def cbreak(self):
+        yield
+
+    def read_keys(self, timeout):
+        """
+        Одна строка ввода — клавиши, нажатые за это ожидание ('' — ничего);
+        ожидание проходит по текущим часам целиком.
+        """
+        if not self.inputs:
+            raise EOFError
+        self.reads += 1
+        sleep(timeout)
+        return str(self.inputs.popleft())
+
+    def clear(self):
+        self.clears += 1
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return ''.join(self.output)
+
+_default_console = TerminalConsole()
+_console = contextvars.ContextVar('console', default=None)
+
+def get_console():
+    return _console.get() or _default_console
+
+@contextmanager
+def use_console(console):
+    """
+    Сделать console текущей внутри блока with (для текущего потока/задачи).
+    """
+    token = _console.set(console)
+    try:
+        yield console
+    finally:
+        _console.reset(token)
+
+def run_scripted(game, inputs=(), think_time=0.0, clock=None, seed=None):
+    """
+    Прогнать игру на HeadlessConsole с заданными строками ввода.
+    По умолчанию время виртуальное (VirtualClock), так что паузы не ждут.
+    С одинаковыми seed и inputs вывод совпадает до символа.
+    Если ввод закончился раньше игры — игра просто прерывается.
+    Возвращает консоль с накопленным выводом.
+    """
+    console = HeadlessConsole(inputs, think_time)
+    with use_console(console), use_clock(clock or VirtualClock()), use_rng(seed):
+        try:
+            game()
+        except EOFError:
+            pass
+    return console
+
+# Вызывается перед каждым ожиданием ввода (см. профилирование ниже).
+_input_probe = contextvars.ContextVar('input_probe', default=None)
 
 # Utilities
+def out(*args, sep=' ', end='\n'):
+    get_console().write(sep.join(str(a) for a in args) + end)
+
+def ask(prompt=''):
+    probe = _input_probe.get()
+    if probe is not None:
+        probe()
+    return get_console().read_line(prompt)
+
 def clear():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    get_console().clear()
+
+def flush():
+    get_console().flush()
+
+def can_read_keys():
+    """
+    Поддерживает ли текущая консоль ввод по клавишам (режим реального времени).
+    """
+    realtime = getattr(get_console(), 'realtime', None)
+    return bool(realtime and realtime())
+
+def cbreak():
+    return get_console().cbreak()
+
+def read_keys(timeout):
+    return get_console().read_keys(timeout)
 
 def input_int(prompt, minv=None, maxv=None):
     while True:
         try:
-            s = input(prompt).strip()
+            s = ask(prompt).strip()
             if s == '':
                 return None
             v = int(s)
             if (minv is not None and v < minv) or (maxv is not None and v > maxv):
-                print(f'Введите число от {minv} до {maxv}.')
+                out(f'Введите число от {minv} до {maxv}.')
                 continue
             return v
         except ValueError:
-            print('Введите целое число.')
+            out('Введите целое число.')
 
 def press_enter():
-    input('\nНажмите Enter, чтобы продолжить...')
+    ask('\nНажмите Enter, чтобы продолжить...')
 def safe_print(s):
     """
     Вывод с небольшой паузой — чтобы текст успевал прочитаться.
     """
-    print(s)
-    time.sleep(0.6)
+    out(s)
+    sleep(0.6)
 def input_choice(prompt, choices):
     """
     Показать варианты choices пользователю и вернуть выбранный элемент (строку).
     Если ввод пустой — вернуть None.
     """
-    print(prompt)
+    out(prompt)
     for i, c in enumerate(choices, 1):
-        print(f'{i}. {c}')
+        out(f'{i}. {c}')
     sel = input_int('Выберите номер (Enter - пропуск): ', 1, len(choices))
     if sel is None:
         return None
@@ -59,38 +434,79 @@ def choose_option(prompt, options):
     Показать список options пользователю, запросить номер и вернуть индекс (0-based).
     Если ввод пустой или некорректный — возвращает None.
     """
-    print(prompt)
+    out(prompt)
     for i, o in enumerate(options, 1):
-        print(f'{i}. {o}')
+        out(f'{i}. {o}')
     sel = input_int('Выберите номер (Enter = пропуск): ', 1, len(options))
     if sel is None:
         return None
     return sel - 1
 
+# -------------------------
+# IndexedSet (общий для сапёра и змейки)
+# -------------------------
+class IndexedSet:
+    """
+    Множество с выбором случайного элемента за O(1): элементы лежат в
+    списке, их позиции — в словаре; при удалении на место удалённого
+    переезжает последний элемент.
+    """
+    __slots__ = ('items', 'pos')
+
+    def __init__(self, items=()):
+        self.items = list(items)
+        self.pos = {x: k for k, x in enumerate(self.items)}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, x):
+        return x in self.pos
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def add(self, x):
+        if x not in self.pos:
+            self.pos[x] = len(self.items)
+            self.items.append(x)
+
+    def discard(self, x):
+        k = self.pos.pop(x, None)
+        if k is None:
+            return
+        last = self.items.pop()
+        if k < len(self.items):
+            self.items[k] = last
+            self.pos[last] = k
+
+    def choice(self, rnd):
+        return rnd.choice(self.items)
+
 # -------------------------
 # Game 1: Math Quiz
 # -------------------------
 def math_quiz():
     clear()
-    print('=== Math Quiz ===')
+    out('=== Math Quiz ===')
     rounds = input_int('Сколько вопросов? (по умолчанию 5): ', 1) or 5
     max_val = input_int('Максимальное число (по умолчанию 12): ', 2) or 12
     ops = {'+': lambda a,b: a+b, '-': lambda a,b: a-b, '*': lambda a,b: a*b}
     score = 0
     for i in range(1, rounds+1):
-        a = random.randint(1, max_val)
-        b = random.randint(1, max_val)
-        op = random.choice(list(ops.keys()))
+        a = rng.randint(1, max_val)
+        b = rng.randint(1, max_val)
+        op = rng.choice(list(ops.keys()))
         correct = ops[op](a, b)
         ans = input_int(f'Вопрос {i}/{rounds}: {a} {op} {b} = ')
         if ans is None:
-            print(f'Пропуск. Правильный ответ: {correct}')
+            out(f'Пропуск. Правильный ответ: {correct}')
         elif ans == correct:
-            print('Верно!')
+            out('Верно!')
             score += 1
         else:
-            print(f'Неверно. Правильный ответ: {correct}')
-    print(f'\nВы набрали {score}/{rounds}')
+            out(f'Неверно. Правильный ответ: {correct}')
+    out(f'\nВы набрали {score}/{rounds}')
     press_enter()
 
 # -------------------------
@@ -98,189 +514,75 @@ def math_quiz():
 # -------------------------
 def guess_number():
     clear()
-    print('=== Guess the Number ===')
+    out('=== Guess the Number ===')
     low = input_int('Нижняя граница (по умолчанию 1): ') or 1
     high = input_int('Верхняя граница (по умолчанию 100): ') or 100
-    secret = random.randint(low, high)
+    secret = rng.randint(low, high)
     tries = 0
     while True:
         g = input_int(f'Угадайте число между {low} и {high} (или пусто для выхода): ')
         if g is None:
-            print(f'Вы вышли. Загаданное число было {secret}.')
+            out(f'Вы вышли. Загаданное число было {secret}.')
             break
         tries += 1
         if g < secret:
-            print('Слишком мало.')
+            out('Слишком мало.')
         elif g > secret:
-            print('Слишком много.')
+            out('Слишком много.')
         else:
-            print(f'Угадали за {tries} попыток! Поздравляю.')
+            out(f'Угадали за {tries} попыток! Поздравляю.')
             break
     press_enter()
 
-# -------------------------
-# Game 3: Minesweeper (Сапёр)
-# -------------------------
-def minesweeper():
-    clear()
-    print('=== Minesweeper (Сапёр) ===')
-    rows = input_int('Рядов (по умолчанию 8): ', 2) or 8
-    cols = input_int('Столбцов (по умолчанию 8): ', 2) or 8
-    max_mines = rows*cols - 1
-    mines_count = input_int(f'Количество мин (по умолчанию 10): ', 1, max_mines) or min(10, max_mines)
-
-    board = [[0]*cols for _ in range(rows)]
-    mine_positions = set()
-    while len(mine_positions) < mines_count:
-        r = random.randrange(rows)
-        c = random.randrange(cols)
-        if (r,c) not in mine_positions:
-            mine_positions.add((r,c))
-            board[r][c] = 'M'
-    for r in range(rows):
-        for c in range(cols):
-            if board[r][c] == 'M': continue
-            cnt = 0
-            for dr in (-1,0,1):
-                for dc in (-1,0,1):
-                    nr, nc = r+dr, c+dc
-                    if 0 <= nr < rows and 0 <= nc < cols and board[nr][nc] == 'M':
-                        cnt += 1
-            board[r][c] = cnt
-
-    revealed = [[False]*cols for _ in range(rows)]
-    flagged = [[False]*cols for _ in range(rows)]
-    def render():
-        clear()
-        hdr = '   ' + ' '.join(f'{c:2d}' for c in range(cols))
-        print(hdr)
-        for r in range(rows):
-            line = f'{r:2d} '
-            for c in range(cols):
-                if flagged[r][c]:
-                    line += ' F'
-                elif not revealed[r][c]:
-                    line += ' #'
-                else:
-                    v = board[r][c]
-                    if v == 0:
-                        line += ' .'
-                    elif v == 'M':
-                        line += ' *'
-                    else:
-                        line += f' {v}'
-            print(line)
-    remaining = rows*cols - mines_count
-    while True:
-        render()
-        print('\nКоманды: r row col  - открыть; f row col - пометить/снять флаг; q - выйти')
-        cmd = input('> ').strip().lower()
-        if cmd == 'q' or cmd == '':
-            print('Выход из Сапёра.')
-            break
-        parts = cmd.split()
-        if len(parts) < 3:
-            print('Неверная команда.')
-            time.sleep(0.6)
-            continue
-        action, *rest = parts
-        try:
-            row = int(rest[0]); col = int(rest[1])
-        except:
-            print('Неверные координаты.')
-            time.sleep(0.6)
-            continue
-        if not (0 <= row < rows and 0 <= col < cols):
-            print('Координаты вне поля.')
-            time.sleep(0.6)
-            continue
-        if action == 'f':
-            flagged[row][col] = not flagged[row][col]
-            continue
-        if action == 'r':
-            if flagged[row][col]:
-                print('Сначала снимите флаг.')
-                time.sleep(0.6)
-                continue
-            if revealed[row][col]:
-                print('Уже открыта.')
-                time.sleep(0.6)
-                continue
-            if board[row][col] == 'M':
-                for r,c in mine_positions:
-                    revealed[r][c] = True
-                render()
-                print('\nБах! Вы подорвались на мине. Игра окончена.')
-                break
-            stack = [(row,col)]
-            opened = 0
-            while stack:
-                r,c = stack.pop()
-                if revealed[r][c]: continue
-                revealed[r][c] = True
-                opened += 1
-                if board[r][c] == 0:
-                    for dr in (-1,0,1):
-                        for dc in (-1,0,1):
-                            nr, nc = r+dr, c+dc
-                            if 0 <= nr < rows and 0 <= nc < cols and not revealed[nr][nc]:
-                                stack.append((nr,nc))
-            remaining -= opened
-            if remaining <= 0:
-                render()
-                print('\nПоздравляю! Вы открыли все безопасные клетки и выиграли!')
-                break
-    press_enter()
-
 # -------------------------
 # Game 4: Dogonalki (Догонялки) - simple chase
 # -------------------------
 def dogonalki():
     clear()
-    print('=== Догонялки ===')
+    out('=== Догонялки ===')
     length = input_int('Длина трассы (по умолчанию 20): ', 5) or 20
     player = 0
     chaser = -3
     max_turns = input_int('Максимум ходов до ничьи (по умолчанию 200): ', 10) or 200
     turn = 0
-    print('Правила: вы - игрок (P), преследователь - (C). Ход: b (бежать) или s (замедлиться).')
+    out('Правила: вы - игрок (P), преследователь - (C). Ход: b (бежать) или s (замедлиться).')
     press_enter()
     while turn < max_turns:
         turn += 1
         clear()
-        print(f'Ход {turn}')
+        out(f'Ход {turn}')
         track = ['.']*length
         if 0 <= player < length:
             track[player] = 'P'
         if 0 <= chaser < length:
             if track[chaser] == 'P': track[chaser] = 'X'
             else: track[chaser] = 'C'
-        print(''.join(track))
-        move = input('Ваш ход: (b) бежать, (s) замедлиться, (q) выйти: ').strip().lower()
+        out(''.join(track))
+        move = ask('Ваш ход: (b) бежать, (s) замедлиться, (q) выйти: ').strip().lower()
         if move == 'q' or move == '':
-            print('Выход.')
+            out('Выход.')
             break
         if move == 'b':
-            player += random.randint(1,3)
+            player += rng.randint(1,3)
         else:
-            player += random.randint(0,1)
+            player += rng.randint(0,1)
         dist = player - chaser
         if dist <= 2:
-            chaser += random.randint(1,3)
+            chaser += rng.randint(1,3)
         else:
-            chaser += random.randint(1,2)
+            chaser += rng.randint(1,2)
         player = min(player, length-1)
         chaser = min(chaser, length-1)
         if chaser >= player:
             clear()
-            print('Преследователь догнал вас! Вы проиграли.')
+            out('Преследователь догнал вас! Вы проиграли.')
             break
         if player >= length-1:
             clear()
-            print('Вы добежали до финиша и спаслись! Победа!')
+            out('Вы добежали до финиша и спаслись! Победа!')
             break
     else:
-        print('Максимум ходов достигнут — ничья.')
+        out('Максимум ходов достигнут — ничья.')
     press_enter()
 
 # -------------------------
@@ -288,115 +590,64 @@ def dogonalki():
 # -------------------------
 def hide_and_seek():
     clear()
-    print('=== Hide & Seek (Прятки) ===')
+    out('=== Hide & Seek (Прятки) ===')
     size = input_int('Число мест для пряток (по умолчанию 10): ', 5) or 10
     rounds = input_int('Сколько раундов? (по умолчанию 2): ', 1) or 2
     score_player = 0
     score_ai = 0
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}: вы прячетесь, ИИ ищет.')
+        out(f'Раунд {r}/{rounds}: вы прячетесь, ИИ ищет.')
         hiding_spot = input_int(f'Выберите место для прятки 0..{size-1}: ', 0, size-1)
         if hiding_spot is None:
-            hiding_spot = random.randrange(size)
-            print(f'Вы случайно выбрали {hiding_spot}')
-        print('ИИ начинает искать...')
-        time.sleep(0.6)
+            hiding_spot = rng.randrange(size)
+            out(f'Вы случайно выбрали {hiding_spot}')
+        out('ИИ начинает искать...')
+        sleep(0.6)
         search_order = list(range(size))
-        random.shuffle(search_order)
+        rng.shuffle(search_order)
         found = False
         for i, spot in enumerate(search_order, start=1):
-            print(f'ИИ проверяет место {spot}...')
-            time.sleep(0.3)
+            out(f'ИИ проверяет место {spot}...')
+            sleep(0.3)
             if spot == hiding_spot:
-                print(f'ИИ нашёл вас через {i} попыток!')
+                out(f'ИИ нашёл вас через {i} попыток!')
                 score_ai += 1
                 found = True
                 break
         if not found:
-            print('ИИ не нашёл вас. Вы выиграли раунд.')
+            out('ИИ не нашёл вас. Вы выиграли раунд.')
             score_player += 1
         press_enter()
         clear()
-        print(f'Раунд {r}/{rounds}: теперь ИИ прячется, вы ищете.')
-        ai_spot = random.randrange(size)
+        out(f'Раунд {r}/{rounds}: теперь ИИ прячется, вы ищете.')
+        ai_spot = rng.randrange(size)
         attempts = size//2 + 1
         for a in range(1, attempts+1):
             guess = input_int(f'Попытка {a}/{attempts}: ваш вариант: ', 0, size-1)
             if guess is None:
-                print(f'Вы пасуете. ИИ был в {ai_spot}.')
+                out(f'Вы пасуете. ИИ был в {ai_spot}.')
                 score_ai += 1
                 break
             if guess == ai_spot:
-                print('Вы нашли ИИ! Вы выиграли раунд.')
+                out('Вы нашли ИИ! Вы выиграли раунд.')
                 score_player += 1
                 break
             else:
-                print('Неправильно.')
+                out('Неправильно.')
         else:
-            print(f'Попытки кончились. ИИ выиграл раунд. Был в {ai_spot}.')
+            out(f'Попытки кончились. ИИ выиграл раунд. Был в {ai_spot}.')
             score_ai += 1
         press_enter()
     clear()
-    print('Итог:')
-    print(f'Ваши очки: {score_player}, ИИ: {score_ai}')
+    out('Итог:')
+    out(f'Ваши очки: {score_player}, ИИ: {score_ai}')
     if score_player > score_ai:
-        print('Вы победили!')
+        out('Вы победили!')
     elif score_player < score_ai:
-        print('ИИ победил.')
+        out('ИИ победил.')
     else:
-        print('Ничья.')
-    press_enter()
-
-# -------------------------
-# Game 6: Snakes and Ladders
-# -------------------------
-def snakes_and_ladders():
-    clear()
-    print('=== Snakes and Ladders (Змеи и Лестницы) ===')
-    players_count = input_int('Число игроков (1-4): ', 1, 4) or 2
-    names = []
-    for i in range(players_count):
-        n = input(f'Имя игрока {i+1} (Enter для "Player{i+1}"): ').strip() or f'Player{i+1}'
-        names.append(n)
-    while len(names) < 2:
-        names.append(f'CPU{len(names)+1}')
-    size = 100
-    ladders = {2:38,7:14,8:31,15:26,28:84,21:42,36:44,51:67,71:91,78:98,87:94}
-    snakes = {16:6,46:25,49:11,62:19,64:60,74:53,89:68,92:88,95:75,99:80}
-    positions = {name:0 for name in names}
-    turn = 0
-    def roll(): return random.randint(1,6)
-    while True:
-        clear()
-        print('Позиции:')
-        for n in names:
-            print(f'{n}: {positions[n]}', end='  ')
-        print('\n')
-        cur = names[turn % len(names)]
-        print(f'Ход игрока: {cur}')
-        if cur.startswith('CPU'):
-            time.sleep(0.6)
-            r = roll()
-            print(f'CPU бросил {r}')
-        else:
-            _ = input('Нажмите Enter чтоб бросить кубик...')
-            r = roll()
-            print(f'Вы бросили {r}')
-        positions[cur] += r
-        if positions[cur] > size:
-            positions[cur] = size - (positions[cur] - size)
-        if positions[cur] in ladders:
-            print(f'Лестница! {positions[cur]} -> {ladders[positions[cur]]}')
-            positions[cur] = ladders[positions[cur]]
-        elif positions[cur] in snakes:
-            print(f'Змея! {positions[cur]} -> {snakes[positions[cur]]}')
-            positions[cur] = snakes[positions[cur]]
-        if positions[cur] == size:
-            print(f'\n{cur} достиг клетки {size} и победил! Поздравляем!')
-            break
-        turn += 1
-        time.sleep(0.8)
+        out('Ничья.')
     press_enter()
 
 # -------------------------
@@ -405,34 +656,34 @@ def snakes_and_ladders():
 # -------------------------
 def hide_chase_virus():
     clear()
-    print('=== Прятки-догонялки ВИРУС ===')
+    out('=== Прятки-догонялки ВИРУС ===')
     places = input_int('Число мест (по умолчанию 12): ', 5) or 12
     players = ['You'] + [f'NPC{i}' for i in range(1,4)]
     infected = set()
     # initial infected NPC
-    infected.add(random.choice(players[1:]))
-    hidden_spots = {p: random.randrange(places) for p in players}
-    print(f'Игроки: {", ".join(players)}')
-    print(f'Первоначально заражён: {", ".join(infected)}')
+    infected.add(rng.choice(players[1:]))
+    hidden_spots = {p: rng.randrange(places) for p in players}
+    out(f'Игроки: {", ".join(players)}')
+    out(f'Первоначально заражён: {", ".join(infected)}')
     rounds = input_int('Сколько раундов? (по умолчанию 3): ', 1) or 3
     score = {p:0 for p in players}
     for rnd in range(1, rounds+1):
         clear()
-        print(f'Раунд {rnd}/{rounds}')
+        out(f'Раунд {rnd}/{rounds}')
         # players choose spots (you choose)
         spot_you = input_int(f'Выберите место 0..{places-1} (Enter для случайного): ', 0, places-1)
         if spot_you is None:
-            spot_you = random.randrange(places)
+            spot_you = rng.randrange(places)
         hidden_spots['You'] = spot_you
         for npc in players[1:]:
-            hidden_spots[npc] = random.randrange(places)
-        print('ИИ ищет по очереди. Инфицированные при обнаружении заражают.')
+            hidden_spots[npc] = rng.randrange(places)
+        out('ИИ ищет по очереди. Инфицированные при обнаружении заражают.')
         order = players[1:] + ['You']  # NPCs search first
         found_order = []
         for seeker in order:
             # seeker searches sequentially over spots
             search = list(range(places))
-            random.shuffle(search)
+            rng.shuffle(search)
             for idx, s in enumerate(search, start=1):
                 # check each target
                 targets = [p for p in players if hidden_spots[p] == s and p != seeker]
@@ -446,7 +697,7 @@ def hide_chase_virus():
                         if t in infected:
                             infected.add(seeker)
                     break
-            time.sleep(0.15)
+            sleep(0.15)
         # scoring: survivors (non-infected) get points, infected lose points
         for p in players:
             if p in infected:
@@ -454,20 +705,20 @@ def hide_chase_virus():
             else:
                 score[p] += 1
         clear()
-        print('Результаты раунда:')
-        print('Найденные пары (seeker -> found):')
+        out('Результаты раунда:')
+        out('Найденные пары (seeker -> found):')
         for s,f in found_order:
-            print(f'  {s} -> {f}')
-        print('Заражённые сейчас:', ', '.join(sorted(infected)))
-        print('Счёт:')
+            out(f'  {s} -> {f}')
+        out('Заражённые сейчас:', ', '.join(sorted(infected)))
+        out('Счёт:')
         for p in players:
-            print(f'  {p}: {score[p]}')
+            out(f'  {p}: {score[p]}')
         press_enter()
     clear()
-    print('Итоговая инфекция и счёт:')
-    print('Заражённые:', ', '.join(sorted(infected)))
+    out('Итоговая инфекция и счёт:')
+    out('Заражённые:', ', '.join(sorted(infected)))
     for p in players:
-        print(f'  {p}: {score[p]}')
+        out(f'  {p}: {score[p]}')
     press_enter()
 
 # -------------------------
@@ -476,36 +727,36 @@ def hide_chase_virus():
 # -------------------------
 def bunker():
     clear()
-    print('=== Бункер ===')
+    out('=== Бункер ===')
     rounds = input_int('Сколько волн? (по умолчанию 6): ', 1) or 6
     resources = {'food': 10, 'water': 10, 'ammo': 5, 'morale': 5}
     survivors = 5
-    print('Вы — управляющий бункером. Распределяйте ресурсы каждый раунд.')
+    out('Вы — управляющий бункером. Распределяйте ресурсы каждый раунд.')
     press_enter()
     for rnd in range(1, rounds+1):
         clear()
-        print(f'Волна {rnd}/{rounds}')
-        print('Состояние бункера:')
+        out(f'Волна {rnd}/{rounds}')
+        out('Состояние бункера:')
         for k,v in resources.items():
-            print(f'  {k}: {v}')
-        print(f'Выживших: {survivors}')
+            out(f'  {k}: {v}')
+        out(f'Выживших: {survivors}')
         # random event affects needs
-        event = random.choice(['raiders','sickness','storm','quiet'])
-        print(f'Событие в этот раунд: {event}')
+        event = rng.choice(['raiders','sickness','storm','quiet'])
+        out(f'Событие в этот раунд: {event}')
         # player allocates small amounts to mitigate
-        print('Распределите 3 единицы ресурсов на приоритеты: food, water, ammo, morale')
+        out('Распределите 3 единицы ресурсов на приоритеты: food, water, ammo, morale')
         alloc = {'food':0,'water':0,'ammo':0,'morale':0}
         points = 3
         while points > 0:
-            print(f'Осталось очков: {points}')
-            choice = input('Куда потратить (food/water/ammo/morale or Enter сброс): ').strip().lower()
+            out(f'Осталось очков: {points}')
+            choice = ask('Куда потратить (food/water/ammo/morale or Enter сброс): ').strip().lower()
             if choice == '':
                 break
             if choice in alloc:
                 alloc[choice] += 1
                 points -= 1
             else:
-                print('Неверно.')
+                out('Неверно.')
         # apply allocations and baseline consumption
         resources['food'] = max(0, resources['food'] + alloc['food'] - survivors//2)
         resources['water'] = max(0, resources['water'] + alloc['water'] - survivors//2)
@@ -514,43 +765,43 @@ def bunker():
         # event resolution
         if event == 'raiders':
             if resources['ammo'] >= 1:
-                print('Вы отбили рейдеров.')
+                out('Вы отбили рейдеров.')
                 resources['ammo'] = max(0, resources['ammo'] - 1)
             else:
-                lost = random.randint(1,3)
+                lost = rng.randint(1,3)
                 survivors = max(0, survivors - lost)
-                print(f'Рейдеры нанесли потери: -{lost} выживших.')
+                out(f'Рейдеры нанесли потери: -{lost} выживших.')
         elif event == 'sickness':
             if resources['water'] >= survivors//3:
-                print('С болезнью справились.')
+                out('С болезнью справились.')
                 resources['water'] = max(0, resources['water'] - 1)
             else:
-                lost = random.randint(0,2)
+                lost = rng.randint(0,2)
                 survivors = max(0, survivors - lost)
-                print(f'Болезнь унесла: -{lost} выживших.')
+                out(f'Болезнь унесла: -{lost} выживших.')
         elif event == 'storm':
-            print('Шторм повредил запасы.')
+            out('Шторм повредил запасы.')
             resources['food'] = max(0, resources['food'] - 1)
             resources['water'] = max(0, resources['water'] - 1)
             resources['morale'] = max(0, resources['morale'] - 1)
         else:
-            print('Тихая ночь. Ничего особенного.')
+            out('Тихая ночь. Ничего особенного.')
         # morale check: if morale low, survivors may leave
         if resources['morale'] <= 0 and survivors > 0:
-            leave = random.choice([0,1])
+            leave = rng.choice([0,1])
             if leave:
                 survivors -= 1
-                print('Один выживший покинул бункер из-за низкого морального духа.')
-        time.sleep(1)
+                out('Один выживший покинул бункер из-за низкого морального духа.')
+        sleep(1)
         if survivors <= 0:
-            print('Все выжившие потеряны. Конец игры.')
+            out('Все выжившие потеряны. Конец игры.')
             break
         press_enter()
     clear()
-    print('Конец подсчёта. Финальное состояние:')
-    print(f'Выживших: {survivors}')
+    out('Конец подсчёта. Финальное состояние:')
+    out(f'Выживших: {survivors}')
     for k,v in resources.items():
-        print(f'  {k}: {v}')
+        out(f'  {k}: {v}')
     press_enter()
 
 # -------------------------
@@ -559,7 +810,7 @@ def bunker():
 # -------------------------
 def chase_with_ball():
     clear()
-    print('=== Догонялки с мячом ===')
+    out('=== Догонялки с мячом ===')
     length = input_int('Длина поля (по умолчанию 20): ', 8) or 20
     player = 0
     chaser = -4
@@ -567,8 +818,8 @@ def chase_with_ball():
     npc_pos = {'You':player, 'Chaser':chaser}
     max_turns = input_int('Максимум ходов (по умолчанию 150): ', 10) or 150
     turn = 0
-    print('Правила: у вас мяч (B). Вы можете бежать (b), передать (p) или замедлиться (s).')
-    print('Если преследователь догонит вас и утащит мяч, вы проиграли.')
+    out('Правила: у вас мяч (B). Вы можете бежать (b), передать (p) или замедлиться (s).')
+    out('Если преследователь догонит вас и утащит мяч, вы проиграли.')
     press_enter()
     while turn < max_turns:
         turn += 1
@@ -580,67 +831,67 @@ def chase_with_ball():
             field[chaser] = 'C'
         if 0 <= player < length:
             field[player] = 'P' if ball_holder!='You' else 'B'  # show B if you have ball
-        print(''.join(field))
-        action = input('Ваш ход: (b) бежать, (p) передать (риск), (s) замедлиться, (q) выйти: ').strip().lower()
+        out(''.join(field))
+        action = ask('Ваш ход: (b) бежать, (p) передать (риск), (s) замедлиться, (q) выйти: ').strip().lower()
         if action == 'q' or action == '':
-            print('Выход.')
+            out('Выход.')
             break
         if action == 'b':
-            step = random.randint(1,3)
+            step = rng.randint(1,3)
             player += step
-            print(f'Вы пробежали {step} клеток.')
+            out(f'Вы пробежали {step} клеток.')
         elif action == 's':
-            step = random.randint(0,1)
+            step = rng.randint(0,1)
             player += step
-            print(f'Вы медленно продвинулись на {step}.')
+            out(f'Вы медленно продвинулись на {step}.')
         elif action == 'p':
             # pass: 50% success to pass forward 2..4 cells to a "ally" (imaginary), else drop and chaser gets ball
-            success = random.random() < 0.6
+            success = rng.random() < 0.6
             if success:
-                advance = random.randint(2,4)
+                advance = rng.randint(2,4)
                 player += advance
-                print(f'Передача успешна, вы продвинулись на {advance} (символический приём).')
+                out(f'Передача успешна, вы продвинулись на {advance} (символический приём).')
             else:
-                print('Передача неудачна! Мяч у преследователя.')
+                out('Передача неудачна! Мяч у преследователя.')
                 ball_holder = 'Chaser'
         # chaser moves towards player with chance to tackle if close
         dist = player - chaser
         if ball_holder == 'Chaser':
             # chaser carrying ball tries to return you backwards (simulate)
-            chaser += random.randint(1,3)
+            chaser += rng.randint(1,3)
         else:
             if dist <= 2:
-                chaser += random.randint(1,3)
+                chaser += rng.randint(1,3)
             else:
-                chaser += random.randint(1,2)
+                chaser += rng.randint(1,2)
         # if chaser catches player
         if chaser >= player:
             # if chaser catches and you had ball, ball transfers
             if ball_holder == 'You':
                 ball_holder = 'Chaser'
-                print('Преследователь догнал вас и отобрал мяч!')
+                out('Преследователь догнал вас и отобрал мяч!')
             else:
-                print('Преследователь догнал вас!')
+                out('Преследователь догнал вас!')
             press_enter()
             clear()
-            print('Вы проиграли. Попробуйте ещё раз.')
+            out('Вы проиграли. Попробуйте ещё раз.')
             break
         # if player reaches end with ball
         if player >= length-1 and ball_holder == 'You':
             clear()
-            print('Вы добежали до зоны и забили/добились цели с мячом. Победа!')
+            out('Вы добежали до зоны и забили/добились цели с мячом. Победа!')
             break
         # chaser may drop ball randomly
-        if ball_holder == 'Chaser' and random.random() < 0.3:
-            print('Преследователь уронил мяч. Вы можете подобрать его!')
+        if ball_holder == 'Chaser' and rng.random() < 0.3:
+            out('Преследователь уронил мяч. Вы можете подобрать его!')
             if abs(player - chaser) <= 2:
                 ball_holder = 'You'
-                print('Вы подобрали мяч!')
+                out('Вы подобрали мяч!')
         player = min(player, length-1)
         chaser = min(chaser, length-1)
-        time.sleep(0.6)
+        sleep(0.6)
     else:
-        print('Максимум ходов достигнут — ничья.')
+        out('Максимум ходов достигнут — ничья.')
     press_enter()
 
 # -------------------------
@@ -649,59 +900,59 @@ def chase_with_ball():
 # -------------------------
 def survival_game():
     clear()
-    print('=== Выживание ===')
+    out('=== Выживание ===')
     days = input_int('Сколько дней вы хотите выживать? (по умолчанию 7): ', 1) or 7
     hunger = 0   # 0 good, higher bad
     fatigue = 0
     health = 10
     supplies = {'food':5, 'wood':3, 'water':5}
     day = 0
-    print('Цель: пройти заданное число дней, управляя запасами и состоянием.')
+    out('Цель: пройти заданное число дней, управляя запасами и состоянием.')
     press_enter()
     while day < days and health > 0:
         day += 1
         clear()
-        print(f'День {day}/{days}')
-        print(f'Здоровье: {health}, Голод: {hunger}, Усталость: {fatigue}')
-        print('Запасы:', supplies)
-        action = input('Действие на день: (s) собирать, (r) отдыхать, (h) охотиться, (q) выйти: ').strip().lower()
+        out(f'День {day}/{days}')
+        out(f'Здоровье: {health}, Голод: {hunger}, Усталость: {fatigue}')
+        out('Запасы:', supplies)
+        action = ask('Действие на день: (s) собирать, (r) отдыхать, (h) охотиться, (q) выйти: ').strip().lower()
         if action == 'q' or action == '':
-            print('Вы сдались. Выход из игры.')
+            out('Вы сдались. Выход из игры.')
             break
         if action == 's':
             # scavenge: small chance for food/wood/water, risk of injury
-            food_found = random.randint(0,2)
-            wood_found = random.randint(0,2)
-            water_found = random.randint(0,1)
+            food_found = rng.randint(0,2)
+            wood_found = rng.randint(0,2)
+            water_found = rng.randint(0,1)
             supplies['food'] += food_found
             supplies['wood'] += wood_found
             supplies['water'] += water_found
-            print(f'Вы нашли: food+{food_found}, wood+{wood_found}, water+{water_found}')
-            if random.random() < 0.15:
-                injury = random.randint(1,3)
+            out(f'Вы нашли: food+{food_found}, wood+{wood_found}, water+{water_found}')
+            if rng.random() < 0.15:
+                injury = rng.randint(1,3)
                 health -= injury
-                print(f'Вы поранились: -{injury} здоровья.')
+                out(f'Вы поранились: -{injury} здоровья.')
             hunger += 1
             fatigue += 1
         elif action == 'r':
             # rest: recover fatigue and small health
             fatigue = max(0, fatigue-2)
             health = min(10, health+1)
-            print('Отдых помог: усталость -2, здоровье +1')
+            out('Отдых помог: усталость -2, здоровье +1')
             hunger += 1
         elif action == 'h':
             # hunt: chance for more food, risk higher injury
-            success = random.random() < 0.65
+            success = rng.random() < 0.65
             if success:
-                gained = random.randint(1,4)
+                gained = rng.randint(1,4)
                 supplies['food'] += gained
-                print(f'Успешная охота: food+{gained}')
+                out(f'Успешная охота: food+{gained}')
             else:
-                print('Охота не удалась.')
-            if random.random() < 0.2:
-                injury = random.randint(1,4)
+                out('Охота не удалась.')
+            if rng.random() < 0.2:
+                injury = rng.randint(1,4)
                 health -= injury
-                print(f'Вы поранились: -{injury} здоровья.')
+                out(f'Вы поранились: -{injury} здоровья.')
             hunger += 1
             fatigue += 2
         # consume daily
@@ -713,69 +964,69 @@ def survival_game():
             # lack of vital resources increases hunger and health loss
             hunger += 2
             health -= 1
-            print('Недостаточно еды/воды: здоровье снижается.')
+            out('Недостаточно еды/воды: здоровье снижается.')
         # if hunger too high, health drops
         if hunger >= 5:
             health -= 1
-            print('Сильный голод: здоровье -1')
+            out('Сильный голод: здоровье -1')
         # random threat (wild animal, raider)
-        if random.random() < 0.12:
-            threat = random.choice(['wolf','raiders','storm'])
+        if rng.random() < 0.12:
+            threat = rng.choice(['wolf','raiders','storm'])
             if threat == 'wolf':
-                print('Волк напал!')
-                if supplies['wood'] >= 1 and random.random() < 0.5:
+                out('Волк напал!')
+                if supplies['wood'] >= 1 and rng.random() < 0.5:
                     supplies['wood'] -= 1
-                    print('Вы отогнали волка, потеряв немного дров.')
+                    out('Вы отогнали волка, потеряв немного дров.')
                 else:
-                    dmg = random.randint(1,3)
+                    dmg = rng.randint(1,3)
                     health -= dmg
-                    print(f'Волк нанёс урон: -{dmg} здоровья.')
+                    out(f'Волк нанёс урон: -{dmg} здоровья.')
             elif threat == 'raiders':
-                print('Отряд рейдеров напал!')
+                out('Отряд рейдеров напал!')
                 if supplies['ammo'] if 'ammo' in supplies else False:
                     pass
-                lost_food = min(supplies['food'], random.randint(0,2))
+                lost_food = min(supplies['food'], rng.randint(0,2))
                 supplies['food'] -= lost_food
                 health -= 0
-                print(f'Рейдеры украли food-{lost_food}.')
+                out(f'Рейдеры украли food-{lost_food}.')
             else:
-                print('Шторм. Усложнение дня: усталость +1.')
+                out('Шторм. Усложнение дня: усталость +1.')
                 fatigue += 1
         # fatigue effects
         if fatigue >= 6:
             health -= 1
-            print('Крайняя усталость: здоровье -1')
-        print(f'Итог дня: здоровье={health}, голод={hunger}, усталость={fatigue}, запасы={supplies}')
-        time.sleep(0.8)
+            out('Крайняя усталость: здоровье -1')
+        out(f'Итог дня: здоровье={health}, голод={hunger}, усталость={fatigue}, запасы={supplies}')
+        sleep(0.8)
         if health <= 0:
-            print('Вы не выжили...')
+            out('Вы не выжили...')
             break
         press_enter()
     clear()
     if health > 0 and day >= days:
-        print(f'Поздравляем! Вы выжили {days} дней.')
+        out(f'Поздравляем! Вы выжили {days} дней.')
     else:
-        print('К сожалению, вы не выжили.')
+        out('К сожалению, вы не выжили.')
     press_enter()
 # -----------------------
 # Game: Рельсы (Rails) - логическая головоломка по переключению стрелок
 # -----------------------
 def rails_game():
     clear()
-    print('=== Рельсы ===')
-    print('Вам дано рельсовое разветвление: простая строка станций с переключателями.')
+    out('=== Рельсы ===')
+    out('Вам дано рельсовое разветвление: простая строка станций с переключателями.')
     n = input_int('Длина секции (по умолчанию 8): ', 4) or 8
-    switches = [random.choice([0,1]) for _ in range(n)]  # 0 -> left, 1 -> right
-    target_pos = random.randrange(n)
+    switches = [rng.choice([0,1]) for _ in range(n)]  # 0 -> left, 1 -> right
+    target_pos = rng.randrange(n)
     start = 0
-    print('Цель: провести поезд от старта до целевой позиции, управляя переключателями.')
-    print('Нумерация позиций 0..', n-1)
+    out('Цель: провести поезд от старта до целевой позиции, управляя переключателями.')
+    out('Нумерация позиций 0..', n-1)
     press_enter()
     while True:
         clear()
-        print('Switches:', ' '.join(str(s) for s in switches))
-        print('Start at 0, target at', target_pos)
-        cmd = input('Команды: t i - переключить i; r - запустить поезд; q - выйти\n> ').strip().lower()
+        out('Switches:', ' '.join(str(s) for s in switches))
+        out('Start at 0, target at', target_pos)
+        cmd = ask('Команды: t i - переключить i; r - запустить поезд; q - выйти\n> ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd == 'r':
@@ -793,9 +1044,9 @@ def rails_game():
                 if pos == target_pos:
                     break
             if pos == target_pos:
-                print('Поезд прибыл в цель! Маршрут:', visited)
+                out('Поезд прибыл в цель! Маршрут:', visited)
             else:
-                print('Поезд сошёл с маршрута или зациклился. Маршрут:', visited)
+                out('Поезд сошёл с маршрута или зациклился. Маршрут:', visited)
             press_enter()
             continue
         parts = cmd.split()
@@ -804,36 +1055,36 @@ def rails_game():
                 i = int(parts[1])
                 if 0 <= i < n:
                     switches[i] = 1 - switches[i]
-                    print('Переключено.')
+                    out('Переключено.')
                 else:
-                    print('Индекс вне диапазона.')
+                    out('Индекс вне диапазона.')
             except:
-                print('Неверный индекс.')
-            time.sleep(0.5)
+                out('Неверный индекс.')
+            sleep(0.5)
             continue
-        print('Неверная команда.')
-        time.sleep(0.5)
+        out('Неверная команда.')
+        sleep(0.5)
 
 # -----------------------
 # Game: Гонки (Racing) - текстовая гонка с управлением ускорением/торможением
 # -----------------------
 def racing_game():
     clear()
-    print('=== Гонки ===')
+    out('=== Гонки ===')
     length = input_int('Длина трассы (по умолчанию 50): ', 20) or 50
     player_pos = 0
     players = {'You': player_pos, 'Rival': -3}
     speed = {'You':0, 'Rival':0}
     max_turns = input_int('Макс ходов (по умолчанию 200): ', 10) or 200
     turn = 0
-    print('Вы управляете скоростью: a - ускориться, d - притормозить, n - нейтрально.')
+    out('Вы управляете скоростью: a - ускориться, d - притормозить, n - нейтрально.')
     press_enter()
     while turn < max_turns:
         turn += 1
         clear()
-        print(f'Ход {turn}')
-        print('Позиции: You:', players['You'], 'Rival:', players['Rival'])
-        action = input('Ваш ход (a/d/n, q выйти): ').strip().lower()
+        out(f'Ход {turn}')
+        out('Позиции: You:', players['You'], 'Rival:', players['Rival'])
+        action = ask('Ваш ход (a/d/n, q выйти): ').strip().lower()
         if action == 'q' or action == '':
             break
         if action == 'a':
@@ -843,27 +1094,27 @@ def racing_game():
         elif action == 'n':
             pass
         # rival AI: random small accel or maintain
-        if random.random() < 0.6:
-            speed['Rival'] += random.choice((0,1))
+        if rng.random() < 0.6:
+            speed['Rival'] += rng.choice((0,1))
         else:
             speed['Rival'] = max(0, speed['Rival'] - 1)
         # apply speed with chance of slip if too fast
         for p in players:
             sp = speed[p]
-            move = sp + random.randint(0,1) - (1 if sp>5 and random.random()<0.2 else 0)
+            move = sp + rng.randint(0,1) - (1 if sp>5 and rng.random()<0.2 else 0)
             players[p] += move
         # track boundaries
         if players['You'] >= length:
             clear()
-            print('Вы финишировали первыми! Победа!')
+            out('Вы финишировали первыми! Победа!')
             break
         if players['Rival'] >= length:
             clear()
-            print('Соперник финишировал первым. Вы проиграли.')
+            out('Соперник финишировал первым. Вы проиграли.')
             break
-        time.sleep(0.3)
+        sleep(0.3)
     else:
-        print('Время вышло — ничья.')
+        out('Время вышло — ничья.')
     press_enter()
 
 # -----------------------
@@ -871,65 +1122,65 @@ def racing_game():
 # -----------------------
 def dodgeball():
     clear()
-    print('=== Вышибалы ===')
+    out('=== Вышибалы ===')
     team_you = ['You'] + [f'P{i}' for i in range(1,3)]
     team_enemy = [f'E{i}' for i in range(1,4)]
     hits = {p:0 for p in team_you+team_enemy}
-    print('Цель: вывести всех противников из игры. Каждому игроку 2 жизни.')
+    out('Цель: вывести всех противников из игры. Каждому игроку 2 жизни.')
     press_enter()
     round_no = 0
     while True:
         round_no += 1
         clear()
-        print(f'Раунд {round_no}')
-        print('Ваши:', team_you)
-        print('Враги:', team_enemy)
+        out(f'Раунд {round_no}')
+        out('Ваши:', team_you)
+        out('Враги:', team_enemy)
         # You choose target
         if not team_enemy:
-            print('Все враги выведены — вы победили!')
+            out('Все враги выведены — вы победили!')
             break
         if not team_you:
-            print('Ваша команда выбита — вы проиграли.')
+            out('Ваша команда выбита — вы проиграли.')
             break
         target = None
-        print('Ваша очередь. Выберите цель из:', ', '.join(team_enemy))
-        t = input('Цель (имя или Enter случайно): ').strip()
+        out('Ваша очередь. Выберите цель из:', ', '.join(team_enemy))
+        t = ask('Цель (имя или Enter случайно): ').strip()
         if t == '':
-            target = random.choice(team_enemy)
+            target = rng.choice(team_enemy)
         elif t in team_enemy:
             target = t
         else:
-            print('Неверная цель, выбирается случайная.')
-            target = random.choice(team_enemy)
+            out('Неверная цель, выбирается случайная.')
+            target = rng.choice(team_enemy)
         # throw success depends on accuracy and dodge
-        throw_success = random.random() < 0.65
-        dodge = random.random() < 0.35
+        throw_success = rng.random() < 0.65
+        dodge = rng.random() < 0.35
         if throw_success and not dodge:
             hits[target] += 1
-            print(f'Вы попали по {target}! Урон #{hits[target]}.')
+            out(f'Вы попали по {target}! Урон #{hits[target]}.')
             if hits[target] >= 2:
                 team_enemy.remove(target)
-                print(f'{target} выведен из игры!')
+                out(f'{target} выведен из игры!')
         else:
-            print('Промах или уклонение.')
+            out('Промах или уклонение.')
         # enemies act: each enemy targets random team member
         for e in list(team_enemy):
             if not team_you:
                 break
-            tgt = random.choice(team_you)
-            succ = random.random() < 0.55
-            if succ and random.random() > 0.3:
+            tgt = rng.choice(team_you)
+            succ = rng.random() < 0.55
+            if succ and rng.random() > 0.3:
                 hits[tgt] += 1
-                print(f'{e} попал по {tgt} (урон #{hits[tgt]})')
+                out(f'{e} попал по {tgt} (урон #{hits[tgt]})')
                 if hits[tgt] >= 2:
                     if tgt == 'You':
                         team_you.remove('You')
-                        print('Вы выведены из игры!')
+                        out('Вы выведены из игры!')
                     else:
                         team_you.remove(tgt)
-                        print(f'{tgt} выбыл.')
+                        out(f'{tgt} выбыл.')
             else:
-                print(f'{e} промахнулся по {tgt}.')
+                out(f'{e} промахнулся по {tgt}.')
         press_enter()
 
 # -----------------------
@@ -937,19 +1188,20 @@ def dodgeball():
 # -----------------------
 def fog_game():
     clear()
-    print('=== Туман ===')
+    out('=== Туман ===')
     size = input_int('Размер поля (по умолчанию 8): ', 4) or 8
     player = [0, 0]
     goal = [size-1, size-1]
-    obstacles = {(random.randrange(size), random.randrange(size)) for _ in range(size)}
+    obstacles = {(rng.randrange(size), rng.randrange(size)) for _ in range(size)}
     if (0,0) in obstacles: obstacles.remove((0,0))
     if (goal[0],goal[1]) in obstacles: obstacles.remove((goal[0],goal[1]))
     view = 1  # visibility radius
-    print('Двигайтесь к цели в правом нижнем углу. Видимость ограничена.')
+    out('Двигайтесь к цели в правом нижнем углу. Видимость ограничена.')
     press_enter()
     while True:
         clear()
         # render small area around player
+        lines = []
         for r in range(size):
             line = ''
             for c in range(size):
@@ -964,11 +1216,12 @@ def fog_game():
                         line += ' .'
                 else:
                     line += ' ?'
-            print(line)
+            lines.append(line)
+        out('\n'.join(lines))
         if player == goal:
-            print('Вы достигли цели. Победа!')
+            out('Вы достигли цели. Победа!')
             break
-        cmd = input('Ход (w/a/s/d), q - выйти: ').strip().lower()
+        cmd = ask('Ход (w/a/s/d), q - выйти: ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd == 'w' and player[0]>0: player[0]-=1
@@ -976,14 +1229,14 @@ def fog_game():
         if cmd == 'a' and player[1]>0: player[1]-=1
         if cmd == 'd' and player[1]<size-1: player[1]+=1
         # random fog event: visibility change
-        if random.random() < 0.12:
-            if random.random() < 0.5:
+        if rng.random() < 0.12:
+            if rng.random() < 0.5:
                 view = max(0, view-1)
-                print('Туман усилился. Видимость уменьшилась.')
+                out('Туман усилился. Видимость уменьшилась.')
             else:
                 view = min(size, view+1)
-                print('Туман рассеялся. Видимость выросла.')
-            time.sleep(0.6)
+                out('Туман рассеялся. Видимость выросла.')
+            sleep(0.6)
     press_enter()
 
 # -----------------------
@@ -991,11 +1244,11 @@ def fog_game():
 # -----------------------
 def raid_game():
     clear()
-    print('=== Рейд ===')
+    out('=== Рейд ===')
     team = ['Alpha', 'Bravo', 'Charlie']
     enemy_strength = input_int('Сила обороны (1-10, по умолчанию 5): ', 1, 10) or 5
-    print('Вы командир рейда. Выберите стратегию: stealth (скрытно), frontal (в лоб), diversion (отвлекающий).')
-    strat = input('Стратегия (stealth/frontal/diversion): ').strip().lower()
+    out('Вы командир рейда. Выберите стратегию: stealth (скрытно), frontal (в лоб), diversion (отвлекающий).')
+    strat = ask('Стратегия (stealth/frontal/diversion): ').strip().lower()
     success_chance = 0.5
     if strat == 'stealth':
         success_chance += 0.15
@@ -1005,13 +1258,13 @@ def raid_game():
         success_chance += 0.05
     # adjust by enemy_strength
     success_chance -= (enemy_strength-5)*0.05
-    result = random.random() < success_chance
+    result = rng.random() < success_chance
     clear()
     if result:
-        print('Рейд успешен! Цели достигнуты.')
+        out('Рейд успешен! Цели достигнуты.')
     else:
-        losses = random.randint(0, len(team))
-        print(f'Рейд провалился. Потери команды: {losses}.')
+        losses = rng.randint(0, len(team))
+        out(f'Рейд провалился. Потери команды: {losses}.')
     press_enter()
 
 # -----------------------
@@ -1019,115 +1272,59 @@ def raid_game():
 # -----------------------
 def thermometer_game():
     clear()
-    print('=== Термометр ===')
-    secret = random.randint(1,100)
+    out('=== Термометр ===')
+    secret = rng.randint(1,100)
     prev_diff = None
     attempts = 0
     while True:
         guess = input_int('Угадайте число 1..100 (Enter выход): ', 1, 100)
         if guess is None:
-            print('Вы вышли. Было:', secret)
+            out('Вы вышли. Было:', secret)
             break
         attempts += 1
         diff = abs(secret - guess)
         if diff == 0:
-            print(f'Угадали за {attempts} попыток!')
+            out(f'Угадали за {attempts} попыток!')
             break
         if prev_diff is None:
-            print('Теплее' if diff <= 20 else 'Холодно')
+            out('Теплее' if diff <= 20 else 'Холодно')
         else:
             if diff < prev_diff:
-                print('Теплее')
+                out('Теплее')
             elif diff > prev_diff:
-                print('Холоднее')
+                out('Холоднее')
             else:
-                print('Так же')
+                out('Так же')
         prev_diff = diff
     press_enter()
 
-# -----------------------
-# Game: Змейка (Snake) - простейшая консольная змейка (без curses)
-# Note: movement is turn-based; player inputs direction each step.
-# -----------------------
-def snake_game():
-    clear()
-    print('=== Змейка ===')
-    size = input_int('Размер поля (по умолчанию 10): ', 5) or 10
-    snake = [(size//2, size//2)]
-    direction = (0,1)  # starts moving right
-    food = (random.randrange(size), random.randrange(size))
-    score = 0
-    print('Управление: w/a/s/d шаг за шагом. Цель: съесть как можно больше еды.')
-    press_enter()
-    while True:
-        clear()
-        grid = [['.' for _ in range(size)] for __ in range(size)]
-        for x,y in snake:
-            grid[x][y] = 'S'
-        fx,fy = food
-        grid[fx][fy] = 'F'
-        for r in range(size):
-            print(' '.join(grid[r]))
-        print('Score:', score)
-        cmd = input('Ввод (w/a/s/d), q - выход: ').strip().lower()
-        if cmd == 'q' or cmd == '':
-            break
-        if cmd == 'w': direction = (-1,0)
-        if cmd == 's': direction = (1,0)
-        if cmd == 'a': direction = (0,-1)
-        if cmd == 'd': direction = (0,1)
-        head = snake[0]
-        new_head = (head[0]+direction[0], head[1]+direction[1])
-        # check collisions
-        if not (0 <= new_head[0] < size and 0 <= new_head[1] < size) or new_head in snake:
-            clear()
-            print('Вы врезались. Игра окончена. Счёт:', score)
-            break
-        snake.insert(0, new_head)
-        if new_head == food:
-            score += 1
-            # spawn new food not on snake
-            attempts = 0
-            while True:
-                f = (random.randrange(size), random.randrange(size))
-                if f not in snake:
-                    food = f
-                    break
-                attempts += 1
-                if attempts > 100:
-                    # no space left
-                    break
-        else:
-            snake.pop()
-    press_enter()
-
 # -----------------------
 # Game: Решение поезда (Trolley Problem) - моральный выбор с последствиями
 # -----------------------
 def trolley_game():
     clear()
-    print('=== Решение поезда ===')
-    print('Вы — оператор стрелки. Поезд движется по рельсам. Вы можете переключить путь.')
-    scenario = random.choice([
+    out('=== Решение поезда ===')
+    out('Вы — оператор стрелки. Поезд движется по рельсам. Вы можете переключить путь.')
+    scenario = rng.choice([
         {'left':3, 'right':1},
         {'left':5, 'right':2},
         {'left':1, 'right':0},
         {'left':0, 'right':1},
     ])
-    print('На левой ветке находится', scenario['left'], 'человек(а).')
-    print('На правой ветке находится', scenario['right'], 'человек(а).')
-    choice = input('Переключить на правую ветку? (y/n): ').strip().lower()
+    out('На левой ветке находится', scenario['left'], 'человек(а).')
+    out('На правой ветке находится', scenario['right'], 'человек(а).')
+    choice = ask('Переключить на правую ветку? (y/n): ').strip().lower()
     if choice in ('y','yes','д','да'):
         killed = scenario['right']
         saved = scenario['left']
-        print('Вы переключили поезд. Умерло', killed, 'человек(а).')
+        out('Вы переключили поезд. Умерло', killed, 'человек(а).')
     else:
         killed = scenario['left']
         saved = scenario['right']
-        print('Вы ничего не сделали. Умерло', killed, 'человек(а).')
+        out('Вы ничего не сделали. Умерло', killed, 'человек(а).')
     # moral consequence: reputation measure randomly affected
-    rep = random.randint(-5,5) + (saved - killed)
-    print('Моральные последствия (символически): репутация', rep)
+    rep = rng.randint(-5,5) + (saved - killed)
+    out('Моральные последствия (символически): репутация', rep)
     press_enter()
 
 # -----------------------
@@ -1135,62 +1332,62 @@ def trolley_game():
 # -----------------------
 def living_car():
     clear()
-    print('=== Живой автомобиль ===')
+    out('=== Живой автомобиль ===')
     distance = input_int('Дистанция до цели (по умолчанию 30): ', 5) or 30
     fuel = input_int('Запас топлива (по умолчанию 10): ', 1) or 10
     integrity = 10  # здоровье машины
     position = 0
-    print('Каждый ход: drive (ехать), refuel (пополнить рискованно), repair (починить с шансом).')
+    out('Каждый ход: drive (ехать), refuel (пополнить рискованно), repair (починить с шансом).')
     press_enter()
     while position < distance and integrity > 0:
         clear()
-        print(f'Позиция: {position}/{distance}, топливо: {fuel}, прочность: {integrity}')
-        cmd = input('Действие (drive/refuel/repair/q): ').strip().lower()
+        out(f'Позиция: {position}/{distance}, топливо: {fuel}, прочность: {integrity}')
+        cmd = ask('Действие (drive/refuel/repair/q): ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd == 'drive':
             if fuel <= 0:
-                print('Нет топлива.')
+                out('Нет топлива.')
             else:
-                move = random.randint(2,5)
+                move = rng.randint(2,5)
                 position += move
                 fuel -= 1
                 # road hazard
-                if random.random() < 0.15:
-                    dmg = random.randint(1,3)
+                if rng.random() < 0.15:
+                    dmg = rng.randint(1,3)
                     integrity -= dmg
-                    print(f'Дорожная опасность повредила авто -{dmg} прочности.')
-                print(f'Вы проехали {move}.')
+                    out(f'Дорожная опасность повредила авто -{dmg} прочности.')
+                out(f'Вы проехали {move}.')
         elif cmd == 'refuel':
             # refuel risky: chance to gain 3 fuel, else lose integrity
-            if random.random() < 0.7:
+            if rng.random() < 0.7:
                 fuel += 3
-                print('Удачная дозаправка: +3 топлива.')
+                out('Удачная дозаправка: +3 топлива.')
             else:
-                dmg = random.randint(1,2)
+                dmg = rng.randint(1,2)
                 integrity -= dmg
-                print(f'Неудачная заправка: повреждение -{dmg}.')
+                out(f'Неудачная заправка: повреждение -{dmg}.')
         elif cmd == 'repair':
             # repair consumes a turn, small chance to restore integrity
-            if random.random() < 0.6:
-                heal = random.randint(1,3)
+            if rng.random() < 0.6:
+                heal = rng.randint(1,3)
                 integrity = min(10, integrity + heal)
-                print(f'Ремонт удался: +{heal} прочности.')
+                out(f'Ремонт удался: +{heal} прочности.')
             else:
-                print('Ремонт не удался.')
+                out('Ремонт не удался.')
         # random event: fuel leak
-        if random.random() < 0.08:
+        if rng.random() < 0.08:
             fuel_loss = 1
             fuel = max(0, fuel - fuel_loss)
-            print('Утечка топлива: -1.')
-        time.sleep(0.6)
+            out('Утечка топлива: -1.')
+        sleep(0.6)
     clear()
     if position >= distance and integrity > 0:
-        print('Вы доехали до цели. Машина жива. Победа!')
+        out('Вы доехали до цели. Машина жива. Победа!')
     elif integrity <= 0:
-        print('Машина вышла из строя. Проигрыш.')
+        out('Машина вышла из строя. Проигрыш.')
     else:
-        print('Игра окончена.')
+        out('Игра окончена.')
     press_enter()
 # -----------------------
 # 1) Живой автомобиль с глазами на лобовом стекле и ртом
@@ -1198,61 +1395,61 @@ def living_car():
 # -----------------------
 def living_car_with_face():
     clear()
-    print('=== Живой автомобиль с глазами на лобовом стекле и ртом ===')
+    out('=== Живой автомобиль с глазами на лобовом стекле и ртом ===')
     distance = input_int('Дистанция (по умолчанию 25): ', 5) or 25
     fuel = input_int('Топливо (по умолчанию 8): ', 1) or 8
     mood = 5  # 0..10
     pos = 0
-    print('Автомобиль "живой": его глаза моргают, рот реагирует на события.')
+    out('Автомобиль "живой": его глаза моргают, рот реагирует на события.')
     press_enter()
     while pos < distance and fuel > 0 and mood > 0:
         clear()
-        eyes = 'o o' if random.random() > 0.12 else '- -'  # blink sometimes
+        eyes = 'o o' if rng.random() > 0.12 else '- -'  # blink sometimes
         mouth = ':)' if mood >= 5 else ':('
-        print(f'Eyes: {eyes}   Mouth: {mouth}')
-        print(f'Позиция: {pos}/{distance}  Топливо: {fuel}  Настроение: {mood}/10')
-        action = input('Действие: drive/refuel/talk/exit: ').strip().lower()
+        out(f'Eyes: {eyes}   Mouth: {mouth}')
+        out(f'Позиция: {pos}/{distance}  Топливо: {fuel}  Настроение: {mood}/10')
+        action = ask('Действие: drive/refuel/talk/exit: ').strip().lower()
         if action == 'exit' or action == '':
             break
         if action == 'drive':
             if fuel <= 0:
-                print('Нет топлива!')
+                out('Нет топлива!')
             else:
-                step = random.randint(2,4)
+                step = rng.randint(2,4)
                 pos += step
                 fuel -= 1
-                mood = max(0, mood - (0 if random.random() < 0.8 else 1))
-                print(f'Едем: +{step}')
+                mood = max(0, mood - (0 if rng.random() < 0.8 else 1))
+                out(f'Едем: +{step}')
         elif action == 'refuel':
-            if random.random() < 0.75:
-                gained = random.randint(2,4)
+            if rng.random() < 0.75:
+                gained = rng.randint(2,4)
                 fuel += gained
                 mood = min(10, mood + 1)
-                print(f'Заправлено +{gained}. Машина довольна.')
+                out(f'Заправлено +{gained}. Машина довольна.')
             else:
                 mood -= 1
-                print('Плохая заправка — машина обиделась.')
+                out('Плохая заправка — машина обиделась.')
         elif action == 'talk':
-            phrase = input('Что сказать машине? ')
+            phrase = ask('Что сказать машине? ')
             # simple sentiment: short happy words increase mood
             if any(w in phrase.lower() for w in ('хорошо','молодец','добра','класс','спасибо')):
                 mood = min(10, mood + 2)
-                print('Машина улыбается!')
+                out('Машина улыбается!')
             else:
                 mood = min(10, mood + 0)
-                print('Машина издаёт: vroom.')
+                out('Машина издаёт: vroom.')
         # random events
-        if random.random() < 0.1:
-            print('Машина подмигнула вам!')
+        if rng.random() < 0.1:
+            out('Машина подмигнула вам!')
             mood = min(10, mood + 1)
-        time.sleep(0.6)
+        sleep(0.6)
     clear()
     if pos >= distance:
-        print('Вы доехали! Машина ликует: O O  :D')
+        out('Вы доехали! Машина ликует: O O  :D')
     elif fuel <= 0:
-        print('Вы встали без топлива. Машина грустит :(')
+        out('Вы встали без топлива. Машина грустит :(')
     elif mood <= 0:
-        print('Машина совсем расстроена и отказывается ехать.')
+        out('Машина совсем расстроена и отказывается ехать.')
     press_enter()
 
 # -----------------------
@@ -1260,34 +1457,34 @@ def living_car_with_face():
 # -----------------------
 def red_green_light():
     clear()
-    print('=== Красный свет - зелёный свет ===')
+    out('=== Красный свет - зелёный свет ===')
     distance = input_int('Расстояние до финиша (по умолчанию 15): ', 5) or 15
     pos = 0
     rounds = 0
-    print('В зелёный ходите (w), на красный нельзя двигаться — будете пойманы.')
+    out('В зелёный ходите (w), на красный нельзя двигаться — будете пойманы.')
     press_enter()
     while pos < distance:
         rounds += 1
-        green = random.random() < 0.6  # chance green
+        green = rng.random() < 0.6  # chance green
         state = 'ЗЕЛЁНЫЙ' if green else 'КРАСНЫЙ'
         clear()
-        print(f'Раунд {rounds}. Свет: {state}. Позиция: {pos}/{distance}')
-        cmd = input('Ввод (w - шаг, s - стоять, q - выход): ').strip().lower()
+        out(f'Раунд {rounds}. Свет: {state}. Позиция: {pos}/{distance}')
+        cmd = ask('Ввод (w - шаг, s - стоять, q - выход): ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd == 'w':
             if green:
                 pos += 1
-                print('Вы шагнули вперёд.')
+                out('Вы шагнули вперёд.')
             else:
-                print('Ой! На красный — вас заметили. Вы проиграли.')
+                out('Ой! На красный — вас заметили. Вы проиграли.')
                 press_enter()
                 return
         else:
-            print('Стоите на месте.')
-        time.sleep(0.4)
+            out('Стоите на месте.')
+        sleep(0.4)
     if pos >= distance:
-        print('Вы добрались до финиша! Победа.')
+        out('Вы добрались до финиша! Победа.')
     press_enter()
 
 # -----------------------
@@ -1295,7 +1492,7 @@ def red_green_light():
 # -----------------------
 def odd_one_out():
     clear()
-    print('=== Третий лишний ===')
+    out('=== Третий лишний ===')
     rounds = input_int('Сколько раундов? (по умолчанию 5): ', 1) or 5
     score = 0
     examples = [
@@ -1306,107 +1503,20 @@ def odd_one_out():
         (['hammer','screwdriver','banana'], 'banana'),
     ]
     for i in range(rounds):
-        pair = random.choice(examples)
+        pair = rng.choice(examples)
         items = pair[0]
         odd = pair[1]
         shuffled = items[:]
-        random.shuffle(shuffled)
-        print(f'Найдите лишний: {", ".join(shuffled)}')
-        ans = input('Ваш ответ: ').strip().lower()
+        rng.shuffle(shuffled)
+        out(f'Найдите лишний: {", ".join(shuffled)}')
+        ans = ask('Ваш ответ: ').strip().lower()
         if ans == odd:
-            print('Верно!')
+            out('Верно!')
             score += 1
         else:
-            print(f'Неверно. Правильный: {odd}')
-        time.sleep(0.4)
-    print(f'Итог: {score}/{rounds}')
-    press_enter()
-
-# -----------------------
-# 4) Сахарные соты (Sugar Hives) - match puzzle: pick adjacent to form triples
-# -----------------------
-def sugar_hives():
-    clear()
-    print('=== Сахарные соты ===')
-    rows = input_int('Рядов (по умолчанию 5): ', 3) or 5
-    cols = input_int('Столбцов (по умолчанию 6): ', 3) or 6
-    types = ['*', '#', '@', '%']
-    grid = [[random.choice(types) for _ in range(cols)] for __ in range(rows)]
-    score = 0
-    def render():
-        clear()
-        for r in range(rows):
-            print(' '.join(grid[r]))
-        print('Score:', score)
-    press_enter()
-    while True:
-        render()
-        print('Выберите две соседние клетки, чтобы попытаться создать тройку.')
-        cmd = input('Формат: r1 c1 r2 c2 (Enter выйти): ').strip()
-        if cmd == '':
-            break
-        parts = cmd.split()
-        if len(parts) != 4:
-            print('Неверный ввод.')
-            time.sleep(0.5); continue
-        r1,c1,r2,c2 = map(int, parts)
-        if not (0<=r1<rows and 0<=r2<rows and 0<=c1<cols and 0<=c2<cols):
-            print('Координаты вне диапазона. Начинайте с 0.')
-            time.sleep(0.5); continue
-        # swap
-        grid[r1][c1], grid[r2][c2] = grid[r2][c2], grid[r1][c1]
-        # check for any triples horizontally or vertically
-        removed = False
-        to_remove = [[False]*cols for _ in range(rows)]
-        # horizontal
-        for r in range(rows):
-            run_char = None; run_len = 0; run_start = 0
-            for c in range(cols):
-                ch = grid[r][c]
-                if ch == run_char:
-                    run_len += 1
-                else:
-                    if run_len >= 3:
-                        for k in range(run_start, run_start+run_len):
-                            to_remove[r][k] = True
-                    run_char = ch; run_len = 1; run_start = c
-            if run_len >= 3:
-                for k in range(run_start, run_start+run_len):
-                    to_remove[r][k] = True
-        # vertical
-        for c in range(cols):
-            run_char = None; run_len = 0; run_start = 0
-            for r in range(rows):
-                ch = grid[r][c]
-                if ch == run_char:
-                    run_len += 1
-                else:
-                    if run_len >= 3:
-                        for k in range(run_start, run_start+run_len):
-                            to_remove[k][c] = True
-                    run_char = ch; run_len = 1; run_start = r
-            if run_len >= 3:
-                for k in range(run_start, run_start+run_len):
-                    to_remove[k][c] = True
-        # remove and collapse
-        rem_count = sum(1 for r in range(rows) for c in range(cols) if to_remove[r][c])
-        if rem_count == 0:
-            print('Нет тройки — обмен отменён.')
-            # swap back
-            grid[r1][c1], grid[r2][c2] = grid[r2][c2], grid[r1][c1]
-            time.sleep(0.6)
-        else:
-            removed = True
-            score += rem_count
-            print(f'Удалено {rem_count}!')
-            for c in range(cols):
-                col_stack = [grid[r][c] for r in range(rows) if not to_remove[r][c]]
-                # fill from bottom
-                for r in range(rows-1, -1, -1):
-                    val = col_stack.pop() if col_stack else random.choice(types)
-                    grid[r][c] = val
-            time.sleep(0.6)
-    print('Игра окончена. Счёт:', score)
+            out(f'Неверно. Правильный: {odd}')
+        sleep(0.4)
+    out(f'Итог: {score}/{rounds}')
     press_enter()
 
 # -----------------------
@@ -1414,7 +1524,7 @@ def sugar_hives():
 # -----------------------
 def last_survivor():
     clear()
-    print('=== Последний выживший ===')
+    out('=== Последний выживший ===')
     n = input_int('Игроков (включая вас) (по умолчанию 8): ', 2) or 8
     players = ['You'] + [f'P{i}' for i in range(2, n+1)]
     alive = set(players)
@@ -1422,53 +1532,21 @@ def last_survivor():
     while len(alive) > 1:
         round_no += 1
         clear()
-        print(f'Раунд {round_no}. Живые: {len(alive)} -> {", ".join(sorted(alive))}')
-        action = input('Нажмите Enter чтобы сыграть раунд, q - выйти: ').strip().lower()
+        out(f'Раунд {round_no}. Живые: {len(alive)} -> {", ".join(sorted(alive))}')
+        action = ask('Нажмите Enter чтобы сыграть раунд, q - выйти: ').strip().lower()
         if action == 'q':
             break
         # random elimination based on skill/fortune
-        elim_count = random.randint(1, max(1, len(alive)//4))
-        eliminated = random.sample(list(alive), elim_count)
+        elim_count = rng.randint(1, max(1, len(alive)//4))
+        eliminated = rng.sample(list(alive), elim_count)
         for e in eliminated:
             alive.remove(e)
-        print('Выбыло:', ', '.join(eliminated))
-        time.sleep(0.8)
+        out('Выбыло:', ', '.join(eliminated))
+        sleep(0.8)
     if 'You' in alive:
-        print('Вы — последний выживший! Победа!')
+        out('Вы — последний выживший! Победа!')
     else:
-        print('Вы не выдержали. Игра окончена.')
-    press_enter()
-
-# -----------------------
-# 6) Стеклянный мост (Glass Bridge) - choose safe tiles
-# -----------------------
-def glass_bridge():
-    clear()
-    print('=== Стеклянный мост ===')
-    length = input_int('Длина моста (по умолчанию 12): ', 4) or 12
-    # each step has two tiles (left/right), only one safe
-    safe = [random.choice(['L','R']) for _ in range(length)]
-    pos = 0
-    print('На каждом шаге выберите L или R. Неправильный шаг — падение.')
-    press_enter()
-    while pos < length:
-        clear()
-        print(f'Шаг {pos+1}/{length}')
-        choice = input('Выберите (L/R): ').strip().upper()
-        if choice == '':
-            print('Вы вышли.')
-            break
-        if choice not in ('L','R'):
-            print('Неверный ввод.')
-            time.sleep(0.5); continue
-        if choice == safe[pos]:
-            print('Удачно! Идём дальше.')
-            pos += 1
-        else:
-            print('Хруст! Вы упали через стекло.')
-            press_enter()
-            return
-    print('Вы прошли мост. Ура!')
+        out('Вы не выдержали. Игра окончена.')
     press_enter()
 
 # -----------------------
@@ -1476,52 +1554,52 @@ def glass_bridge():
 # -----------------------
 def fight_game():
     clear()
-    print('=== Драка ===')
-    enemy_hp = random.randint(8,15)
-    your_hp = random.randint(8,15)
-    print(f'Противник HP: {enemy_hp}. Ваш HP: {your_hp}.')
+    out('=== Драка ===')
+    enemy_hp = rng.randint(8,15)
+    your_hp = rng.randint(8,15)
+    out(f'Противник HP: {enemy_hp}. Ваш HP: {your_hp}.')
     press_enter()
     while enemy_hp>0 and your_hp>0:
         clear()
-        print(f'Ваш HP: {your_hp}  Противник HP: {enemy_hp}')
+        out(f'Ваш HP: {your_hp}  Противник HP: {enemy_hp}')
         move = choose('Выберите действие:', ['удар', 'блок', 'спец (риск)'])
         if move == 'удар':
-            dmg = random.randint(2,5)
+            dmg = rng.randint(2,5)
             enemy_hp -= dmg
-            print(f'Вы нанесли {dmg}')
+            out(f'Вы нанесли {dmg}')
         elif move == 'блок':
-            print('Вы в блоке, уменьшаете следующий урон.')
+            out('Вы в блоке, уменьшаете следующий урон.')
             # next enemy attack reduced
             block = True
         else:
-            if random.random() < 0.6:
-                dmg = random.randint(5,9)
+            if rng.random() < 0.6:
+                dmg = rng.randint(5,9)
                 enemy_hp -= dmg
-                print(f'Удачный спец: {dmg}')
+                out(f'Удачный спец: {dmg}')
             else:
-                back = random.randint(1,4)
+                back = rng.randint(1,4)
                 your_hp -= back
-                print(f'Провал спец — вы получили {back}')
+                out(f'Провал спец — вы получили {back}')
         # enemy turn
         if enemy_hp <= 0: break
-        eact = random.choice(['hit','hit','hit','heavy','miss'])
+        eact = rng.choice(['hit','hit','hit','heavy','miss'])
         if eact == 'hit':
-            dmg = random.randint(1,4)
+            dmg = rng.randint(1,4)
             if move == 'блок':
                 dmg = max(0, dmg-2)
             your_hp -= dmg
-            print(f'Противник нанес {dmg}')
+            out(f'Противник нанес {dmg}')
         elif eact == 'heavy':
-            dmg = random.randint(3,6)
+            dmg = rng.randint(3,6)
             your_hp -= dmg
-            print(f'Сильный удар! -{dmg}')
+            out(f'Сильный удар! -{dmg}')
         else:
-            print('Противник промахнулся.')
-        time.sleep(0.8)
+            out('Противник промахнулся.')
+        sleep(0.8)
     if your_hp > 0:
-        print('Вы победили в драке!')
+        out('Вы победили в драке!')
     else:
-        print('Вы потерпели поражение.')
+        out('Вы потерпели поражение.')
     press_enter()
 
 # -----------------------
@@ -1529,56 +1607,56 @@ def fight_game():
 # -----------------------
 def sumo():
     clear()
-    print('=== Сумо ===')
+    out('=== Сумо ===')
     ring = input_int('Размер ринга (по умолчанию 9): ', 5) or 9
     center = ring//2
     pos_you = center - 1
     pos_enemy = center + 1
-    print('Цель: вытолкнуть противника за грань (0..n-1). Управление: l/r push.')
+    out('Цель: вытолкнуть противника за грань (0..n-1). Управление: l/r push.')
     press_enter()
     while 0 <= pos_you < ring and 0 <= pos_enemy < ring:
         clear()
         field = ['.']*ring
         field[pos_you] = 'Y'
         field[pos_enemy] = 'E'
-        print(''.join(field))
-        action = input('Ваш ход (l/r/q): ').strip().lower()
+        out(''.join(field))
+        action = ask('Ваш ход (l/r/q): ').strip().lower()
         if action == 'q' or action == '':
             break
         # player attempt to push towards enemy
         if action == 'r' and pos_you < pos_enemy:
             # attempt to push enemy right
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 pos_enemy += 1
-                print('Вы толкнули противника!')
+                out('Вы толкнули противника!')
             else:
                 pos_you -= 1
-                print('Промах — вы теряете равновесие и отходите назад.')
+                out('Промах — вы теряете равновесие и отходите назад.')
         elif action == 'l' and pos_you > pos_enemy:
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 pos_enemy -= 1
-                print('Вы толкнули противника!')
+                out('Вы толкнули противника!')
             else:
                 pos_you += 1
-                print('Промах — отступаете.')
+                out('Промах — отступаете.')
         else:
-            print('Неверное направление для толчка.')
+            out('Неверное направление для толчка.')
         # enemy AI tries to push you back
         if 0 <= pos_enemy < ring and 0 <= pos_you < ring:
-            if random.random() < 0.65:
+            if rng.random() < 0.65:
                 # attempts to push towards your side
                 if pos_enemy > pos_you:
                     pos_you -= 1
                 else:
                     pos_you += 1
-                print('Противник ответил толчком.')
-        time.sleep(0.6)
+                out('Противник ответил толчком.')
+        sleep(0.6)
     if not (0 <= pos_enemy < ring):
-        print('Противник вылетел — вы победили!')
+        out('Противник вылетел — вы победили!')
     elif not (0 <= pos_you < ring):
-        print('Вы вылетели — проигрыш.')
+        out('Вы вылетели — проигрыш.')
     else:
-        print('Игра закончена.')
+        out('Игра закончена.')
     press_enter()
 
 # -----------------------
@@ -1586,31 +1664,31 @@ def sumo():
 # -----------------------
 def karate():
     clear()
-    print('=== Карате ===')
+    out('=== Карате ===')
     rounds = input_int('Раундов (по умолчанию 5): ', 1) or 5
     score = 0
-    print('Ждите сигнала "STRIKE!" и нажмите Enter как можно быстрее.')
+    out('Ждите сигнала "STRIKE!" и нажмите Enter как можно быстрее.')
     press_enter()
     for r in range(rounds):
         clear()
-        wait = random.uniform(1.0, 3.0)
-        print(f'Раунд {r+1}/{rounds}: готовьтесь...')
-        time.sleep(wait)
-        t0 = time.time()
-        print('STRIKE! Нажмите Enter!')
-        input()
-        dt = time.time() - t0
-        print(f'Ваша реакция: {dt:.3f}s')
+        wait = rng.uniform(1.0, 3.0)
+        out(f'Раунд {r+1}/{rounds}: готовьтесь...')
+        sleep(wait)
+        t0 = now()
+        out('STRIKE! Нажмите Enter!')
+        ask()
+        dt = now() - t0
+        out(f'Ваша реакция: {dt:.3f}s')
         if dt < 0.3:
-            print('Отлично!')
+            out('Отлично!')
             score += 2
         elif dt < 0.6:
-            print('Хорошо.')
+            out('Хорошо.')
             score += 1
         else:
-            print('Медленно.')
-        time.sleep(0.6)
-    print('Итоговый счёт:', score)
+            out('Медленно.')
+        sleep(0.6)
+    out('Итоговый счёт:', score)
     press_enter()
 
 # -----------------------
@@ -1618,18 +1696,18 @@ def karate():
 # -----------------------
 def everything_alive():
     clear()
-    print('=== Всё оживает! ===')
+    out('=== Всё оживает! ===')
     items = ['стул', 'лампа', 'часы', 'картина', 'клавиатура']
-    living = {name: {'mood': random.randint(0,5)} for name in items}
+    living = {name: {'mood': rng.randint(0,5)} for name in items}
     rounds = input_int('Сколько раундов наблюдать? (по умолчанию 8): ', 1) or 8
-    print('Предметы получают настроение и действуют случайно.')
+    out('Предметы получают настроение и действуют случайно.')
     press_enter()
     for r in range(rounds):
         clear()
-        print(f'Раунд {r+1}/{rounds}')
+        out(f'Раунд {r+1}/{rounds}')
         for name, state in living.items():
             # random action based on mood
-            act_roll = random.random()
+            act_roll = rng.random()
             if act_roll < 0.2:
                 action = 'шевелится'
                 state['mood'] = min(10, state['mood']+1)
@@ -1638,15 +1716,15 @@ def everything_alive():
                 state['mood'] = max(0, state['mood']-1)
             else:
                 action = 'молчит'
-            print(f'{name.capitalize()} [{state["mood"]}/10]: {action}')
+            out(f'{name.capitalize()} [{state["mood"]}/10]: {action}')
         # possible interaction: items influence each other
-        if random.random() < 0.3:
-            a,b = random.sample(items,2)
+        if rng.random() < 0.3:
+            a,b = rng.sample(items,2)
             living[a]['mood'] = min(10, living[a]['mood'] + 1)
             living[b]['mood'] = max(0, living[b]['mood'] - 1)
-            print(f'Взаимодействие: {a} подтолкнул {b}.')
-        time.sleep(1.0)
-    print('Наблюдение окончено.')
+            out(f'Взаимодействие: {a} подтолкнул {b}.')
+        sleep(1.0)
+    out('Наблюдение окончено.')
     press_enter()
 # -----------------------
 # Game: Болтай с ожившими предметами
@@ -1654,73 +1732,73 @@ def everything_alive():
 # -----------------------
 def chat_with_items():
     clear()
-    print('=== Болтай с ожившими предметами ===')
+    out('=== Болтай с ожившими предметами ===')
     items = {
         'стул': {'mood': 5, 'hunger': 0},
         'лампа': {'mood': 4, 'hunger': 0},
         'часы': {'mood': 6, 'hunger': 0}
     }
     rounds = input_int('Сколько взаимодействий? (по умолчанию 8): ', 1) or 8
-    print('Вы можете кормить, ремонтировать, говорить и наблюдать. Цель: поддерживать настроение выше 3.')
+    out('Вы можете кормить, ремонтировать, говорить и наблюдать. Цель: поддерживать настроение выше 3.')
     press_enter()
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}')
+        out(f'Раунд {r}/{rounds}')
         for name, st in items.items():
-            print(f' - {name}: настроение {st["mood"]}/10, голод {st["hunger"]}')
-        choice = input('Выберите предмет для взаимодействия (имя) или "all" (Enter для случайного): ').strip().lower()
+            out(f' - {name}: настроение {st["mood"]}/10, голод {st["hunger"]}')
+        choice = ask('Выберите предмет для взаимодействия (имя) или "all" (Enter для случайного): ').strip().lower()
         if choice == '':
-            choice = random.choice(list(items.keys()))
-            print('Автовыбор:', choice)
+            choice = rng.choice(list(items.keys()))
+            out('Автовыбор:', choice)
         if choice == 'all':
             targets = list(items.keys())
         elif choice in items:
             targets = [choice]
         else:
-            print('Неверный выбор.')
-            time.sleep(0.6)
+            out('Неверный выбор.')
+            sleep(0.6)
             continue
-        action = input('Действие: talk/feed/fix/watch: ').strip().lower()
+        action = ask('Действие: talk/feed/fix/watch: ').strip().lower()
         for t in targets:
             st = items[t]
             if action == 'talk':
                 # random positive or neutral effect
-                if random.random() < 0.6:
+                if rng.random() < 0.6:
                     delta = 1
                     st['mood'] = min(10, st['mood'] + delta)
-                    print(f'Вы поговорили с {t}. Настроение +{delta}.')
+                    out(f'Вы поговорили с {t}. Настроение +{delta}.')
                 else:
-                    print(f'{t} молчит...')
+                    out(f'{t} молчит...')
             elif action == 'feed':
                 st['hunger'] = max(0, st['hunger'] - 1)
                 st['mood'] = min(10, st['mood'] + 1)
-                print(f'Покормили {t}.')
+                out(f'Покормили {t}.')
             elif action == 'fix':
-                if random.random() < 0.7:
+                if rng.random() < 0.7:
                     st['mood'] = min(10, st['mood'] + 2)
-                    print(f'Починили {t}. Он радуется!')
+                    out(f'Починили {t}. Он радуется!')
                 else:
                     st['mood'] = max(0, st['mood'] -1)
-                    print(f'Ремонт прошёл плохо. {t} расстроен.')
+                    out(f'Ремонт прошёл плохо. {t} расстроен.')
             elif action == 'watch':
                 # observationally learn: maybe increase mood
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     st['mood'] = min(10, st['mood'] + 1)
-                    print(f'{t} заметил вашу заботу. Настроение +1.')
+                    out(f'{t} заметил вашу заботу. Настроение +1.')
                 else:
-                    print(f'Вы просто наблюдали за {t}.')
+                    out(f'Вы просто наблюдали за {t}.')
             else:
-                print('Неизвестное действие.')
+                out('Неизвестное действие.')
         # natural decay / random
         for st in items.values():
-            if random.random() < 0.25:
+            if rng.random() < 0.25:
                 st['mood'] = max(0, st['mood'] - 1)
                 st['hunger'] = min(5, st['hunger'] + 1)
-        time.sleep(0.8)
+        sleep(0.8)
     clear()
-    print('Итоги заботы:')
+    out('Итоги заботы:')
     for name, st in items.items():
-        print(f'{name}: настроение {st["mood"]}/10, голод {st["hunger"]}')
+        out(f'{name}: настроение {st["mood"]}/10, голод {st["hunger"]}')
     press_enter()
 
 # -----------------------
@@ -1729,20 +1807,20 @@ def chat_with_items():
 # -----------------------
 def rooms_game():
     clear()
-    print('=== Комнаты ===')
+    out('=== Комнаты ===')
     count = input_int('Сколько комнат (по умолчанию 10): ', 5) or 10
-    rooms = [{'monster': (random.random() < 0.25), 'searched': False} for _ in range(count)]
+    rooms = [{'monster': (rng.random() < 0.25), 'searched': False} for _ in range(count)]
     player = 0
     hiding = False
-    print('Вы перемещаетесь по комнатам 0..N-1. Если в комнате монстр и вы не спрятаны — вам повезёт не всегда.')
+    out('Вы перемещаетесь по комнатам 0..N-1. Если в комнате монстр и вы не спрятаны — вам повезёт не всегда.')
     press_enter()
     while True:
         clear()
-        print(f'Комната {player}/{count-1}  {"(спрятан)" if hiding else ""}')
-        print('Соседние комнаты: ', end='')
-        if player>0: print(player-1, end=' ')
-        print(player+1 if player<count-1 else '', end='\n')
-        cmd = input('Действия: move <L/R>, hide, search, q: ').strip().lower()
+        out(f'Комната {player}/{count-1}  {"(спрятан)" if hiding else ""}')
+        out('Соседние комнаты: ', end='')
+        if player>0: out(player-1, end=' ')
+        out(player+1 if player<count-1 else '', end='\n')
+        cmd = ask('Действия: move <L/R>, hide, search, q: ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd.startswith('move'):
@@ -1753,38 +1831,38 @@ def rooms_game():
                 if 0 <= target < count:
                     player = target
                     hiding = False
-                    print('Вы вошли в комнату', player)
+                    out('Вы вошли в комнату', player)
                     # check monster
                     if rooms[player]['monster']:
                         if hiding:
-                            print('Монстр не заметил вас (всё ещё спрятаны).')
+                            out('Монстр не заметил вас (всё ещё спрятаны).')
                         else:
                             # encounter: chance to escape if you moved quickly
-                            if random.random() < 0.5:
-                                print('Вам повезло — монстр не заметил!')
+                            if rng.random() < 0.5:
+                                out('Вам повезло — монстр не заметил!')
                             else:
-                                print('Монстр заметил вас и съел. Конец игры.')
+                                out('Монстр заметил вас и съел. Конец игры.')
                                 press_enter()
                                 return
                 else:
-                    print('Нельзя туда идти.')
+                    out('Нельзя туда идти.')
             else:
-                print('Неправильное направление. move L или move R.')
+                out('Неправильное направление. move L или move R.')
         elif cmd == 'hide':
             hiding = True
-            print('Вы спрятались в комнате.')
+            out('Вы спрятались в комнате.')
         elif cmd == 'search':
             if rooms[player]['searched']:
-                print('Уже обыскано.')
+                out('Уже обыскано.')
             else:
                 rooms[player]['searched'] = True
-                if random.random() < 0.4:
-                    print('Вы нашли полезный предмет (еда).')
+                if rng.random() < 0.4:
+                    out('Вы нашли полезный предмет (еда).')
                 else:
-                    print('Пусто.')
+                    out('Пусто.')
         else:
-            print('Неизвестная команда.')
-        time.sleep(0.6)
+            out('Неизвестная команда.')
+        sleep(0.6)
 
 # -----------------------
 # Game: Монстр
@@ -1792,15 +1870,16 @@ def rooms_game():
 # -----------------------
 def monster_game():
     clear()
-    print('=== Монстр ===')
+    out('=== Монстр ===')
     size = input_int('Размер стороны поля (по умолчанию 7): ', 4) or 7
     player = [0, 0]
     monster = [size-1, size-1]
     steps = 0
-    print('Уходите от монстра. Двигайтесь w/a/s/d. Доберитесь до противоположного угла, чтобы выжить.')
+    out('Уходите от монстра. Двигайтесь w/a/s/d. Доберитесь до противоположного угла, чтобы выжить.')
     press_enter()
     while True:
         clear()
+        lines = []
         for r in range(size):
             line = ''
             for c in range(size):
@@ -1808,16 +1887,17 @@ def monster_game():
                 elif [r,c] == monster: line += 'M '
                 elif [r,c] == [size-1, size-1]: line += 'G '
                 else: line += '. '
-            print(line)
+            lines.append(line)
+        out('\n'.join(lines))
         if player == monster:
-            print('Монстр поймал вас. Вы проиграли.')
+            out('Монстр поймал вас. Вы проиграли.')
             press_enter()
             return
         if player == [size-1, size-1]:
-            print('Вы добрались до точки спасения. Победа!')
+            out('Вы добрались до точки спасения. Победа!')
             press_enter()
             return
-        cmd = input('Ход (w/a/s/d, q выход): ').strip().lower()
+        cmd = ask('Ход (w/a/s/d, q выход): ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd == 'w' and player[0]>0: player[0]-=1
@@ -1830,7 +1910,7 @@ def monster_game():
         if monster[1] < player[1]: monster[1] += 1
         elif monster[1] > player[1]: monster[1] -= 1
         # occasional monster sprint
-        if random.random() < 0.12:
+        if rng.random() < 0.12:
             if monster[0] < player[0]: monster[0] += 1
             elif monster[0] > player[0]: monster[0] -= 1
         steps += 1
@@ -1841,19 +1921,19 @@ def monster_game():
 # -----------------------
 def catastrophe():
     clear()
-    print('=== Катастрофа ===')
+    out('=== Катастрофа ===')
     days = input_int('Сколько дней выжить? (по умолчанию 7): ', 1) or 7
     health = 10
     supplies = 5
     for d in range(1, days+1):
         clear()
-        print(f'День {d}/{days}. Здоровье {health}, запасы {supplies}.')
-        event = random.choice(['earthquake','flood','heat','drought','calm'])
-        print('Сегодня: ', event)
-        action = input('Действие: prepare/use/rest (Enter пропустить): ').strip().lower()
+        out(f'День {d}/{days}. Здоровье {health}, запасы {supplies}.')
+        event = rng.choice(['earthquake','flood','heat','drought','calm'])
+        out('Сегодня: ', event)
+        action = ask('Действие: prepare/use/rest (Enter пропустить): ').strip().lower()
         if action == 'prepare' and supplies>0:
             supplies -= 1
-            print('Вы подготовились, риск снизился.')
+            out('Вы подготовились, риск снизился.')
             mitigate = True
         else:
             mitigate = False
@@ -1861,33 +1941,33 @@ def catastrophe():
         if event == 'earthquake':
             dmg = 3 if not mitigate else 1
             health -= dmg
-            print(f'Землетрясение: -{dmg} здоровья.')
+            out(f'Землетрясение: -{dmg} здоровья.')
         elif event == 'flood':
             if not mitigate:
                 supplies = max(0, supplies-2)
-                print('Наводнение: потеря запасов.')
+                out('Наводнение: потеря запасов.')
             else:
-                print('Подготовка помогла.')
+                out('Подготовка помогла.')
         elif event == 'heat':
             health -= 1
             supplies = max(0, supplies-1)
-            print('Жара: -1 здоровье, -1 запасы.')
+            out('Жара: -1 здоровье, -1 запасы.')
         elif event == 'drought':
             supplies = max(0, supplies-2)
             if supplies==0:
                 health -= 2
-                print('Засуха, нехватка ресурсов: -2 здоровья.')
+                out('Засуха, нехватка ресурсов: -2 здоровья.')
             else:
-                print('Справились с засухой.')
+                out('Справились с засухой.')
         else:
-            print('Спокойный день.')
+            out('Спокойный день.')
         if health <= 0:
-            print('Вы не пережили катастрофию...')
+            out('Вы не пережили катастрофию...')
             press_enter()
             return
-        time.sleep(0.8)
+        sleep(0.8)
         press_enter()
-    print('Вы выжили в серии катастроф. Поздравляю!')
+    out('Вы выжили в серии катастроф. Поздравляю!')
     press_enter()
 
 # -----------------------
@@ -1896,11 +1976,11 @@ def catastrophe():
 # -----------------------
 def pursuit_player_chaser():
     clear()
-    print('=== Преследование (ты — преследователь) ===')
+    out('=== Преследование (ты — преследователь) ===')
     length = input_int('Длина трека (по умолчанию 25): ', 10) or 25
     runner = 0
     chaser = -3
-    print('Вы — C (преследователь). Бегун — R. Команды: run (двигаться быстрее) или sneak (медленнее).')
+    out('Вы — C (преследователь). Бегун — R. Команды: run (двигаться быстрее) или sneak (медленнее).')
     press_enter()
     turn = 0
     while True:
@@ -1911,33 +1991,33 @@ def pursuit_player_chaser():
         if 0 <= chaser < length:
             if track[chaser] == 'R': track[chaser] = 'X'
             else: track[chaser] = 'C'
-        print(''.join(track))
-        move = input('Ваш ход (run/sneak/q): ').strip().lower()
+        out(''.join(track))
+        move = ask('Ваш ход (run/sneak/q): ').strip().lower()
         if move == 'q' or move == '':
             break
         if move == 'run':
-            chaser += random.randint(2,4)
+            chaser += rng.randint(2,4)
         else:
-            chaser += random.randint(0,2)
+            chaser += rng.randint(0,2)
         # runner moves away trying to keep distance
         dist = chaser - runner
         if dist >= -2:
-            runner += random.randint(1,3)  # runs faster if close
+            runner += rng.randint(1,3)  # runs faster if close
         else:
-            runner += random.randint(0,2)
+            runner += rng.randint(0,2)
         runner = min(runner, length-1)
         chaser = min(chaser, length-1)
         if chaser >= runner:
             clear()
-            print('Вы догнали бегуна! Победа.')
+            out('Вы догнали бегуна! Победа.')
             press_enter()
             return
         if runner >= length-1:
             clear()
-            print('Бегун добежал до финиша и спасся.')
+            out('Бегун добежал до финиша и спасся.')
             press_enter()
             return
-        time.sleep(0.5)
+        sleep(0.5)
 
 # -----------------------
 # Game: Преследование с мячом (player chaser)
@@ -1945,12 +2025,12 @@ def pursuit_player_chaser():
 # -----------------------
 def pursuit_with_ball_player_chaser():
     clear()
-    print('=== Преследование с мячом (ты — преследователь) ===')
+    out('=== Преследование с мячом (ты — преследователь) ===')
     length = input_int('Длина поля (по умолчанию 22): ', 10) or 22
     runner = 0
     chaser = -3
     ball_holder = 'Runner'
-    print('Вы — преследователь (C). Бегун (R) обычно держит мяч. Догоните и заберите мяч!')
+    out('Вы — преследователь (C). Бегун (R) обычно держит мяч. Догоните и заберите мяч!')
     press_enter()
     while True:
         clear()
@@ -1959,40 +2039,40 @@ def pursuit_with_ball_player_chaser():
             field[runner] = 'R' if ball_holder!='Runner' else 'B'  # B means runner has ball
         if 0 <= chaser < length:
             field[chaser] = 'C'
-        print(''.join(field))
-        action = input('Ваш ход (run/sneak/tackle/q): ').strip().lower()
+        out(''.join(field))
+        action = ask('Ваш ход (run/sneak/tackle/q): ').strip().lower()
         if action == 'q' or action == '':
             break
         if action == 'run':
-            chaser += random.randint(2,4)
+            chaser += rng.randint(2,4)
         elif action == 'sneak':
-            chaser += random.randint(0,2)
+            chaser += rng.randint(0,2)
         elif action == 'tackle':
             # attempt to steal if close
-            if abs(chaser - runner) <= 2 and random.random() < 0.6:
+            if abs(chaser - runner) <= 2 and rng.random() < 0.6:
                 ball_holder = 'Chaser'
-                print('Ура! Вы отобрали мяч.')
+                out('Ура! Вы отобрали мяч.')
             else:
-                print('Тэкл не удался.')
+                out('Тэкл не удался.')
         # runner moves
         if ball_holder == 'Runner':
-            runner += random.randint(1,3)
+            runner += rng.randint(1,3)
         else:
             # runner may try to recover ball or stop moving faster
-            runner += random.randint(0,2)
+            runner += rng.randint(0,2)
         runner = min(runner, length-1)
         chaser = min(chaser, length-1)
         if chaser >= runner and ball_holder == 'Chaser':
             clear()
-            print('Вы догнали бегуна и отобрали мяч — победа!')
+            out('Вы догнали бегуна и отобрали мяч — победа!')
             press_enter()
             return
         if runner >= length-1 and ball_holder == 'Runner':
             clear()
-            print('Бегун с мячом дошёл до финиша — вы проиграли.')
+            out('Бегун с мячом дошёл до финиша — вы проиграли.')
             press_enter()
             return
-        time.sleep(0.6)
+        sleep(0.6)
 
 # -----------------------
 # Game: Сказка
@@ -2000,41 +2080,41 @@ def pursuit_with_ball_player_chaser():
 # -----------------------
 def fairy_tale():
     clear()
-    print('=== Сказка ===')
+    out('=== Сказка ===')
     heroes = [
         {'name':'Иван-дурак','need':'find a magic sword'},
         {'name':'Царь-девица','need':'find a lost jewel'},
         {'name':'Коловрат','need':'defeat a dragon'}
     ]
     score = 0
-    print('Вы встречаете героев и можете совершить одно событие, которое поможет им.')
+    out('Вы встречаете героев и можете совершить одно событие, которое поможет им.')
     press_enter()
     for h in heroes:
         clear()
-        print(f'Герой: {h["name"]}. Ему нужно: {h["need"]}')
-        action = choose = input('Как поможете? (gift/action/trick/skip): ').strip().lower()
+        out(f'Герой: {h["name"]}. Ему нужно: {h["need"]}')
+        action = choose = ask('Как поможете? (gift/action/trick/skip): ').strip().lower()
         if action == 'gift':
-            print('Вы подарили полезный предмет.')
+            out('Вы подарили полезный предмет.')
             score += 1
         elif action == 'action':
-            success = random.random() < 0.6
+            success = rng.random() < 0.6
             if success:
-                print('Ваша помощь оказалась эффективной!')
+                out('Ваша помощь оказалась эффективной!')
                 score += 2
             else:
-                print('Попытка неудачна.')
+                out('Попытка неудачна.')
         elif action == 'trick':
-            if random.random() < 0.4:
-                print('Вы хитро обманули врагов — полезный эффект.')
+            if rng.random() < 0.4:
+                out('Вы хитро обманули врагов — полезный эффект.')
                 score += 1
             else:
-                print('Хитрость вернулась бумерангом.')
+                out('Хитрость вернулась бумерангом.')
                 score -= 1
         else:
-            print('Пропуск.')
-        time.sleep(0.7)
+            out('Пропуск.')
+        sleep(0.7)
     clear()
-    print('Итоговая помощь героям. Очки доблести:', score)
+    out('Итоговая помощь героям. Очки доблести:', score)
     press_enter()
 
 # -----------------------
@@ -2043,7 +2123,7 @@ def fairy_tale():
 # -----------------------
 def curse_game():
     clear()
-    print('=== Проклятие ===')
+    out('=== Проклятие ===')
     rooms = input_int('Сколько комнат в доме (по умолчанию 6): ', 3) or 6
     day_limit = input_int('Сколько раундов бродить? (по умолчанию 10): ', 1) or 10
     player_room = 0
@@ -2056,13 +2136,13 @@ def curse_game():
         ('curse_sleep', lambda h: (max(0,h-1), 'Проклятье усталости: -1 здоровья.')),
         ('mana', lambda h: (h+1, 'Магия наполнила вас: +1 здоровья.')),
     ]
-    print('Вы бродите по дому. В каждой комнате каждый раунд может проявиться эффект.')
+    out('Вы бродите по дому. В каждой комнате каждый раунд может проявиться эффект.')
     press_enter()
     for day in range(1, day_limit+1):
         clear()
-        print(f'Раунд {day}/{day_limit}. Комната {player_room}. Здоровье: {health}')
-        print('Доступные команды: move L/R, stay, q - выход')
-        cmd = input('> ').strip().lower()
+        out(f'Раунд {day}/{day_limit}. Комната {player_room}. Здоровье: {health}')
+        out('Доступные команды: move L/R, stay, q - выход')
+        cmd = ask('> ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd.startswith('move'):
@@ -2071,45 +2151,45 @@ def curse_game():
                 nr = player_room-1 if parts[1].upper()=='L' else player_room+1
                 if 0 <= nr < rooms:
                     player_room = nr
-                    print('Вы вошли в комнату', player_room)
+                    out('Вы вошли в комнату', player_room)
                 else:
-                    print('Нельзя идти туда.')
+                    out('Нельзя идти туда.')
             else:
-                print('Неверная команда move L или move R.')
+                out('Неверная команда move L или move R.')
         elif cmd == 'stay':
-            print('Вы остаетесь на месте и наблюдаете.')
+            out('Вы остаетесь на месте и наблюдаете.')
         else:
-            print('Неверная команда.')
+            out('Неверная команда.')
         # effect appears
-        effect = random.choice(curses)
+        effect = rng.choice(curses)
         health, msg = effect[1](health)
-        print('Эффект:', msg)
+        out('Эффект:', msg)
         # sometimes the effect spreads creating room-wide persistent modifier
-        if random.random() < 0.12:
-            print('Эффект закрепился в комнате — будьте внимательны при следующем входе.')
+        if rng.random() < 0.12:
+            out('Эффект закрепился в комнате — будьте внимательны при следующем входе.')
             # simulate by immediate extra penalty/bonus next time (simple: immediate)
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 health += 1
-                print('Доп. благотворный эффект +1')
+                out('Доп. благотворный эффект +1')
             else:
                 health -= 1
-                print('Доп. вредный эффект -1')
-        time.sleep(0.8)
+                out('Доп. вредный эффект -1')
+        sleep(0.8)
         if health <= 0:
-            print('Вы погибли от проклятия...')
+            out('Вы погибли от проклятия...')
             press_enter()
             return
         press_enter()
-    print('Вы прошли через проклятие. Финальное здоровье:', health)
+    out('Вы прошли через проклятие. Финальное здоровье:', health)
     press_enter()
 
 # -----------------------
 # Helper choose func used in fairy_tale fallback
 # -----------------------
 def choose(prompt, options):
-    print(prompt)
+    out(prompt)
     for i, o in enumerate(options, 1):
-        print(f'{i}. {o}')
+        out(f'{i}. {o}')
     sel = input_int('Выберите номер: ', 1, len(options))
     if sel is None:
         return options[0]
@@ -2125,7 +2205,7 @@ def choose(prompt, options):
 # -----------------------
 def bunker_boardgame():
     clear()
-    print('=== Настолка "Бункер" ===')
+    out('=== Настолка "Бункер" ===')
     # Setup 7 players (You + 6 NPCs). "Мест 2" interpreted that there are 2 survival spots? We'll treat final stage as 2 survivors left safe.
     n_players = 7
     names = ['You'] + [f'NPC{i}' for i in range(1, n_players)]
@@ -2141,73 +2221,73 @@ def bunker_boardgame():
     for nm in names:
         profile = {
             'name': nm,
-            'age': random.randint(18,70) if nm!='You' else None,  # you will be prompted
-            'profession': random.choice(professions) if nm!='You' else None,
-            'hobby': random.choice(hobbies),
-            'phobia': random.choice(phobias),
-            'health': random.choice(healths),
-            'fact': random.choice(facts),
-            'occupation': random.choice(occupations),
+            'age': rng.randint(18,70) if nm!='You' else None,  # you will be prompted
+            'profession': rng.choice(professions) if nm!='You' else None,
+            'hobby': rng.choice(hobbies),
+            'phobia': rng.choice(phobias),
+            'health': rng.choice(healths),
+            'fact': rng.choice(facts),
+            'occupation': rng.choice(occupations),
         }
         players.append(profile)
 
     # If player is You, ask for age/profession (optional)
     clear()
-    print('Введите, пожалуйста, ваш возраст и профессию (можно оставить пустым для авто).')
-    a = input('Ваш возраст (Enter — случайно): ').strip()
+    out('Введите, пожалуйста, ваш возраст и профессию (можно оставить пустым для авто).')
+    a = ask('Ваш возраст (Enter — случайно): ').strip()
     if a.isdigit():
         players[0]['age'] = int(a)
     else:
-        players[0]['age'] = random.randint(18,70)
-    p = input('Ваша профессия (Enter — случайно): ').strip()
-    players[0]['profession'] = p if p else random.choice(professions)
+        players[0]['age'] = rng.randint(18,70)
+    p = ask('Ваша профессия (Enter — случайно): ').strip()
+    players[0]['profession'] = p if p else rng.choice(professions)
 
     press_enter()
 
     # Round: each player reveals basic info (age/profession). Then each in turn may reveal one of five detailed categories.
     clear()
-    print('Раунд раскрытий: каждый игрок по очереди показывает возраст и профессию.')
+    out('Раунд раскрытий: каждый игрок по очереди показывает возраст и профессию.')
     for prof in players:
-        print(f"{prof['name']}: возраст {prof['age']}, профессия {prof['profession']}")
-        time.sleep(0.5)
+        out(f"{prof['name']}: возраст {prof['age']}, профессия {prof['profession']}")
+        sleep(0.5)
     press_enter()
 
     details = ['hobby','phobia','health','fact','occupation']
-    print('Теперь по очереди каждый игрок может раскрыть один подробный пункт: Хобби, Фобия, Здоровье, Факт или Занятие.')
+    out('Теперь по очереди каждый игрок может раскрыть один подробный пункт: Хобби, Фобия, Здоровье, Факт или Занятие.')
     revealed = {pl['name']: {} for pl in players}
     for pl in players:
         clear()
-        print(f"Ход игрока: {pl['name']}")
+        out(f"Ход игрока: {pl['name']}")
         # NPC chooses randomly; You choose
         if pl['name'] == 'You':
             opt_idx = choose_option('Что раскрыть?', ['Hobby','Phobia','Health','Fact','Occupation','Skip'])
             if opt_idx is None or opt_idx==5:
-                print('Пропуск.')
+                out('Пропуск.')
             else:
                 key = details[opt_idx]
                 revealed[pl['name']][key] = pl[key]
-                print(f'Вы раскрыли: {key} -> {pl[key]}')
+                out(f'Вы раскрыли: {key} -> {pl[key]}')
         else:
-            key = random.choice(details)
+            key = rng.choice(details)
             revealed[pl['name']][key] = pl[key]
-            print(f'{pl["name"]} раскрыл {key}: {pl[key]}')
-        time.sleep(0.7)
+            out(f'{pl["name"]} раскрыл {key}: {pl[key]}')
+        sleep(0.7)
     press_enter()
 
     # After all reveals, voting: players vote who to eliminate. NPCs vote with some heuristic: pick someone with suspicious phobia or low health or random.
     clear()
-    print('Начинается голосование! Тот, кто набрал больше всего голосов — выбывает. (2 места в бункере — значит выбывает 5, остаются 2)')
+    out('Начинается голосование! Тот, кто набрал больше всего голосов — выбывает. (2 места в бункере — значит выбывает 5, остаются 2)')
     votes = {pl['name']:0 for pl in players}
     for voter in players:
         if voter['name'] == 'You':
             # show profiles briefly for user decision
-            print('Игроки и раскрытые детали:')
+            out('Игроки и раскрытые детали:')
             for pl in players:
-                print(f' - {pl["name"]}: возраст {pl["age"]}, профессия {pl["profession"]}, раскрыто: {revealed[pl["name"]]}')
-            choice = input('За кого голосуете? Введите имя: ').strip()
+                out(f' - {pl["name"]}: возраст {pl["age"]}, профессия {pl["profession"]}, раскрыто: {revealed[pl["name"]]}')
+            choice = ask('За кого голосуете? Введите имя: ').strip()
             if choice not in votes:
-                choice = random.choice(list(votes.keys()))
-                print('Неверное имя — голос случайно за', choice)
+                choice = rng.choice(list(votes.keys()))
+                out('Неверное имя — голос случайно за', choice)
             votes[choice] += 1
         else:
             # NPC heuristic
@@ -2227,7 +2307,7 @@ def bunker_boardgame():
                 weights.append(w)
             # choose by weights
             total = sum(weights)
-            pick = random.random() * total
+            pick = rng.random() * total
             acc = 0
             for cand, wt in zip(candidates, weights):
                 acc += wt
@@ -2237,18 +2317,18 @@ def bunker_boardgame():
     # Tally and eliminate until 2 remain
     sorted_votes = sorted(votes.items(), key=lambda x: (-x[1], x[0]))
     clear()
-    print('Результаты голосования:')
+    out('Результаты голосования:')
     for name, v in sorted_votes:
-        print(f'{name}: {v} голос(ов)')
+        out(f'{name}: {v} голос(ов)')
     # Determine eliminated: keep top 2 survivors by random tie-breaker
     # We should eliminate n_players - 2
     to_eliminate_count = len(players) - 2
     # Rank by votes descending; if tie among boundary, random tiebreak
-    ranked = sorted(votes.items(), key=lambda x: (-x[1], random.random()))
+    ranked = sorted(votes.items(), key=lambda x: (-x[1], rng.random()))
     eliminated = [name for name, _ in ranked[:to_eliminate_count]]
     survivors = [name for name, _ in ranked[to_eliminate_count:]]
-    print('\nВыбывают:', ', '.join(eliminated))
-    print('Остаются в бункере:', ', '.join(survivors))
+    out('\nВыбывают:', ', '.join(eliminated))
+    out('Остаются в бункере:', ', '.join(survivors))
     press_enter()
 
 # -----------------------
@@ -2258,56 +2338,56 @@ def bunker_boardgame():
 # -----------------------
 def traitor_game():
     clear()
-    print('=== Предатель ===')
+    out('=== Предатель ===')
     players = ['You'] + [f'P{i}' for i in range(1,6)]
     n = len(players)
     roles = {}
     # assign 1 traitor randomly; player could be traitor
-    traitor = random.choice(players)
+    traitor = rng.choice(players)
     for p in players:
         roles[p] = 'Traitor' if p == traitor else 'Innocent'
-    print('Роли распределены. Ночное действие: предатель выбирает жертву.')
+    out('Роли распределены. Ночное действие: предатель выбирает жертву.')
     press_enter()
     # night: traitor eliminates one (if traitor is You, ask)
     if roles['You'] == 'Traitor':
-        print('Вы — предатель. Выберите жертву.')
+        out('Вы — предатель. Выберите жертву.')
         for i,p in enumerate(players):
             if p != 'You':
-                print(i, p)
+                out(i, p)
         idx = input_int('Введите индекс жертвы: ', 0, n-1)
-        victim = players[idx] if idx is not None and players[idx] != 'You' else random.choice([p for p in players if p!='You'])
-        print('Вы убили', victim)
+        victim = players[idx] if idx is not None and players[idx] != 'You' else rng.choice([p for p in players if p!='You'])
+        out('Вы убили', victim)
     else:
         # traitor picks random victim (not himself)
-        victim = random.choice([p for p in players if p != traitor])
-        print('Ночью кто-то был убит:', victim)
+        victim = rng.choice([p for p in players if p != traitor])
+        out('Ночью кто-то был убит:', victim)
     # remove victim
     alive = [p for p in players if p != victim]
     press_enter()
     # day: discuss and vote (simplified)
-    print('Днём происходит обвинение. Каждый голосует за предполагаемого предателя.')
+    out('Днём происходит обвинение. Каждый голосует за предполагаемого предателя.')
     votes = {p:0 for p in alive}
     for voter in alive:
         if voter == 'You':
-            print('Кто остался жив? ', ', '.join(alive))
-            choice = input('За кого голосуете (имя): ').strip()
+            out('Кто остался жив? ', ', '.join(alive))
+            choice = ask('За кого голосуете (имя): ').strip()
             if choice not in votes:
-                choice = random.choice([p for p in alive if p!='You'])
-                print('Неверно, выбирается случайно:', choice)
+                choice = rng.choice([p for p in alive if p!='You'])
+                out('Неверно, выбирается случайно:', choice)
             votes[choice] += 1
         else:
             # NPCs random suspicion, bias towards unusual names or those not themselves
             candidates = [p for p in alive if p != voter]
-            pick = random.choice(candidates)
+            pick = rng.choice(candidates)
             votes[pick] += 1
-    sorted_votes = sorted(votes.items(), key=lambda x: (-x[1], random.random()))
+    sorted_votes = sorted(votes.items(), key=lambda x: (-x[1], rng.random()))
     accused, vcount = sorted_votes[0]
     clear()
-    print('Голосование завершено. Обвинён:', accused, 'с', vcount, 'голами.')
+    out('Голосование завершено. Обвинён:', accused, 'с', vcount, 'голами.')
     if roles.get(accused) == 'Traitor':
-        print('Предатель найден! Победа мирных.')
+        out('Предатель найден! Победа мирных.')
     else:
-        print('Неправильный выбор. Предатель остался на свободе.' )
+        out('Неправильный выбор. Предатель остался на свободе.' )
     press_enter()
 
 # -----------------------
@@ -2316,41 +2396,41 @@ def traitor_game():
 # -----------------------
 def fear_game():
     clear()
-    print('=== Страх ===')
+    out('=== Страх ===')
     fear = 0
     rounds = input_int('Сколько испытаний (по умолчанию 6): ', 1) or 6
     for r in range(1, rounds+1):
         clear()
-        print(f'Испытание {r}/{rounds}. Уровень страха: {fear}/10')
-        scenario = random.choice([
+        out(f'Испытание {r}/{rounds}. Уровень страха: {fear}/10')
+        scenario = rng.choice([
             ('темный коридор', 2),
             ('шум в подвале', 3),
             ('тень в окне', 1),
             ('странный шёпот', 4),
             ('движущийся шкаф', 3)
         ])
-        print('Сценарий:', scenario[0])
-        action = input('Выбор: Investigate / Run / Hide (i/r/h): ').strip().lower()
+        out('Сценарий:', scenario[0])
+        action = ask('Выбор: Investigate / Run / Hide (i/r/h): ').strip().lower()
         if action == 'i':
             # increase or decrease randomly
-            if random.random() < 0.4:
+            if rng.random() < 0.4:
                 fear = max(0, fear - 1)
-                print('Вы храбры — страх уменьшается.')
+                out('Вы храбры — страх уменьшается.')
             else:
                 fear += scenario[1]
-                print('Вы встревожены — страх растёт.')
+                out('Вы встревожены — страх растёт.')
         elif action == 'r':
             fear = max(0, fear - 1)
-            print('Вы убегаете — стресс снижается, но усталость растёт.')
+            out('Вы убегаете — стресс снижается, но усталость растёт.')
         else:
             fear += 1
-            print('Вы прячетесь — страх медленно нарастает.')
+            out('Вы прячетесь — страх медленно нарастает.')
         if fear >= 10:
-            print('Страх достиг критического уровня — вы потеряли сознание.')
+            out('Страх достиг критического уровня — вы потеряли сознание.')
             press_enter()
             return
-        time.sleep(0.6)
-    print('Вы прошли испытания страхом. Уровень страха:', fear)
+        sleep(0.6)
+    out('Вы прошли испытания страхом. Уровень страха:', fear)
     press_enter()
 
 # -----------------------
@@ -2359,7 +2439,7 @@ def fear_game():
 # -----------------------
 def spider_game():
     clear()
-    print('=== Паук ===')
+    out('=== Паук ===')
     size = input_int('Размер сети (сторона, по умолчанию 7): ', 5) or 7
     player = [0, size//2]
     # spider occupies center and has "legs" on nearby cells
@@ -2374,10 +2454,11 @@ def spider_game():
                     poss.append([rr,cc])
         return poss
     legs = legs_positions()
-    print('Пройдите от левого края до правого, избегая ног паука (помечены X).')
+    out('Пройдите от левого края до правого, избегая ног паука (помечены X).')
     press_enter()
     while True:
         clear()
+        lines = []
         for r in range(size):
             line = ''
             for c in range(size):
@@ -2385,11 +2466,12 @@ def spider_game():
                 elif [r,c] == spider: line += 'S '
                 elif [r,c] in legs: line += 'X '
                 else: line += '. '
-            print(line)
+            lines.append(line)
+        out('\n'.join(lines))
         if player[1] >= size-1:
-            print('Вы добрались до края сети. Успех!')
+            out('Вы добрались до края сети. Успех!')
             break
-        cmd = input('Ход (w/a/s/d, q выход): ').strip().lower()
+        cmd = ask('Ход (w/a/s/d, q выход): ').strip().lower()
         if cmd == 'q' or cmd == '':
             break
         if cmd == 'w' and player[0]>0: player[0]-=1
@@ -2398,16 +2480,16 @@ def spider_game():
         if cmd == 'd' and player[1]<size-1: player[1]+=1
         # check if on leg
         if player in legs:
-            print('Вы наступили на ногу паука — он укусил! Вы проиграли.')
+            out('Вы наступили на ногу паука — он укусил! Вы проиграли.')
             press_enter()
             return
         # occasional spider move/shuffle legs
-        if random.random() < 0.2:
+        if rng.random() < 0.2:
             # spider shifts one cell randomly
-            spider[0] = min(size-1, max(0, spider[0] + random.choice([-1,0,1])))
-            spider[1] = min(size-1, max(0, spider[1] + random.choice([-1,0,1])))
+            spider[0] = min(size-1, max(0, spider[0] + rng.choice([-1,0,1])))
+            spider[1] = min(size-1, max(0, spider[1] + rng.choice([-1,0,1])))
             legs = legs_positions()
-        time.sleep(0.2)
+        sleep(0.2)
     press_enter()
 
 # -----------------------
@@ -2416,32 +2498,32 @@ def spider_game():
 # -----------------------
 def birthday_game():
     clear()
-    print('=== День рождения ===')
+    out('=== День рождения ===')
     days = 1
     mood = 5
     tasks = ['cake','music','guests','decor']
     completed = []
-    print('Подготовьте праздник: выполните задачи для повышения настроения.')
+    out('Подготовьте праздник: выполните задачи для повышения настроения.')
     press_enter()
     for t in tasks:
         clear()
-        print('Текущая задача:', t)
-        act = input('Действие: do / skip (Enter skip): ').strip().lower()
+        out('Текущая задача:', t)
+        act = ask('Действие: do / skip (Enter skip): ').strip().lower()
         if act == 'do':
-            success = random.random() < 0.8
+            success = rng.random() < 0.8
             if success:
                 mood += 1
                 completed.append(t)
-                print('Успешно выполнено!')
+                out('Успешно выполнено!')
             else:
                 mood -= 1
-                print('Задача прошла не идеально.')
+                out('Задача прошла не идеально.')
         else:
-            print('Пропуск.')
-        time.sleep(0.6)
+            out('Пропуск.')
+        sleep(0.6)
     clear()
-    print('Праздник готов! Выполнено:', ', '.join(completed))
-    print('Итоговое настроение гостей:', mood)
+    out('Праздник готов! Выполнено:', ', '.join(completed))
+    out('Итоговое настроение гостей:', mood)
     press_enter()
 
 # -----------------------
@@ -2450,31 +2532,31 @@ def birthday_game():
 # -----------------------
 def dentist_game():
     clear()
-    print('=== Стоматолог ===')
+    out('=== Стоматолог ===')
     rounds = input_int('Сколько процедур (по умолчанию 4): ', 1) or 4
     score = 0
-    print('Реагируйте когда услышите "DRILL!" — нажмите Enter как можно быстрее.')
+    out('Реагируйте когда услышите "DRILL!" — нажмите Enter как можно быстрее.')
     press_enter()
     for i in range(rounds):
         clear()
-        wait = random.uniform(0.8, 2.5)
-        print('Ожидайте сигнал...')
-        time.sleep(wait)
-        t0 = time.time()
-        print('DRILL! Нажмите Enter!')
-        input()
-        dt = time.time() - t0
-        print(f'Ваша реакция: {dt:.3f}s')
+        wait = rng.uniform(0.8, 2.5)
+        out('Ожидайте сигнал...')
+        sleep(wait)
+        t0 = now()
+        out('DRILL! Нажмите Enter!')
+        ask()
+        dt = now() - t0
+        out(f'Ваша реакция: {dt:.3f}s')
         if dt < 0.35:
             score += 2
-            print('Отлично — быстро.')
+            out('Отлично — быстро.')
         elif dt < 0.7:
             score += 1
-            print('Нормально.')
+            out('Нормально.')
         else:
-            print('Медленно; неприятно.')
-        time.sleep(0.6)
-    print('Результат процедур, очки:', score)
+            out('Медленно; неприятно.')
+        sleep(0.6)
+    out('Результат процедур, очки:', score)
     press_enter()
 
 # -----------------------
@@ -2483,43 +2565,43 @@ def dentist_game():
 # -----------------------
 def aquaphobia():
     clear()
-    print('=== Аквафобия ===')
+    out('=== Аквафобия ===')
     breath = 10
     panic = 0
     oxygen_sources = 3
     rounds = input_int('Сколько шагов (по умолчанию 8): ', 3) or 8
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}. Дыхание: {breath}, Паника: {panic}, Источников O2: {oxygen_sources}')
-        action = input('Действия: calm (умиротвориться), search (искать кислород), swim (двигаться вперед) [c/s/w]: ').strip().lower()
+        out(f'Раунд {r}/{rounds}. Дыхание: {breath}, Паника: {panic}, Источников O2: {oxygen_sources}')
+        action = ask('Действия: calm (умиротвориться), search (искать кислород), swim (двигаться вперед) [c/s/w]: ').strip().lower()
         if action == 'c':
             panic = max(0, panic - 1)
             breath = min(10, breath + 1)
-            print('Вы стараетесь успокоиться.')
+            out('Вы стараетесь успокоиться.')
         elif action == 's':
-            if oxygen_sources > 0 and random.random() < 0.6:
+            if oxygen_sources > 0 and rng.random() < 0.6:
                 oxygen_sources -= 1
                 breath = min(10, breath + 3)
-                print('Нашли пузырь воздуха!')
+                out('Нашли пузырь воздуха!')
             else:
                 breath = max(0, breath - 1)
                 panic += 1
-                print('Поиск не дал результата.')
+                out('Поиск не дал результата.')
         else:
             # swim
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 breath = max(0, breath - 1)
-                print('Вы продвинулись.')
+                out('Вы продвинулись.')
             else:
                 panic += 1
                 breath = max(0, breath - 2)
-                print('Затруднение при плавании.')
+                out('Затруднение при плавании.')
         if breath <= 0 or panic >= 10:
-            print('Паника/удушье привели к потере сознания.')
+            out('Паника/удушье привели к потере сознания.')
             press_enter()
             return
-        time.sleep(0.6)
-    print('Вы пережили этот водный ужас. Поздравляем.')
+        sleep(0.6)
+    out('Вы пережили этот водный ужас. Поздравляем.')
     press_enter()
 
 # -----------------------
@@ -2528,38 +2610,38 @@ def aquaphobia():
 # -----------------------
 def arachnophobia():
     clear()
-    print('=== Арахнофобия ===')
+    out('=== Арахнофобия ===')
     rooms = input_int('Число комнат (по умолчанию 8): ', 3) or 8
     player = 0
     courage = 5
     while player < rooms:
         clear()
-        print(f'Комната {player+1}/{rooms}. Смелость: {courage}/10')
-        has_spider = random.random() < 0.5
+        out(f'Комната {player+1}/{rooms}. Смелость: {courage}/10')
+        has_spider = rng.random() < 0.5
         if has_spider:
-            print('В комнате паук!')
-            choice = input('Confront or avoid? (c/a): ').strip().lower()
+            out('В комнате паук!')
+            choice = ask('Confront or avoid? (c/a): ').strip().lower()
             if choice == 'c':
                 # chance to kill spider and increase courage
-                if random.random() < 0.6:
+                if rng.random() < 0.6:
                     courage = min(10, courage+1)
-                    print('Вы убили паука. Отвага +1.')
+                    out('Вы убили паука. Отвага +1.')
                 else:
                     courage = max(0, courage-2)
-                    print('Паук испугал вас — смелость -2.')
+                    out('Паук испугал вас — смелость -2.')
             else:
                 # avoid reduces progress but safe
-                print('Вы обошли комнату стороной.')
+                out('Вы обошли комнату стороной.')
                 player += 0  # no advance
         else:
-            print('Пустая комната. Можете пройти.')
+            out('Пустая комната. Можете пройти.')
             player += 1
-        time.sleep(0.6)
+        sleep(0.6)
         if courage <= 0:
-            print('Страх превзошёл вас. Игра окончена.')
+            out('Страх превзошёл вас. Игра окончена.')
             press_enter()
             return
-    print('Вы прошли все комнаты. Отлично!')
+    out('Вы прошли все комнаты. Отлично!')
     press_enter()
 
 # -----------------------
@@ -2568,42 +2650,42 @@ def arachnophobia():
 # -----------------------
 def claustrophobia():
     clear()
-    print('=== Клаустрофобия ===')
+    out('=== Клаустрофобия ===')
     size = input_int('Начальный объём (единиц, по умолчанию 10): ', 3) or 10
     space = size
     health = 10
     while space > 0 and health > 0:
         clear()
-        print(f'Текущее пространство: {space}, здоровье: {health}')
-        action = input('Действие: expand (попытаться расширить), conserve (экономить) [e/c]: ').strip().lower()
+        out(f'Текущее пространство: {space}, здоровье: {health}')
+        action = ask('Действие: expand (попытаться расширить), conserve (экономить) [e/c]: ').strip().lower()
         if action == 'e':
-            if random.random() < 0.5:
-                gained = random.randint(1,3)
+            if rng.random() < 0.5:
+                gained = rng.randint(1,3)
                 space += gained
-                print(f'Удачно! Площадь +{gained}.')
+                out(f'Удачно! Площадь +{gained}.')
             else:
                 health -= 1
-                print('Попытка привела к травме: -1 здоровья.')
+                out('Попытка привела к травме: -1 здоровья.')
         else:
             # conserve: reduce damage but space shrinks slower
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 space -= 1
-                print('Вы сжались — пространство уменьшилось немного.')
+                out('Вы сжались — пространство уменьшилось немного.')
             else:
                 space -= 2
                 health -= 1
-                print('Сокращение пространства болезненно.')
+                out('Сокращение пространства болезненно.')
         # natural shrink
         space -= 1
         if space <= 0:
-            print('Пространство сократилось — вы зажаты.')
+            out('Пространство сократилось — вы зажаты.')
             press_enter()
             return
-        time.sleep(0.6)
+        sleep(0.6)
     if health > 0:
-        print('Вы выжили в тесноте и нашли выход.')
+        out('Вы выжили в тесноте и нашли выход.')
     else:
-        print('Вы не смогли выдержать — конец.')
+        out('Вы не смогли выдержать — конец.')
     press_enter()
 # -----------------------
 # 1) Lumber Jack
@@ -2611,26 +2693,26 @@ def claustrophobia():
 # -----------------------
 def lumber_jack():
     clear()
-    print('=== Lumber Jack ===')
+    out('=== Lumber Jack ===')
     chops_needed = input_int('Сколько рубок требуется (по умолчанию 10): ', 1) or 10
     time_limit = input_int('Время в секундах (по умолчанию 8): ', 1) or 8
-    print(f'У вас {time_limit} секунд чтобы сделать {chops_needed} рубок (нажимайте Enter).')
+    out(f'У вас {time_limit} секунд чтобы сделать {chops_needed} рубок (нажимайте Enter).')
     press_enter()
-    start = time.time()
+    start = now()
     chops = 0
-    while time.time() - start < time_limit and chops < chops_needed:
+    while now() - start < time_limit and chops < chops_needed:
         try:
-            input()
+            ask()
         except KeyboardInterrupt:
             break
         chops += 1
-        print(f'Рубка #{chops}')
-    elapsed = time.time() - start
+        out(f'Рубка #{chops}')
+    elapsed = now() - start
     if chops >= chops_needed:
-        print('Вы успели! Дровосек победил.')
+        out('Вы успели! Дровосек победил.')
     else:
-        print('Не успели. Сделано', chops)
-    print(f'Время: {elapsed:.2f}s')
+        out('Не успели. Сделано', chops)
+    out(f'Время: {elapsed:.2f}s')
     press_enter()
 
 # -----------------------
@@ -2639,25 +2721,25 @@ def lumber_jack():
 # -----------------------
 def pizza_memory():
     clear()
-    print('=== Pizza Memory ===')
+    out('=== Pizza Memory ===')
     toppings = ['cheese','tomato','mushroom','pepperoni','olive','onion','basil']
     level = input_int('Уровней (по умолчанию 5): ', 1) or 5
     seq = []
     for lv in range(1, level+1):
-        seq.append(random.choice(toppings))
+        seq.append(rng.choice(toppings))
         clear()
-        print(f'Уровень {lv}: запомните последовательность:')
-        print(' '.join(seq))
-        time.sleep(max(1.0, 2.0 - lv*0.1))
+        out(f'Уровень {lv}: запомните последовательность:')
+        out(' '.join(seq))
+        sleep(max(1.0, 2.0 - lv*0.1))
         clear()
-        ans = input('Введите последовательность через пробел: ').strip().lower().split()
+        ans = ask('Введите последовательность через пробел: ').strip().lower().split()
         if ans != seq:
-            print('Неверно. Правильная была:', ' '.join(seq))
+            out('Неверно. Правильная была:', ' '.join(seq))
             press_enter()
             return
-        print('Верно!')
-        time.sleep(0.6)
-    print('Вы прошли все уровни пицца-памяти. Молодец!')
+        out('Верно!')
+        sleep(0.6)
+    out('Вы прошли все уровни пицца-памяти. Молодец!')
     press_enter()
 
 # -----------------------
@@ -2666,25 +2748,25 @@ def pizza_memory():
 # -----------------------
 def food_memory():
     clear()
-    print('=== Food Memory ===')
+    out('=== Food Memory ===')
     foods = ['apple','banana','bread','cheese','cake','egg','fish','tomato']
     rounds = input_int('Раундов (по умолчанию 6): ', 1) or 6
     seq = []
     for r in range(rounds):
-        seq.append(random.choice(foods))
+        seq.append(rng.choice(foods))
         clear()
-        print('Запомните:')
-        print(' '.join(seq))
-        time.sleep(1.5)
+        out('Запомните:')
+        out(' '.join(seq))
+        sleep(1.5)
         clear()
-        ans = input('Введите через пробел: ').strip().lower().split()
+        ans = ask('Введите через пробел: ').strip().lower().split()
         if ans != seq:
-            print('Промах. Правильно:', ' '.join(seq))
+            out('Промах. Правильно:', ' '.join(seq))
             press_enter()
             return
-        print('OK')
-        time.sleep(0.4)
-    print('Вы отличны запомнили еду!')
+        out('OK')
+        sleep(0.4)
+    out('Вы отличны запомнили еду!')
     press_enter()
 
 # -----------------------
@@ -2693,26 +2775,26 @@ def food_memory():
 # -----------------------
 def sound_memory():
     clear()
-    print('=== Sound Memory ===')
+    out('=== Sound Memory ===')
     sounds = ['beep','boop','ding','buzz','click','tock']
     rounds = input_int('Раундов (по умолчанию 5): ', 1) or 5
     seq = []
     for r in range(rounds):
-        seq.append(random.choice(sounds))
+        seq.append(rng.choice(sounds))
         clear()
-        print('Sequence:')
+        out('Sequence:')
         for s in seq:
-            print(s.upper())
-            time.sleep(0.6)
+            out(s.upper())
+            sleep(0.6)
             clear()
-        ans = input('Введите последовательность через пробел: ').strip().lower().split()
+        ans = ask('Введите последовательность через пробел: ').strip().lower().split()
         if ans != seq:
-            print('Неправильно. Правильно:', ' '.join(seq))
+            out('Неправильно. Правильно:', ' '.join(seq))
             press_enter()
             return
-        print('Верно.')
-        time.sleep(0.5)
-    print('Вы прошли Sound Memory!')
+        out('Верно.')
+        sleep(0.5)
+    out('Вы прошли Sound Memory!')
     press_enter()
 
 # -----------------------
@@ -2720,35 +2802,30 @@ def sound_memory():
 # -----------------------
 def memory_classic():
     clear()
-    print('=== Memory (Pairs) ===')
+    out('=== Memory (Pairs) ===')
     size = input_int('Количество пар (по умолчанию 6): ', 2) or 6
     cards = list(range(size)) * 2
-    random.shuffle(cards)
+    rng.shuffle(cards)
     revealed = [False]*len(cards)
     tries = 0
     while not all(revealed):
         clear()
-        print('Карты:')
-        for i, val in enumerate(cards):
-            if revealed[i]:
-                print(f'[{val}]', end=' ')
-            else:
-                print(f'[{i}]', end=' ')
-        print()
+        out('Карты:')
+        out(' '.join(f'[{val}]' if revealed[i] else f'[{i}]' for i, val in enumerate(cards)))
         a = input_int('Выберите карту A (индекс): ', 0, len(cards)-1)
         b = input_int('Выберите карту B (индекс): ', 0, len(cards)-1)
         if a is None or b is None or a==b:
-            print('Неверный выбор.')
-            time.sleep(0.6)
+            out('Неверный выбор.')
+            sleep(0.6)
             continue
         tries += 1
         if cards[a] == cards[b]:
-            print('Пара! (',cards[a],')')
+            out('Пара! (',cards[a],')')
             revealed[a]=revealed[b]=True
         else:
-            print('Не пара:', cards[a], cards[b])
-        time.sleep(0.8)
-    print('Всё открыто! Попыток:', tries)
+            out('Не пара:', cards[a], cards[b])
+        sleep(0.8)
+    out('Всё открыто! Попыток:', tries)
     press_enter()
 
 # -----------------------
@@ -2757,7 +2834,7 @@ def memory_classic():
 # -----------------------
 def liars_bar():
     clear()
-    print('=== Liar\'s Bar ===')
+    out('=== Liar\'s Bar ===')
     drinks = ['Mojito','Coffee','Tea','Beer','Wine','Smoothie']
     rounds = input_int('Раундов (по умолчанию 6): ', 1) or 6
     score = 0
@@ -2770,26 +2847,26 @@ def liars_bar():
         'Smoothie': ['fruit','blender','cold']
     }
     for r in range(rounds):
-        drink = random.choice(drinks)
-        real_fact = random.choice(facts_database[drink])
-        lie = random.choice(['contains nuts','served frozen','made of stone','contains sugar'])  # generic lies
+        drink = rng.choice(drinks)
+        real_fact = rng.choice(facts_database[drink])
+        lie = rng.choice(['contains nuts','served frozen','made of stone','contains sugar'])  # generic lies
         # randomly choose to present true or false statement
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             statement = f'{drink} contains {real_fact}'
             truth = True
         else:
             statement = f'{drink} {lie}'
             truth = False
         clear()
-        print('Бармен: "', statement, '"')
-        ans = input('Правда или ложь? (t/f): ').strip().lower()
+        out('Бармен: "', statement, '"')
+        ans = ask('Правда или ложь? (t/f): ').strip().lower()
         if (ans == 't' and truth) or (ans == 'f' and not truth):
-            print('Вы правы!')
+            out('Вы правы!')
             score += 1
         else:
-            print('Ошибаетесь.')
-        time.sleep(0.6)
-    print('Итоговый счёт:', score)
+            out('Ошибаетесь.')
+        sleep(0.6)
+    out('Итоговый счёт:', score)
     press_enter()
 
 # -----------------------
@@ -2798,7 +2875,7 @@ def liars_bar():
 # -----------------------
 def hitman():
     clear()
-    print('=== Hitman ===')
+    out('=== Hitman ===')
     suspects = ['A','B','C','D']
     traits = {
         'A': {'hat':True, 'scar':False},
@@ -2806,19 +2883,19 @@ def hitman():
         'C': {'hat':True, 'scar':True},
         'D': {'hat':False,'scar':False},
     }
-    clue = random.choice([
+    clue = rng.choice([
         ('killer wore hat', lambda s: s['hat']),
         ('killer has scar', lambda s: s['scar']),
     ])
     clear()
-    print('Улики: ', clue[0])
+    out('Улики: ', clue[0])
     possible = [k for k,v in traits.items() if clue[1](v)]
-    print('Кто это может быть?', ', '.join(suspects))
-    choice = input('Выберите подозреваемого: ').strip().upper()
+    out('Кто это может быть?', ', '.join(suspects))
+    choice = ask('Выберите подозреваемого: ').strip().upper()
     if choice in possible:
-        print('Успешно — вы нашли цель.')
+        out('Успешно — вы нашли цель.')
     else:
-        print('Промах — неверный выбор. Возможные:', ', '.join(possible))
+        out('Промах — неверный выбор. Возможные:', ', '.join(possible))
     press_enter()
 
 # -----------------------
@@ -2827,24 +2904,24 @@ def hitman():
 # -----------------------
 def true_or_false():
     clear()
-    print('=== True or False ===')
+    out('=== True or False ===')
     Q = [
         ('The Earth orbits the Sun', True),
         ('Python is a snake only', False),
         ('Water boils at 100C at sea level', True),
         ('Humans can breathe in outer space without aid', False),
     ]
-    random.shuffle(Q)
+    rng.shuffle(Q)
     score = 0
     for stmt, truth in Q:
-        ans = input(f'{stmt} (t/f): ').strip().lower()
+        ans = ask(f'{stmt} (t/f): ').strip().lower()
         if (ans=='t' and truth) or (ans=='f' and not truth):
             score += 1
-            print('OK')
+            out('OK')
         else:
-            print('Wrong')
-        time.sleep(0.4)
-    print('Score:', score, '/', len(Q))
+            out('Wrong')
+        sleep(0.4)
+    out('Score:', score, '/', len(Q))
     press_enter()
 
 # -----------------------
@@ -2854,7 +2931,7 @@ def true_or_false():
 # -----------------------
 def death_columns():
     clear()
-    print('=== Death Columns ===')
+    out('=== Death Columns ===')
     cols = input_int('Кол-во колонн (по умолчанию 5): ', 2) or 5
     limit = input_int('Макс высота до смерти (по умолчанию 6): ', 3) or 6
     heights = [0]*cols
@@ -2862,15 +2939,15 @@ def death_columns():
     while True:
         turn += 1
         clear()
-        print('Turn', turn)
-        print('Heights:', heights)
+        out('Turn', turn)
+        out('Heights:', heights)
         # new blocks fall
         for i in range(cols):
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 heights[i] += 1
-        print('После падения:', heights)
+        out('После падения:', heights)
         if any(h >= limit for h in heights):
-            print('Одна колонна достигла лимита. Game over.')
+            out('Одна колонна достигла лимита. Game over.')
             press_enter()
             return
         # player removes a column piece
@@ -2878,12 +2955,12 @@ def death_columns():
         if rem is not None:
             if heights[rem] > 0:
                 heights[rem] -= 1
-                print('Уменьшили колонну', rem)
+                out('Уменьшили колонну', rem)
             else:
-                print('Колонна уже пуста.')
+                out('Колонна уже пуста.')
         else:
-            print('Пропуск.')
-        time.sleep(0.6)
+            out('Пропуск.')
+        sleep(0.6)
 
 # -----------------------
 # 10) Guess the Word
@@ -2891,33 +2968,33 @@ def death_columns():
 # -----------------------
 def guess_the_word():
     clear()
-    print('=== Guess the Word ===')
+    out('=== Guess the Word ===')
     words = ['python','banana','puzzle','guitar','suspicious','memory', "fight", "lumber", "movie", "baker", "hospital", "nurse", "down", "righty", "cursor", "mouse", "turbowarp", "scratch", "csharp", "common"]
-    word = random.choice(words)
+    word = rng.choice(words)
     guessed = set()
     attempts = 7
     while attempts > 0:
         display = ''.join(ch if ch in guessed else '_' for ch in word)
-        print('Word:', display)
+        out('Word:', display)
         if all(ch in guessed for ch in word):
-            print('Вы угадали слово!', word)
+            out('Вы угадали слово!', word)
             press_enter()
             return
-        ch = input('Введите букву: ').strip().lower()
+        ch = ask('Введите букву: ').strip().lower()
         if not ch or len(ch)!=1:
-            print('Введите одну букву.')
+            out('Введите одну букву.')
             continue
         if ch in guessed:
-            print('Уже пробовали.')
+            out('Уже пробовали.')
             continue
         if ch in word:
             guessed.add(ch)
-            print('Есть такая буква!')
+            out('Есть такая буква!')
         else:
             attempts -= 1
-            print('Неправильно. Осталось попыток:', attempts)
-        time.sleep(0.4)
-    print('Попытки закончились. Слово было:', word)
+            out('Неправильно. Осталось попыток:', attempts)
+        sleep(0.4)
+    out('Попытки закончились. Слово было:', word)
     press_enter()
 
 # -----------------------
@@ -2926,11 +3003,11 @@ def guess_the_word():
 # -----------------------
 def whos_sus():
     clear()
-    print('=== Who\'s SUS? ===')
+    out('=== Who\'s SUS? ===')
     n = input_int('Игроков (включая вас) (по умолчанию 7): ', 3) or 7
     players = ['You'] + [f'P{i}' for i in range(1,n)]
-    impostor = random.choice(players)
-    print('В игре один самозванец. Соберите доказательства и голосуйте.')
+    impostor = rng.choice(players)
+    out('В игре один самозванец. Соберите доказательства и голосуйте.')
     press_enter()
     # quick clue rounds
     clues = {p:0 for p in players}
@@ -2938,36 +3015,36 @@ def whos_sus():
         for p in players:
             if p == impostor:
                 # impostor sometimes suspicious
-                if random.random() < 0.6:
+                if rng.random() < 0.6:
                     clues[p] += 1
             else:
-                if random.random() < 0.2:
+                if rng.random() < 0.2:
                     clues[p] += 1
     # show clues count to player
-    print('Подсчёт подозрительности (для наглядности):')
+    out('Подсчёт подозрительности (для наглядности):')
     for p in players:
-        print(p, 'suspicion:', clues[p])
+        out(p, 'suspicion:', clues[p])
     # vote
     votes = {p:0 for p in players}
     for p in players:
         if p == 'You':
-            choice = input('За кого голосуете?: ').strip()
+            choice = ask('За кого голосуете?: ').strip()
             if choice not in votes:
-                choice = random.choice([x for x in players if x!='You'])
-                print('Неверный ввод, выбран:', choice)
+                choice = rng.choice([x for x in players if x!='You'])
+                out('Неверный ввод, выбран:', choice)
             votes[choice] += 1
         else:
             # NPC votes for highest suspicion (with some randomness)
             max_sus = max(clues.values())
             candidates = [pl for pl, s in clues.items() if s == max_sus and pl != p]
-            pick = random.choice(candidates) if candidates else random.choice([pl for pl in players if pl!=p])
+            pick = rng.choice(candidates) if candidates else rng.choice([pl for pl in players if pl!=p])
             votes[pick] += 1
     result = sorted(votes.items(), key=lambda x: -x[1])[0][0]
-    print('Голосование завершено. Выбывший:', result)
+    out('Голосование завершено. Выбывший:', result)
     if result == impostor:
-        print('Импостор найден! Мирные победили.')
+        out('Импостор найден! Мирные победили.')
     else:
-        print('Увы, ошиблись. Импостор остался.')
+        out('Увы, ошиблись. Импостор остался.')
     press_enter()
 
 # -----------------------
@@ -2976,16 +3053,16 @@ def whos_sus():
 # -----------------------
 def mafia_game():
     clear()
-    print('=== Мафия ===')
+    out('=== Мафия ===')
     n = input_int('Игроков (включая вас) (по умолчанию 7): ', 5) or 7
     names = ['You'] + [f'P{i}' for i in range(1, n)]
     roles = {}
     # Assign roles: 1 mafia (maybe you), 1 detective, 1 doctor, rest town
-    mafia = random.choice(names)
+    mafia = rng.choice(names)
     remaining = [p for p in names if p != mafia]
-    detective = random.choice(remaining)
+    detective = rng.choice(remaining)
     remaining = [p for p in remaining if p != detective]
-    doctor = random.choice(remaining)
+    doctor = rng.choice(remaining)
     for p in names:
         if p == mafia:
             roles[p] = 'Mafia'
@@ -3003,73 +3080,73 @@ def mafia_game():
         maf_count = sum(1 for p in alive if roles[p]=='Mafia')
         town_count = sum(1 for p in alive if roles[p]!='Mafia')
         if maf_count == 0:
-            print('Мафия уничтожена. Горожане победили!')
+            out('Мафия уничтожена. Горожане победили!')
             press_enter()
             return
         if maf_count >= town_count:
-            print('Мафия взяла верх. Мафия победила.')
+            out('Мафия взяла верх. Мафия победила.')
             press_enter()
             return
         clear()
-        print(f'Ночь {day}. Живые: {", ".join(sorted(alive))}')
+        out(f'Ночь {day}. Живые: {", ".join(sorted(alive))}')
         # Mafia chooses victim
         if mafia in alive:
             if mafia == 'You':
-                print('Вы — мафия. Выберите жертву:')
-                target = input('Имя жертвы: ').strip()
+                out('Вы — мафия. Выберите жертву:')
+                target = ask('Имя жертвы: ').strip()
                 if target not in alive or target == 'You':
-                    target = random.choice([p for p in alive if p!='You'])
-                    print('Неверное имя. Случайно выбран:', target)
+                    target = rng.choice([p for p in alive if p!='You'])
+                    out('Неверное имя. Случайно выбран:', target)
             else:
-                target = random.choice([p for p in alive if p != mafia])
-            print('Мафия выбрала жертву.')
+                target = rng.choice([p for p in alive if p != mafia])
+            out('Мафия выбрала жертву.')
         else:
             target = None
         # Doctor chooses to save
         if doctor in alive:
             if doctor == 'You':
-                save = input('Кого вы спасаете? (Enter - никого): ').strip()
+                save = ask('Кого вы спасаете? (Enter - никого): ').strip()
                 if save not in alive:
                     save = None
             else:
-                save = random.choice(list(alive))
+                save = rng.choice(list(alive))
         else:
             save = None
         # Detective checks
         if detective in alive:
             if detective == 'You':
-                check = input('Кого проверить? (Enter - пропустить): ').strip()
+                check = ask('Кого проверить? (Enter - пропустить): ').strip()
                 if check not in alive:
-                    print('Пропуск проверки.')
+                    out('Пропуск проверки.')
                 else:
-                    print(check, 'role is', roles[check])
+                    out(check, 'role is', roles[check])
             else:
-                chk = random.choice(list(alive))
+                chk = rng.choice(list(alive))
                 # NPC detective learns role but we don't show
         # resolve night
         if target and target != save:
-            print('Ночью убит:', target)
+            out('Ночью убит:', target)
             alive.remove(target)
         else:
-            print('Никто не погиб ночью.')
+            out('Никто не погиб ночью.')
         press_enter()
         # Day: vote to lynch
         clear()
-        print('День. Живые:', ', '.join(sorted(alive)))
+        out('День. Живые:', ', '.join(sorted(alive)))
         votes = {p:0 for p in alive}
         for voter in list(alive):
             if voter == 'You':
-                choice = input('За кого голосуете? ').strip()
+                choice = ask('За кого голосуете? ').strip()
                 if choice not in votes:
-                    choice = random.choice([p for p in alive if p!=voter])
-                    print('Неверный выбор, голос за', choice)
+                    choice = rng.choice([p for p in alive if p!=voter])
+                    out('Неверный выбор, голос за', choice)
             else:
                 # NPCs suspicious of those with role mafia more likely (but they don't know)
                 # random vote
-                choice = random.choice([p for p in alive if p!=voter])
+                choice = rng.choice([p for p in alive if p!=voter])
             votes[choice] += 1
         lynch = sorted(votes.items(), key=lambda x: -x[1])[0][0]
-        print('Выбывший по голосованию:', lynch)
+        out('Выбывший по голосованию:', lynch)
         if lynch in alive:
             alive.remove(lynch)
         press_enter()
@@ -3080,92 +3157,53 @@ def mafia_game():
 # -----------------------
 def living_world():
     clear()
-    print('=== Оживший мир ===')
+    out('=== Оживший мир ===')
     steps = input_int('Сколько шагов пройти? (по умолчанию 10): ', 1) or 10
     items = ['стул','фонарь','камень','дерево','часы','книга','мяч','окно']
     mood = 5
     for s in range(1, steps+1):
         clear()
-        item = random.choice(items)
-        print(f'Шаг {s}/{steps}. На пути вы встретили: {item}')
-        action = input('Действие: talk / ignore / touch (t/i/с): ').strip().lower()
+        item = rng.choice(items)
+        out(f'Шаг {s}/{steps}. На пути вы встретили: {item}')
+        action = ask('Действие: talk / ignore / touch (t/i/с): ').strip().lower()
         if action == 't' or action == 'talk':
-            if random.random() < 0.7:
+            if rng.random() < 0.7:
                 mood = min(10, mood + 1)
-                print(f'{item} ответил! Настроение +1.')
+                out(f'{item} ответил! Настроение +1.')
             else:
                 mood = max(0, mood - 1)
-                print(f'{item} молчит. Настроение -1.')
+                out(f'{item} молчит. Настроение -1.')
         elif action == 'с' or action == 'touch':
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 mood = max(0, mood - 2)
-                print(f'{item} ужалил вас! -2.')
+                out(f'{item} ужалил вас! -2.')
             else:
                 mood = min(10, mood + 0)
-                print(f'{item} тронулось — ничего особенного.')
+                out(f'{item} тронулось — ничего особенного.')
         else:
-            print('Вы прошли мимо.')
-        time.sleep(0.6)
-    print('Прогулка окончена. Настроение:', mood)
+            out('Вы прошли мимо.')
+        sleep(0.6)
+    out('Прогулка окончена. Настроение:', mood)
     press_enter()
 
-# -----------------------
-# 2) Русская рулетка
-# -----------------------
-def russian_roulette():
-    clear()
-    print('=== Русская рулетка ===')
-    chambers = input_int('Кол-во патронов в барабане (1..6, по умолчанию 6): ', 1, 6) or 6
-    bullets = input_int('Сколько патронов зарядить (по умолчанию 1): ', 0, chambers) or 1
-    players = input_int('Игроков (включая вас) (по умолчанию 3): ', 2) or 3
-    order = ['You'] + [f'P{i}' for i in range(2, players+1)]
-    idx = 0
-    chamber_positions = [0]*chambers
-    for _ in range(bullets):
-        pos = random.randrange(chambers)
-        chamber_positions[pos] = 1
-    while True:
-        current = order[idx % players]
-        print(f'Ход: {current}. Нажмите Enter чтобы крутнуть курок и нажать на спуск.')
-        input()
-        shot = random.choice(chamber_positions)
-        if shot == 1:
-            print(f'{current} убит!')
-            if current == 'You':
-                print('Вы проиграли.')
-                press_enter()
-                return
-            else:
-                order.remove(current)
-                players -= 1
-                idx = idx % players
-                if players == 1:
-                    print('Оставшийся игрок победил:', order[0])
-                    press_enter()
-                    return
-        else:
-            print(f'{current} жив.')
-            idx += 1
-        time.sleep(0.5)
-
 # -----------------------
 # 3) Интерпретация
 # Show ambiguous statement; player interprets; scoring random.
 # -----------------------
 def interpretation_game():
     clear()
-    print('=== Интерпретация ===')
+    out('=== Интерпретация ===')
     prompts = [
         'Кот сидит на крыше.',
         'Часы остановились на трёх.',
         'Дождь звучит как музыка.',
         'Окно смотрит на город.'
     ]
-    p = random.choice(prompts)
-    print('Фраза для интерпретации:', p)
-    ans = input('Расскажите вашу интерпретацию: ')
-    score = min(10, max(0, len(ans.split())//2 + random.randint(-1,2)))
-    print('Оценка интерпретации:', score, '/10')
+    p = rng.choice(prompts)
+    out('Фраза для интерпретации:', p)
+    ans = ask('Расскажите вашу интерпретацию: ')
+    score = min(10, max(0, len(ans.split())//2 + rng.randint(-1,2)))
+    out('Оценка интерпретации:', score, '/10')
     press_enter()
 
 # -----------------------
@@ -3174,28 +3212,28 @@ def interpretation_game():
 # -----------------------
 def reputation():
     clear()
-    print('=== Репутация ===')
+    out('=== Репутация ===')
     rep = 50  # 0..100
     rounds = input_int('Раундов (по умолчанию 6): ', 1) or 6
     for r in range(rounds):
         clear()
-        print(f'Репутация: {rep}/100')
-        scenario = random.choice([
+        out(f'Репутация: {rep}/100')
+        scenario = rng.choice([
             ('Помог человеку с сумкой', 10),
             ('Распространение слухов', -12),
             ('Пожертвование в фонд', 8),
             ('Опоздание на встречу', -5),
         ])
-        print('Событие:', scenario[0])
-        choice = input('Выбор: act / skip (a/s): ').strip().lower()
+        out('Событие:', scenario[0])
+        choice = ask('Выбор: act / skip (a/s): ').strip().lower()
         if choice == 'a':
             rep = min(100, rep + scenario[1])
-            print('Действие выполнено.')
+            out('Действие выполнено.')
         else:
             rep = max(0, rep - 3)
-            print('Вы пропустили — + последствий.')
-        time.sleep(0.6)
-    print('Финальная репутация:', rep)
+            out('Вы пропустили — + последствий.')
+        sleep(0.6)
+    out('Финальная репутация:', rep)
     press_enter()
 
 # -----------------------
@@ -3204,7 +3242,7 @@ def reputation():
 # -----------------------
 def tanks_game():
     clear()
-    print('=== Танки ===')
+    out('=== Танки ===')
     size = input_int('Размер поля (по умолчанию 7): ', 5) or 7
     player = [0, 0]
     enemy = [size-1, size-1]
@@ -3212,15 +3250,17 @@ def tanks_game():
     enemy_hp = 3
     while player_hp > 0 and enemy_hp > 0:
         clear()
+        lines = []
         for r in range(size):
             row = ''
             for c in range(size):
                 if [r,c] == player: row += 'P '
                 elif [r,c] == enemy: row += 'E '
                 else: row += '. '
-            print(row)
-        print(f'Your HP: {player_hp}  Enemy HP: {enemy_hp}')
-        cmd = input('move (w/a/s/d) or fire (f): ').strip().lower()
+            lines.append(row)
+        out('\n'.join(lines))
+        out(f'Your HP: {player_hp}  Enemy HP: {enemy_hp}')
+        cmd = ask('move (w/a/s/d) or fire (f): ').strip().lower()
         if cmd in ('w','a','s','d'):
             if cmd=='w' and player[0]>0: player[0]-=1
             if cmd=='s' and player[0]<size-1: player[0]+=1
@@ -3230,27 +3270,27 @@ def tanks_game():
             # fire: if enemy in same row or col within 2 cells -> hit
             if player[0]==enemy[0] and abs(player[1]-enemy[1])<=2 or player[1]==enemy[1] and abs(player[0]-enemy[0])<=2:
                 enemy_hp -= 1
-                print('Попадание!')
+                out('Попадание!')
             else:
-                print('Промах.')
+                out('Промах.')
         # enemy AI simple
-        if random.random() < 0.7:
+        if rng.random() < 0.7:
             # move towards
             if enemy[0] < player[0]: enemy[0]+=1
             elif enemy[0] > player[0]: enemy[0]-=1
             if enemy[1] < player[1]: enemy[1]+=1
             elif enemy[1] > player[1]: enemy[1]-=1
         else:
-            if random.random() < 0.5 and (enemy[0]==player[0] or enemy[1]==player[1]):
+            if rng.random() < 0.5 and (enemy[0]==player[0] or enemy[1]==player[1]):
                 # enemy fires
                 if enemy[0]==player[0] and abs(enemy[1]-player[1])<=2 or enemy[1]==player[1] and abs(enemy[0]-player[0])<=2:
                     player_hp -=1
-                    print('Враг попал в вас!')
-        time.sleep(0.5)
+                    out('Враг попал в вас!')
+        sleep(0.5)
     if player_hp>0:
-        print('Вы победили танковый бой!')
+        out('Вы победили танковый бой!')
     else:
-        print('Ваш танк уничтожен.')
+        out('Ваш танк уничтожен.')
     press_enter()
 
 # -----------------------
@@ -3259,16 +3299,16 @@ def tanks_game():
 # -----------------------
 def virus_simulator():
     clear()
-    print('=== Симулятор компьютерного вируса ===')
+    out('=== Симулятор компьютерного вируса ===')
     nodes = input_int('Число компьютеров в сети (по умолчанию 10): ', 3) or 10
-    infected = set([random.randrange(nodes)])
+    infected = set([rng.randrange(nodes)])
     protected = set()
     rounds = input_int('Раундов распространения (по умолчанию 8): ', 1) or 8
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}')
-        print('Инфицированы:', sorted(infected))
-        action = input('Вы можете патчить один комп или наблюдать (patch <id> / skip): ').strip().lower()
+        out(f'Раунд {r}/{rounds}')
+        out('Инфицированы:', sorted(infected))
+        action = ask('Вы можете патчить один комп или наблюдать (patch <id> / skip): ').strip().lower()
         if action.startswith('patch'):
             parts = action.split()
             if len(parts)==2 and parts[1].isdigit():
@@ -3277,27 +3317,27 @@ def virus_simulator():
                     protected.add(pid)
                     if pid in infected:
                         infected.remove(pid)
-                    print('Компонент патчен.')
+                    out('Компонент патчен.')
                 else:
-                    print('Неверный ID.')
+                    out('Неверный ID.')
             else:
-                print('Неверная команда.')
+                out('Неверная команда.')
         # spreading
         new_inf = set()
         for node in range(nodes):
             if node in infected:
                 # attempt to infect neighbors
                 for _ in range(2):
-                    target = random.randrange(nodes)
-                    if target not in protected and random.random() < 0.4:
+                    target = rng.randrange(nodes)
+                    if target not in protected and rng.random() < 0.4:
                         new_inf.add(target)
         infected |= new_inf
-        time.sleep(0.6)
+        sleep(0.6)
         if len(infected) == nodes:
-            print('Вирус захватил сеть полностью.')
+            out('Вирус захватил сеть полностью.')
             press_enter()
             return
-    print('Симуляция окончена. Инфицировано:', len(infected), 'из', nodes)
+    out('Симуляция окончена. Инфицировано:', len(infected), 'из', nodes)
     press_enter()
 
 # -----------------------
@@ -3306,47 +3346,47 @@ def virus_simulator():
 # -----------------------
 def construction_simulator():
     clear()
-    print('=== Симулятор стройки ===')
+    out('=== Симулятор стройки ===')
     progress = 0
     budget = 100
     workers = 5
     days = input_int('Сколько дней вести стройку? (по умолчанию 10): ', 1) or 10
     for d in range(1, days+1):
         clear()
-        print(f'День {d}/{days}. Прогресс: {progress}%. Бюджет: {budget}. Рабочих: {workers}')
-        action = input('Действие: hire / fire / invest / work (h/f/i/w): ').strip().lower()
+        out(f'День {d}/{days}. Прогресс: {progress}%. Бюджет: {budget}. Рабочих: {workers}')
+        action = ask('Действие: hire / fire / invest / work (h/f/i/w): ').strip().lower()
         if action == 'h':
             cost = 10
             if budget >= cost:
                 workers += 1
                 budget -= cost
-                print('Наняли рабочего.')
+                out('Наняли рабочего.')
             else:
-                print('Не хватает бюджета.')
+                out('Не хватает бюджета.')
         elif action == 'f':
             if workers > 1:
                 workers -= 1
-                print('Уволили рабочего.')
+                out('Уволили рабочего.')
             else:
-                print('Минимум рабочих уже.')
+                out('Минимум рабочих уже.')
         elif action == 'i':
             invest = min(budget, 20)
             budget -= invest
             progress += invest//2
-            print('Инвестировали', invest)
+            out('Инвестировали', invest)
         else:
             # work
-            gained = workers * random.randint(1,3)
+            gained = workers * rng.randint(1,3)
             progress += gained
-            budget += workers * random.randint(0,2)
-            print('Работа продвинулась на', gained)
+            budget += workers * rng.randint(0,2)
+            out('Работа продвинулась на', gained)
         progress = min(100, progress)
-        time.sleep(0.5)
+        sleep(0.5)
         if progress >= 100:
-            print('Стройка завершена успешно!')
+            out('Стройка завершена успешно!')
             press_enter()
             return
-    print('Время закончилось. Прогресс:', progress)
+    out('Время закончилось. Прогресс:', progress)
     press_enter()
 
 # -----------------------
@@ -3355,34 +3395,34 @@ def construction_simulator():
 # -----------------------
 def school_simulator():
     clear()
-    print('=== Школа ===')
+    out('=== Школа ===')
     energy = 10
     knowledge = 0
     days = input_int('Дней в школе (по умолчанию 5): ', 1) or 5
     for d in range(1, days+1):
         clear()
-        print(f'День {d}/{days}. Энергия: {energy}. Знания: {knowledge}')
-        action = input('Учиться / Пропустить / Спать (study/skip/sleep): ').strip().lower()
+        out(f'День {d}/{days}. Энергия: {energy}. Знания: {knowledge}')
+        action = ask('Учиться / Пропустить / Спать (study/skip/sleep): ').strip().lower()
         if action == 'study':
             energy -= 2
-            knowledge += random.randint(1,4)
-            print('Вы учились.')
+            knowledge += rng.randint(1,4)
+            out('Вы учились.')
         elif action == 'sleep':
             energy = min(10, energy + 3)
-            print('Вы поспали.')
+            out('Вы поспали.')
         else:
             energy -= 1
-            print('Вы прогуливали.')
+            out('Вы прогуливали.')
         if energy <= 0:
-            print('Вы упали от усталости и пропустили экзамен.')
+            out('Вы упали от усталости и пропустили экзамен.')
             press_enter()
             return
-        time.sleep(0.5)
-    print('Экзамен! Знания:', knowledge)
+        sleep(0.5)
+    out('Экзамен! Знания:', knowledge)
     if knowledge >= 8:
-        print('Вы успешно сдали экзамен!')
+        out('Вы успешно сдали экзамен!')
     else:
-        print('Неуд — нужно больше учиться.')
+        out('Неуд — нужно больше учиться.')
     press_enter()
 
 # -----------------------
@@ -3391,19 +3431,19 @@ def school_simulator():
 # -----------------------
 def hard_math_quiz():
     clear()
-    print('=== Сложный Math Quiz ===')
+    out('=== Сложный Math Quiz ===')
     rounds = input_int('Вопросов (по умолчанию 7): ', 1) or 7
     score = 0
     ops = ['+','-','*','/','^']
     for _ in range(rounds):
-        a = random.randint(2,50)
-        b = random.randint(2,20)
-        op = random.choice(ops)
+        a = rng.randint(2,50)
+        b = rng.randint(2,20)
+        op = rng.choice(ops)
         if op == '^':
-            correct = a ** (random.randint(2,3))
+            correct = a ** (rng.randint(2,3))
             q = f'{a} ^ ? = {correct} (найдите степень?)'
             # ask exponent guess - simplified: ask power being 2 or 3
-            ans = input(q + ' Ваш ответ (число): ').strip()
+            ans = ask(q + ' Ваш ответ (число): ').strip()
             try:
                 if int(ans) in (2,3) and a**int(ans) == correct:
                     score += 1
@@ -3411,7 +3451,7 @@ def hard_math_quiz():
                 pass
         elif op == '/':
             correct = round(a / b, 3)
-            ans = input(f'{a} / {b} = ? (округлить до 3 знаков): ').strip()
+            ans = ask(f'{a} / {b} = ? (округлить до 3 знаков): ').strip()
             try:
                 if abs(float(ans) - correct) < 1e-3:
                     score += 1
@@ -3420,15 +3460,15 @@ def hard_math_quiz():
         else:
             expr = f'{a}{op}{b}'
             correct = eval(expr)
-            ans = input(f'{expr} = ').strip()
+            ans = ask(f'{expr} = ').strip()
             try:
                 if float(ans) == float(correct):
                     score += 1
             except:
                 pass
-        print('Текущий счёт:', score)
-        time.sleep(0.4)
-    print('Итоговый счёт:', score, '/', rounds)
+        out('Текущий счёт:', score)
+        sleep(0.4)
+    out('Итоговый счёт:', score, '/', rounds)
     press_enter()
 
 # -----------------------
@@ -3437,21 +3477,21 @@ def hard_math_quiz():
 # -----------------------
 def clicker():
     clear()
-    print('=== Кликер ===')
+    out('=== Кликер ===')
     target = input_int('Сколько кликов цель? (по умолчанию 50): ', 1) or 50
     score = 0
-    start = time.time()
-    print('Нажимайте Enter для клика. Ctrl+C чтобы выйти.')
+    start = now()
+    out('Нажимайте Enter для клика. Ctrl+C чтобы выйти.')
     try:
         while score < target:
-            input()
+            ask()
             score += 1
             if score % 10 == 0:
-                print('Кликов:', score)
+                out('Кликов:', score)
     except KeyboardInterrupt:
         pass
-    elapsed = time.time() - start
-    print(f'Готово! Клики: {score}. Время: {elapsed:.2f}s')
+    elapsed = now() - start
+    out(f'Готово! Клики: {score}. Время: {elapsed:.2f}s')
     press_enter()
 
 # -----------------------
@@ -3460,16 +3500,16 @@ def clicker():
 # -----------------------
 def timed_math_quiz():
     clear()
-    print('=== Math Quiz на время ===')
+    out('=== Math Quiz на время ===')
     tlimit = input_int('Время в секундах (по умолчанию 20): ', 5) or 20
-    start = time.time()
+    start = now()
     score = 0
-    while time.time() - start < tlimit:
-        a = random.randint(1,20)
-        b = random.randint(1,20)
-        op = random.choice(['+','-','*'])
+    while now() - start < tlimit:
+        a = rng.randint(1,20)
+        b = rng.randint(1,20)
+        op = rng.choice(['+','-','*'])
         correct = eval(f'{a}{op}{b}')
-        ans = input(f'{a} {op} {b} = ').strip()
+        ans = ask(f'{a} {op} {b} = ').strip()
         if ans == '':
             break
         try:
@@ -3477,7 +3517,7 @@ def timed_math_quiz():
                 score += 1
         except:
             pass
-    print('Время вышло или вы остановились. Очки:', score)
+    out('Время вышло или вы остановились. Очки:', score)
     press_enter()
 
 # -----------------------
@@ -3486,21 +3526,21 @@ def timed_math_quiz():
 # -----------------------
 def very_hard_math_quiz():
     clear()
-    print('=== Очень сложный Math Quiz ===')
+    out('=== Очень сложный Math Quiz ===')
     rounds = input_int('Вопросов (по умолчанию 5): ', 1) or 5
     score = 0
     for _ in range(rounds):
-        a = random.randint(100,999)
-        b = random.randint(10,99)
-        mod = random.randint(2,50)
+        a = rng.randint(100,999)
+        b = rng.randint(10,99)
+        mod = rng.randint(2,50)
         correct = (a * b) % mod
-        ans = input(f'({a} * {b}) mod {mod} = ').strip()
+        ans = ask(f'({a} * {b}) mod {mod} = ').strip()
         try:
             if int(ans) == correct:
                 score += 1
         except:
             pass
-    print('Счёт:', score, '/', rounds)
+    out('Счёт:', score, '/', rounds)
     press_enter()
 
 # -----------------------
@@ -3509,19 +3549,19 @@ def very_hard_math_quiz():
 # -----------------------
 def math_quiz_vs_players():
     clear()
-    print('=== Math Quiz но с другими игроками ===')
+    out('=== Math Quiz но с другими игроками ===')
     players = input_int('Сколько игроков включая вас? (по умолчанию 4): ', 2) or 4
     pnames = ['You'] + [f'P{i}' for i in range(2, players+1)]
     rounds = input_int('Раундов (по умолчанию 6): ', 1) or 6
     scores = {p:0 for p in pnames}
-    skills = {p: random.uniform(0.3,0.9) for p in pnames}
+    skills = {p: rng.uniform(0.3,0.9) for p in pnames}
     skills['You'] = 0.7  # default human skill estimate
     for r in range(rounds):
-        a,b = random.randint(1,50), random.randint(1,50)
+        a,b = rng.randint(1,50), rng.randint(1,50)
         correct = a + b
-        print(f'Вопрос {r+1}: {a} + {b} = ?')
+        out(f'Вопрос {r+1}: {a} + {b} = ?')
         # You answer
-        ans = input('Ваш ответ: ').strip()
+        ans = ask('Ваш ответ: ').strip()
         try:
             if int(ans) == correct:
                 scores['You'] += 1
@@ -3530,12 +3570,12 @@ def math_quiz_vs_players():
         # NPCs answer probabilistically
         for p in pnames:
             if p == 'You': continue
-            if random.random() < skills[p]:
+            if rng.random() < skills[p]:
                 scores[p] += 1
-        time.sleep(0.3)
-    print('Итоги:')
+        sleep(0.3)
+    out('Итоги:')
     for p in pnames:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # -----------------------
@@ -3544,7 +3584,7 @@ def math_quiz_vs_players():
 # -----------------------
 def planetarium():
     clear()
-    print('=== Планетарий ===')
+    out('=== Планетарий ===')
     facts = {
         'Mercury': 'closest to Sun',
         'Venus': 'hottest planet',
@@ -3556,13 +3596,13 @@ def planetarium():
         'Neptune': 'far blue'
     }
     for k,v in facts.items():
-        print(f'{k}: {v}')
-    q = random.choice(list(facts.items()))
-    ans = input(f'Вопрос: что за планета — "{q[1]}"? ').strip()
+        out(f'{k}: {v}')
+    q = rng.choice(list(facts.items()))
+    ans = ask(f'Вопрос: что за планета — "{q[1]}"? ').strip()
     if q[0].lower() == ans.lower():
-        print('Верно!')
+        out('Верно!')
     else:
-        print('Неверно. Правильный ответ:', q[0])
+        out('Неверно. Правильный ответ:', q[0])
     press_enter()
 
 # -----------------------
@@ -3571,28 +3611,28 @@ def planetarium():
 # -----------------------
 def living_planets():
     clear()
-    print('=== Ожившие планеты ===')
+    out('=== Ожившие планеты ===')
     planets = ['Mercury','Venus','Earth','Mars','Jupiter','Saturn']
-    moods = {p: random.randint(0,5) for p in planets}
+    moods = {p: rng.randint(0,5) for p in planets}
     turns = input_int('Раундов встречи (по умолчанию 6): ', 1) or 6
     for t in range(turns):
         clear()
-        p = random.choice(planets)
-        print(f'{p} [{moods[p]}/10] говорит: "..."')
-        action = input('Слушать / Игнорировать / Петь (l/i/s): ').strip().lower()
+        p = rng.choice(planets)
+        out(f'{p} [{moods[p]}/10] говорит: "..."')
+        action = ask('Слушать / Игнорировать / Петь (l/i/s): ').strip().lower()
         if action == 'l':
             moods[p] = min(10, moods[p]+2)
-            print(p, 'рады.')
+            out(p, 'рады.')
         elif action == 's':
             moods[p] = min(10, moods[p]+1)
-            print('Музыка понравилась.')
+            out('Музыка понравилась.')
         else:
             moods[p] = max(0, moods[p]-1)
-            print('Обида.')
-        time.sleep(0.6)
-    print('Итоги настроений:')
+            out('Обида.')
+        sleep(0.6)
+    out('Итоги настроений:')
     for p in planets:
-        print(p, moods[p])
+        out(p, moods[p])
     press_enter()
 
 # -----------------------
@@ -3601,19 +3641,19 @@ def living_planets():
 # -----------------------
 def stars_game():
     clear()
-    print('=== Звёзды ===')
+    out('=== Звёзды ===')
     constellations = {
         'Orion': ['Betelgeuse','Rigel','Bellatrix'],
         'Ursa Major': ['Dubhe','Merak','Phecda'],
         'Lyra': ['Vega','Sheliak']
     }
-    chosen = random.choice(list(constellations.items()))
-    print('Угадайте одну звезду из созвездия:', chosen[0])
-    ans = input('Введите имя звезды: ').strip()
+    chosen = rng.choice(list(constellations.items()))
+    out('Угадайте одну звезду из созвездия:', chosen[0])
+    ans = ask('Введите имя звезды: ').strip()
     if ans in chosen[1]:
-        print('Правильно!')
+        out('Правильно!')
     else:
-        print('Неверно. Варианты:', ', '.join(chosen[1]))
+        out('Неверно. Варианты:', ', '.join(chosen[1]))
     press_enter()
 
 # -----------------------
@@ -3622,20 +3662,20 @@ def stars_game():
 # -----------------------
 def shine_game():
     clear()
-    print('=== Блеск ===')
+    out('=== Блеск ===')
     gems = input_int('Сколько камней? (по умолчанию 3): ', 1) or 3
     shiny = [0]*gems
     target = 5
     while max(shiny) < target:
         clear()
-        print('Состояние камней:', shiny)
+        out('Состояние камней:', shiny)
         i = input_int(f'Какой камень отполировать (0..{gems-1}) (Enter выйти): ', 0, gems-1)
         if i is None:
             break
         shiny[i] += 1
-        print('Полируете...')
-        time.sleep(0.3)
-    print('Итог:', shiny)
+        out('Полируете...')
+        sleep(0.3)
+    out('Итог:', shiny)
     press_enter()
 
 # -----------------------
@@ -3652,42 +3692,42 @@ QUIZ_QS = [
 
 def quiz_basic(rounds=5, hard=False, timed=False, vs_players=1):
     clear()
-    print('=== Quiz ===')
+    out('=== Quiz ===')
     players = ['You'] + [f'P{i}' for i in range(2, vs_players+1)]
     scores = {p:0 for p in players}
-    start_time = time.time()
+    start_time = now()
     for i in range(rounds):
-        q,a = random.choice(QUIZ_QS if not hard else (QUIZ_QS + [
+        q,a = rng.choice(QUIZ_QS if not hard else (QUIZ_QS + [
             ('Кто открыл закон тяготения?', 'Ньютон'),
             ('sin(90°)=?', '1')
         ]))
         if timed:
             tlimit = 8
-            print(f'Время на ответ: {tlimit}s')
-            t0 = time.time()
-        print('Вопрос:', q)
+            out(f'Время на ответ: {tlimit}s')
+            t0 = now()
+        out('Вопрос:', q)
         # user input (timed or not)
         if timed:
             # simple timed input: allow pressing enter; we measure time after answer
-            ans = input('Ваш ответ: ').strip()
-            dt = time.time() - t0
+            ans = ask('Ваш ответ: ').strip()
+            dt = now() - t0
             if dt > tlimit:
-                print('Время вышло.')
+                out('Время вышло.')
                 ans = ''
         else:
-            ans = input('Ваш ответ: ').strip()
+            ans = ask('Ваш ответ: ').strip()
         if ans.lower() == a.lower():
             scores['You'] += 1
         # other players answer randomly with lower accuracy if many players
         for p in players:
             if p == 'You': continue
             prob = 0.6 if not hard else 0.35
-            if random.random() < prob:
+            if rng.random() < prob:
                 scores[p] += 1
-        time.sleep(0.4)
-    print('Результаты:')
+        sleep(0.4)
+    out('Результаты:')
     for p in players:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # Wrappers for quiz variants
@@ -3718,109 +3758,16 @@ def simulate_npc_choice(npc_name, choices, bias=None):
         if bias and c in bias:
             w += bias[c]
         # small variability based on npc "personality"
-        w *= random.uniform(0.7, 1.3)
+        w *= rng.uniform(0.7, 1.3)
         weights.append(w)
     total = sum(weights)
-    pick = random.random() * total
+    pick = rng.random() * total
     acc = 0
     for c, w in zip(choices, weights):
         acc += w
         if pick <= acc:
             return c
-    return random.choice(choices)
-
-# -----------------------
-# 1) Сапёр с другими игроками (multiplayer Minesweeper race)
-# Each player in turn reveals a cell on shared board; the one who hits mine is out.
-# Last remaining wins.
-# -----------------------
-def minesweeper_vs_players():
-    clear()
-    print('=== Сапёр с другими игроками ===')
-    n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
-    rows = input_int('Строки (по умолчанию 6): ', 3) or 6
-    cols = input_int('Столбцы (по умолчанию 8): ', 3) or 8
-    mines_count = input_int('Число мин (по умолчанию 8): ', 1, rows*cols-1) or 8
-    names = names_list(n)
-    board = [[0]*cols for _ in range(rows)]
-    mined = set()
-    # place mines
-    while len(mined) < mines_count:
-        r = random.randrange(rows); c = random.randrange(cols)
-        mined.add((r,c))
-    # compute numbers
-    for r in range(rows):
-        for c in range(cols):
-            if (r,c) in mined:
-                board[r][c] = -1
-            else:
-                cnt = 0
-                for dr in (-1,0,1):
-                    for dc in (-1,0,1):
-                        if dr==0 and dc==0: continue
-                        nr, nc = r+dr, c+dc
-                        if 0<=nr<rows and 0<=nc<cols and (nr,nc) in mined:
-                            cnt += 1
-                board[r][c] = cnt
-    revealed = [[False]*cols for _ in range(rows)]
-    alive = names[:]
-    turn = 0
-    while len(alive) > 1:
-        current = alive[turn % len(alive)]
-        clear()
-        print('Текущие игроки:', ', '.join(alive))
-        # display small part of board as indices
-        print('Карта (x,y): нераскрытые показаны индексом, раскрытые - число или M')
-        for r in range(rows):
-            line = ''
-            for c in range(cols):
-                if revealed[r][c]:
-                    line += f'{("M" if board[r][c]==-1 else board[r][c])} '
-                else:
-                    line += f'[{r},{c}] '
-            print(line)
-        print('Ход:', current)
-        if current == 'You':
-            sel_r = input_int('Выберите строку: ', 0, rows-1)
-            sel_c = input_int('Выберите столбец: ', 0, cols-1)
-            if sel_r is None or sel_c is None:
-                print('Пропуск хода.')
-                sel = None
-            else:
-                sel = (sel_r, sel_c)
-        else:
-            # NPC picks random unrevealed
-            choices = [(r,c) for r in range(rows) for c in range(cols) if not revealed[r][c]]
-            sel = random.choice(choices) if choices else None
-            print(f'{current} выбирает {sel}')
-            time.sleep(0.6)
-        if sel is None:
-            turn += 1
-            continue
-        r,c = sel
-        if revealed[r][c]:
-            print('Уже открыто — теряется ход.')
-            turn += 1
-            time.sleep(0.6)
-            continue
-        revealed[r][c] = True
-        if board[r][c] == -1:
-            print(f'Бах! {current} подорвался на мине и выбывает.')
-            alive.remove(current)
-            time.sleep(1.0)
-            # after mine explosion, continue with same next index (no increment)
-            # if current removed, turn remains same index
-            continue
-        else:
-            print(f'Открыто число: {board[r][c]}')
-        turn += 1
-        time.sleep(0.7)
-    clear()
-    if alive:
-        print('Победитель:', alive[0])
-    else:
-        print('Никто не остался жив.')
-    press_enter()
+    return rng.choice(choices)
 
 # -----------------------
 # 2) Догонялки с другими игроками (multiplayer chase)
@@ -3828,15 +3775,16 @@ def minesweeper_vs_players():
 # -----------------------
 def chase_vs_players():
     clear()
-    print('=== Догонялки с другими игроками ===')
+    out('=== Догонялки с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 5): ', 2) or 5
     length = input_int('Длина трека (по умолчанию 30): ', 10) or 30
     names = names_list(n)
     # choose chaser randomly
-    chaser = random.choice(names)
-    positions = {p: 0 for p in names}
+    chaser = rng.choice(names)
+    # убегающие стартуют с форой, иначе водящий ловит всех на первом же ходу
+    positions = {p: 0 if p == chaser else 5 for p in names}
     finished = set()
-    print('Chaser:', chaser)
+    out('Chaser:', chaser)
     press_enter()
     while True:
         for p in names:
@@ -3844,30 +3792,30 @@ def chase_vs_players():
                 continue
             if p == 'You':
                 # move choice: run or sneak
-                move = input('Ваш ход: run/sneak (r/s): ').strip().lower()
+                move = ask('Ваш ход: run/sneak (r/s): ').strip().lower()
                 if move == 'r':
-                    positions[p] += random.randint(2,4)
+                    positions[p] += rng.randint(2,4)
                 else:
-                    positions[p] += random.randint(0,2)
-            else:
+                    positions[p] += rng.randint(0,2)
+            elif p != chaser:
                 # NPC logic: if chaser close, run faster
                 dist = positions[chaser] - positions[p]
                 if dist >= -3:
-                    positions[p] += random.randint(1,3)
+                    positions[p] += rng.randint(1,3)
                 else:
-                    positions[p] += random.randint(0,2)
-            # chaser moves (if not current)
-            if p == chaser:
+                    positions[p] += rng.randint(0,2)
+            # водящий-NPC ходит только как водящий (за вас — ваш ход выше)
+            if p == chaser and p != 'You':
                 # chaser moves towards nearest target
                 targets = [q for q in names if q!=chaser and q not in finished]
                 if targets:
                     nearest = min(targets, key=lambda t: positions[chaser]-positions[t])
                     # move forward
-                    positions[chaser] += random.randint(2,4)
+                    positions[chaser] += rng.randint(2,4)
             # check catches
             for q in names:
                 if q != chaser and positions[chaser] >= positions[q] and q not in finished:
-                    print(f'{chaser} поймал {q}!')
+                    out(f'{chaser} поймал {q}!')
                     finished.add(q)
             # check finishers
             for q in names:
@@ -3877,12 +3825,12 @@ def chase_vs_players():
         # show status
         clear()
         for p in names:
-            print(p, positions[p], '(caught)' if p in finished else '')
-        time.sleep(0.6)
+            out(p, positions[p], '(caught)' if p in finished else '')
+        sleep(0.6)
         # end condition: only chaser or one remains not caught
         alive = [p for p in names if p not in finished]
         if len(alive) <= 1:
-            print('Игра окончена. Выжившие:', alive)
+            out('Игра окончена. Выжившие:', alive)
             press_enter()
             return
 
@@ -3892,55 +3840,55 @@ def chase_vs_players():
 # -----------------------
 def chase_ball_vs_players():
     clear()
-    print('=== Догонялки с мячом с другими игроками ===')
+    out('=== Догонялки с мячом с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 5): ', 2) or 5
     length = input_int('Длина трека (по умолчанию 28): ', 10) or 28
     names = names_list(n)
-    ball_holder = random.choice(names)
+    ball_holder = rng.choice(names)
     positions = {p: 0 for p in names}
-    print('Начинающий с мячом:', ball_holder)
+    out('Начинающий с мячом:', ball_holder)
     press_enter()
     while True:
         for p in names:
             if positions[p] >= length:
                 continue
             if p == 'You':
-                action = input('Ваш ход: run/sneak/throw (r/s/t): ').strip().lower()
+                action = ask('Ваш ход: run/sneak/throw (r/s/t): ').strip().lower()
                 if action == 'r':
-                    positions[p] += random.randint(2,4)
+                    positions[p] += rng.randint(2,4)
                 elif action == 't' and ball_holder == 'You':
                     # attempt to throw to someone ahead
                     targets = [q for q in names if q != 'You']
-                    receiver = input('Кому бросаете? (имя) или Enter случайно: ').strip()
+                    receiver = ask('Кому бросаете? (имя) или Enter случайно: ').strip()
                     if receiver not in names:
-                        receiver = random.choice(targets)
-                    if random.random() < 0.6:
+                        receiver = rng.choice(targets)
+                    if rng.random() < 0.6:
                         ball_holder = receiver
-                        print('Передача успешна — мяч у', receiver)
+                        out('Передача успешна — мяч у', receiver)
                 else:
-                    positions[p] += random.randint(0,2)
+                    positions[p] += rng.randint(0,2)
             else:
                 # NPC behavior
                 if ball_holder == p:
-                    positions[p] += random.randint(1,3)
+                    positions[p] += rng.randint(1,3)
                     # chance to pass to a player ahead for strategy
-                    if random.random() < 0.2:
+                    if rng.random() < 0.2:
                         candidates = [q for q in names if positions[q] > positions[p]]
                         if candidates:
-                            ball_holder = random.choice(candidates)
+                            ball_holder = rng.choice(candidates)
                 else:
-                    positions[p] += random.randint(0,2)
+                    positions[p] += rng.randint(0,2)
         # check someone reached finish with ball
         for p in names:
             if positions[p] >= length and ball_holder == p:
-                print('Игрок', p, 'добрался до финиша с мячом — победа!')
+                out('Игрок', p, 'добрался до финиша с мячом — победа!')
                 press_enter()
                 return
         # status
         clear()
         for p in names:
-            print(p, positions[p], '(ball)' if p==ball_holder else '')
-        time.sleep(0.6)
+            out(p, positions[p], '(ball)' if p==ball_holder else '')
+        sleep(0.6)
 
 # -----------------------
 # 4) Кликер с другими игроками (simulated idle multiplayer)
@@ -3948,31 +3896,31 @@ def chase_ball_vs_players():
 # -----------------------
 def clicker_vs_players():
     clear()
-    print('=== Кликер с другими игроками ===')
+    out('=== Кликер с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
     duration = input_int('Время в секундах (по умолчанию 10): ', 3) or 10
     names = names_list(n)
     scores = {p:0 for p in names}
-    start = time.time()
-    print('Нажимайте Enter как можно быстрее. ИГРА старт!')
+    start = now()
+    out('Нажимайте Enter как можно быстрее. ИГРА старт!')
     # NPC click rates:
-    rates = {p: random.uniform(0.8, 2.5) for p in names if p != 'You'}
+    rates = {p: rng.uniform(0.8, 2.5) for p in names if p != 'You'}
     try:
-        while time.time() - start < duration:
+        while now() - start < duration:
             # NPC accumulate
             for p, r in rates.items():
                 scores[p] += int(r * 0.2)  # tick
-            input_timeout = duration - (time.time() - start)
+            input_timeout = duration - (now() - start)
             # let user press Enter once per loop to add clicks
             # we can't do non-blocking easily here without extra modules, so count Enter presses manually
-            input()  # counts as one click
+            ask()  # counts as one click
             scores['You'] += 1
     except KeyboardInterrupt:
         pass
     clear()
-    print('Результаты кликера:')
+    out('Результаты кликера:')
     for p in names:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # -----------------------
@@ -3981,12 +3929,12 @@ def clicker_vs_players():
 # -----------------------
 def memory_vs_players():
     clear()
-    print('=== Memory с другими игроками ===')
+    out('=== Memory с другими игроками ===')
     n_players = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
     pairs = input_int('Пар карт (по умолчанию 8): ', 2) or 8
     names = names_list(n_players)
     cards = list(range(pairs)) * 2
-    random.shuffle(cards)
+    rng.shuffle(cards)
     revealed = [False] * (pairs*2)
     scores = {p:0 for p in names}
     # NPC memory: how many known card positions they remember
@@ -3995,14 +3943,9 @@ def memory_vs_players():
     while not all(revealed):
         current = names[turn % len(names)]
         clear()
-        print('Текущий игрок:', current)
+        out('Текущий игрок:', current)
         # show board indices
-        for i, val in enumerate(cards):
-            if revealed[i]:
-                print(f'[{val}]', end=' ')
-            else:
-                print(f'[{i}]', end=' ')
-        print()
+        out(' '.join(f'[{val}]' if revealed[i] else f'[{i}]' for i, val in enumerate(cards)))
         if current == 'You':
             a = input_int('Выберите карту A индекс: ', 0, len(cards)-1)
             b = input_int('Выберите карту B индекс: ', 0, len(cards)-1)
@@ -4014,24 +3957,24 @@ def memory_vs_players():
                 # try to select known pair if two indices known for same value across memory?
                 # simplified: pick random unrevealed indices
                 choices = [i for i in range(len(cards)) if not revealed[i]]
-                a = random.choice(choices)
-                b = random.choice([i for i in choices if i != a])
+                a = rng.choice(choices)
+                b = rng.choice([i for i in choices if i != a])
             else:
                 choices = [i for i in range(len(cards)) if not revealed[i]]
-                a = random.choice(choices)
-                b = random.choice([i for i in choices if i != a])
-            print(f'{current} выбирает {a} и {b}')
-            time.sleep(0.6)
+                a = rng.choice(choices)
+                b = rng.choice([i for i in choices if i != a])
+            out(f'{current} выбирает {a} и {b}')
+            sleep(0.6)
         if a is None or b is None or a==b:
-            print('Неправильный выбор — ход пропущен.')
+            out('Неправильный выбор — ход пропущен.')
             turn += 1
-            time.sleep(0.6)
+            sleep(0.6)
             continue
         # reveal
         val_a, val_b = cards[a], cards[b]
         revealed[a] = revealed[a]
         revealed[b] = revealed[b]
-        print('Открыто:', val_a, val_b)
+        out('Открыто:', val_a, val_b)
         # NPCs update memory
         for p in names:
             if p != current:
@@ -4041,7 +3984,7 @@ def memory_vs_players():
                     memory[p][val_b] = b
         # check match
         if val_a == val_b:
-            print(current, 'нашёл пару!')
+            out(current, 'нашёл пару!')
             scores[current] += 1
             revealed[a] = revealed[b] = True
             # current gets another turn (do not increment)
@@ -4050,11 +3993,11 @@ def memory_vs_players():
             memory[current][val_a] = a
             memory[current][val_b] = b
             turn += 1
-        time.sleep(0.8)
+        sleep(0.8)
     clear()
-    print('Итоги Memory:')
+    out('Итоги Memory:')
     for p in names:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # -----------------------
@@ -4063,7 +4006,7 @@ def memory_vs_players():
 # -----------------------
 def pizza_memory_vs_players():
     clear()
-    print('=== Pizza Memory с другими игроками ===')
+    out('=== Pizza Memory с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
     levels = input_int('Уровней (по умолчанию 5): ', 1) or 5
     names = names_list(n)
@@ -4071,32 +4014,32 @@ def pizza_memory_vs_players():
     seq = []
     scores = {p:0 for p in names}
     for lv in range(1, levels+1):
-        seq.append(random.choice(toppings))
+        seq.append(rng.choice(toppings))
         clear()
-        print('Последовательность:')
-        print(' '.join(seq))
-        time.sleep(1.5)
+        out('Последовательность:')
+        out(' '.join(seq))
+        sleep(1.5)
         clear()
         # each player attempts
         for p in names:
             if p == 'You':
-                ans = input('Введите последовательность через пробел: ').strip().lower().split()
+                ans = ask('Введите последовательность через пробел: ').strip().lower().split()
                 correct = ans == seq
             else:
                 # NPC reproduces with some error probability decreasing with level
-                accuracy = max(0.2, 1.0 - lv*0.12 + random.uniform(-0.1, 0.1))
-                if random.random() < accuracy:
+                accuracy = max(0.2, 1.0 - lv*0.12 + rng.uniform(-0.1, 0.1))
+                if rng.random() < accuracy:
                     correct = True
                 else:
                     correct = False
-                print(p, 'ответил', 'верно' if correct else 'неверно')
+                out(p, 'ответил', 'верно' if correct else 'неверно')
             if correct:
                 scores[p] += 1
-        time.sleep(0.7)
+        sleep(0.7)
     clear()
-    print('Итоги Pizza Memory:')
+    out('Итоги Pizza Memory:')
     for p in names:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # -----------------------
@@ -4105,7 +4048,7 @@ def pizza_memory_vs_players():
 # -----------------------
 def food_memory_vs_players():
     clear()
-    print('=== Food Memory с другими игроками ===')
+    out('=== Food Memory с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
     rounds = input_int('Раундов (по умолчанию 6): ', 1) or 6
     names = names_list(n)
@@ -4113,27 +4056,27 @@ def food_memory_vs_players():
     seq = []
     scores = {p:0 for p in names}
     for r in range(rounds):
-        seq.append(random.choice(foods))
+        seq.append(rng.choice(foods))
         clear()
-        print('Запомните:')
-        print(' '.join(seq))
-        time.sleep(1.2)
+        out('Запомните:')
+        out(' '.join(seq))
+        sleep(1.2)
         clear()
         for p in names:
             if p == 'You':
-                ans = input('Введите через пробел: ').strip().lower().split()
+                ans = ask('Введите через пробел: ').strip().lower().split()
                 correct = ans == seq
             else:
-                accuracy = max(0.3, 1 - r*0.13 + random.uniform(-0.1,0.1))
-                correct = random.random() < accuracy
-                print(p, '->', 'верно' if correct else 'неверно')
+                accuracy = max(0.3, 1 - r*0.13 + rng.uniform(-0.1,0.1))
+                correct = rng.random() < accuracy
+                out(p, '->', 'верно' if correct else 'неверно')
             if correct:
                 scores[p] += 1
-        time.sleep(0.6)
+        sleep(0.6)
     clear()
-    print('Итоги Food Memory:')
+    out('Итоги Food Memory:')
     for p in names:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # -----------------------
@@ -4141,7 +4084,7 @@ def food_memory_vs_players():
 # -----------------------
 def sound_memory_vs_players():
     clear()
-    print('=== Sound Memory с другими игроками ===')
+    out('=== Sound Memory с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
     rounds = input_int('Раундов (по умолчанию 5): ', 1) or 5
     names = names_list(n)
@@ -4149,27 +4092,27 @@ def sound_memory_vs_players():
     seq = []
     scores = {p:0 for p in names}
     for r in range(rounds):
-        seq.append(random.choice(sounds))
+        seq.append(rng.choice(sounds))
         clear()
         for s in seq:
-            print(s.upper())
-            time.sleep(0.5)
+            out(s.upper())
+            sleep(0.5)
             clear()
         for p in names:
             if p == 'You':
-                ans = input('Введите последовательность через пробел: ').strip().lower().split()
+                ans = ask('Введите последовательность через пробел: ').strip().lower().split()
                 correct = ans == seq
             else:
-                accuracy = max(0.2, 1 - r*0.15 + random.uniform(-0.1,0.1))
-                correct = random.random() < accuracy
-                print(p, '->', 'верно' if correct else 'неверно')
+                accuracy = max(0.2, 1 - r*0.15 + rng.uniform(-0.1,0.1))
+                correct = rng.random() < accuracy
+                out(p, '->', 'верно' if correct else 'неверно')
             if correct:
                 scores[p] += 1
-        time.sleep(0.5)
+        sleep(0.5)
     clear()
-    print('Итоги Sound Memory:')
+    out('Итоги Sound Memory:')
     for p in names:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 # -----------------------
@@ -4178,7 +4121,7 @@ def sound_memory_vs_players():
 # -----------------------
 def construction_vs_players():
     clear()
-    print('=== Симулятор стройки с другими игроками ===')
+    out('=== Симулятор стройки с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 1) or 4
     days = input_int('Дней (по умолчанию 10): ', 1) or 10
     names = names_list(n)
@@ -4186,35 +4129,35 @@ def construction_vs_players():
     budget = 200
     for d in range(1, days+1):
         clear()
-        print(f'День {d}/{days}. Бюджет: {budget}')
+        out(f'День {d}/{days}. Бюджет: {budget}')
         for p in names:
             if p == 'You':
-                action = input('Вкладываться или отдыхать? invest/rest (i/r): ').strip().lower()
+                action = ask('Вкладываться или отдыхать? invest/rest (i/r): ').strip().lower()
                 if action == 'i' and budget > 0:
                     invest = min(20, budget)
-                    progress = invest // 2 + random.randint(0,5)
+                    progress = invest // 2 + rng.randint(0,5)
                     progresses[p] += progress
                     budget -= invest
-                    print('Вы вложили', invest, 'прогресс', progress)
+                    out('Вы вложили', invest, 'прогресс', progress)
                 else:
-                    print('Вы отдыхали.')
+                    out('Вы отдыхали.')
             else:
                 # NPC contribution depends on random willingness
-                if random.random() < 0.6:
-                    invest = random.randint(5,20)
-                    progress = invest // 2 + random.randint(0,4)
+                if rng.random() < 0.6:
+                    invest = rng.randint(5,20)
+                    progress = invest // 2 + rng.randint(0,4)
                     progresses[p] += progress
                     budget -= invest
-                    print(p, 'вложил', invest)
+                    out(p, 'вложил', invest)
         # show totals
         total_progress = sum(progresses.values())
-        print('Общий прогресс:', total_progress)
+        out('Общий прогресс:', total_progress)
         if total_progress >= 100:
-            print('Стройка завершена!')
+            out('Стройка завершена!')
             press_enter()
             return
-        time.sleep(0.6)
-    print('Время закончилось. Общий прогресс:', sum(progresses.values()))
+        sleep(0.6)
+    out('Время закончилось. Общий прогресс:', sum(progresses.values()))
     press_enter()
 
 # -----------------------
@@ -4223,39 +4166,39 @@ def construction_vs_players():
 # -----------------------
 def rooms_vs_players():
     clear()
-    print('=== Комнаты с другими игроками ===')
+    out('=== Комнаты с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 5): ', 2) or 5
     rooms_count = input_int('Сколько комнат (по умолчанию 8): ', 3) or 8
     names = names_list(n)
-    player_rooms = {p: random.randrange(rooms_count) for p in names}
+    player_rooms = {p: rng.randrange(rooms_count) for p in names}
     hidden = {p: False for p in names}
     alive = set(names)
     rounds = input_int('Раундов (по умолчанию 10): ', 1) or 10
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}. Игроки живы: {len(alive)}')
+        out(f'Раунд {r}/{rounds}. Игроки живы: {len(alive)}')
         # for each player decide action
         for p in list(alive):
             if p == 'You':
-                cmd = input('Ваше действие: move L/R / hide / search (m/h/s) (Enter skip): ').strip().lower()
+                cmd = ask('Ваше действие: move L/R / hide / search (m/h/s) (Enter skip): ').strip().lower()
                 if cmd.startswith('m'):
-                    dirc = input('L или R: ').strip().lower()
+                    dirc = ask('L или R: ').strip().lower()
                     nr = player_rooms[p] - 1 if dirc == 'l' else player_rooms[p] + 1
                     if 0 <= nr < rooms_count:
                         player_rooms[p] = nr
                         hidden[p] = False
-                        print('Вы вошли в комнату', nr)
+                        out('Вы вошли в комнату', nr)
                 elif cmd == 'h':
                     hidden[p] = True
-                    print('Вы спрятались.')
+                    out('Вы спрятались.')
                 elif cmd == 's':
-                    print('Вы обыскали комнату.')
+                    out('Вы обыскали комнату.')
             else:
                 # NPC move/hide/search probabilistically
-                act = random.random()
+                act = rng.random()
                 if act < 0.4:
                     # move
-                    dirc = random.choice([-1,1])
+                    dirc = rng.choice([-1,1])
                     nr = player_rooms[p] + dirc
                     if 0 <= nr < rooms_count:
                         player_rooms[p] = nr
@@ -4265,17 +4208,17 @@ def rooms_vs_players():
                 else:
                     pass  # search
         # monsters appear randomly in rooms and eat unhidden players
-        monster_room = random.randrange(rooms_count) if random.random() < 0.35 else None
+        monster_room = rng.randrange(rooms_count) if rng.random() < 0.35 else None
         if monster_room is not None:
             victims = [p for p in alive if player_rooms[p] == monster_room and not hidden[p]]
             for v in victims:
-                print('Монстр съел', v)
+                out('Монстр съел', v)
                 alive.remove(v)
-        time.sleep(0.8)
+        sleep(0.8)
         if len(alive) <= 1:
             break
     clear()
-    print('Игра окончена. Выжившие:', ', '.join(sorted(alive)))
+    out('Игра окончена. Выжившие:', ', '.join(sorted(alive)))
     press_enter()
 
 # -----------------------
@@ -4284,12 +4227,12 @@ def rooms_vs_players():
 # -----------------------
 def curse_vs_players():
     clear()
-    print('=== Проклятие с другими игроками ===')
+    out('=== Проклятие с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 5): ', 2) or 5
     rooms_count = input_int('Комнат в доме (по умолчанию 6): ', 2) or 6
     names = names_list(n)
     healths = {p: 10 for p in names}
-    positions = {p: random.randrange(rooms_count) for p in names}
+    positions = {p: rng.randrange(rooms_count) for p in names}
     rounds = input_int('Раундов (по умолчанию 12): ', 1) or 12
     effects = [
         ('shadow','-2'), ('blessing','+2'), ('freeze','-1'),
@@ -4297,24 +4240,24 @@ def curse_vs_players():
     ]
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}')
-        print('Позиции игроков:', positions)
+        out(f'Раунд {r}/{rounds}')
+        out('Позиции игроков:', positions)
         # each player chooses move or stay
         for p in names:
             if p == 'You':
-                cmd = input('move L/R or stay (m/s) (Enter stay): ').strip().lower()
+                cmd = ask('move L/R or stay (m/s) (Enter stay): ').strip().lower()
                 if cmd.startswith('m'):
-                    dirc = input('L или R: ').strip().lower()
+                    dirc = ask('L или R: ').strip().lower()
                     nr = positions[p] - 1 if dirc == 'l' else positions[p] + 1
                     if 0 <= nr < rooms_count:
                         positions[p] = nr
             else:
-                if random.random() < 0.6:
-                    positions[p] = max(0, min(rooms_count-1, positions[p] + random.choice([-1,0,1])))
+                if rng.random() < 0.6:
+                    positions[p] = max(0, min(rooms_count-1, positions[p] + rng.choice([-1,0,1])))
         # effect appears in random room
-        effect = random.choice(effects)
-        room = random.randrange(rooms_count)
-        print(f'В комнате {room} проявилось: {effect[0]} ({effect[1]})')
+        effect = rng.choice(effects)
+        room = rng.randrange(rooms_count)
+        out(f'В комнате {room} проявилось: {effect[0]} ({effect[1]})')
         # apply effect to players in that room
         for p in names:
             if positions[p] == room:
@@ -4324,19 +4267,19 @@ def curse_vs_players():
                 else:
                     delta = int(effect[1].replace('+',''))
                     healths[p] += delta
-                print(p, '-> здоровье', healths[p])
+                out(p, '-> здоровье', healths[p])
         # remove dead
         for p in list(names):
             if healths[p] <= 0:
-                print(p, 'умер от эффекта.')
+                out(p, 'умер от эффекта.')
                 names.remove(p)
-        time.sleep(0.8)
+        sleep(0.8)
         if len(names) <= 1:
             break
     clear()
-    print('Итог здоровья игроков:')
+    out('Итог здоровья игроков:')
     for p, h in healths.items():
-        print(p, h)
+        out(p, h)
     press_enter()
 
 # -----------------------
@@ -4345,36 +4288,36 @@ def curse_vs_players():
 # -----------------------
 def living_car_vs_players():
     clear()
-    print('=== Живой автомобиль с глазами и ртом с другими игроками ===')
+    out('=== Живой автомобиль с глазами и ртом с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 1) or 4
     names = names_list(n)
     car = {'mood':5, 'fuel':5, 'dirt':3}
     rounds = input_int('Раундов взаимодействия (по умолчанию 8): ', 1) or 8
     for r in range(1, rounds+1):
         clear()
-        print(f'Раунд {r}/{rounds}. Машина — настроение {car["mood"]}, топливо {car["fuel"]}, грязь {car["dirt"]}')
+        out(f'Раунд {r}/{rounds}. Машина — настроение {car["mood"]}, топливо {car["fuel"]}, грязь {car["dirt"]}')
         for p in names:
             if p == 'You':
                 action = choose_option('Действие для машины:', ['feed (заправить)','clean (почистить)','talk','drive','skip'])
                 if action is None:
-                    print('Пропуск.')
+                    out('Пропуск.')
                 elif action == 0:
                     car['fuel'] = min(10, car['fuel'] + 3); car['mood'] = min(10, car['mood']+1)
-                    print('Вы заправили машину.')
+                    out('Вы заправили машину.')
                 elif action == 1:
                     car['dirt'] = max(0, car['dirt'] - 2); car['mood'] = min(10, car['mood']+1)
-                    print('Вы почистили машину.')
+                    out('Вы почистили машину.')
                 elif action == 2:
-                    car['mood'] = min(10, car['mood']+1); print('Вы поговорили с машиной.')
+                    car['mood'] = min(10, car['mood']+1); out('Вы поговорили с машиной.')
                 elif action == 3:
                     if car['fuel'] > 0:
                         car['fuel'] -= 1; car['mood'] = min(10, car['mood']+1)
-                        print('Вы покатались — машина довольна.')
+                        out('Вы покатались — машина довольна.')
                     else:
-                        print('Нет топлива.')
+                        out('Нет топлива.')
             else:
                 # NPC action probabilistic
-                act = random.random()
+                act = rng.random()
                 if act < 0.25:
                     car['fuel'] = min(10, car['fuel'] + 2); car['mood'] += 1
                 elif act < 0.5:
@@ -4386,9 +4329,9 @@ def living_car_vs_players():
         # small decay
         car['mood'] = max(0, car['mood'] - 1)
         car['dirt'] = min(10, car['dirt'] + 1)
-        time.sleep(0.6)
+        sleep(0.6)
     clear()
-    print('Финальное состояние машины:', car)
+    out('Финальное состояние машины:', car)
     press_enter()
 # -----------------------
 # Singleplayer games
@@ -4396,26 +4339,26 @@ def living_car_vs_players():
 
 def revenge_game():
     clear()
-    print('=== Месть ===')
+    out('=== Месть ===')
     story = ['You were betrayed','You lost something','You were humiliated']
-    reason = random.choice(story)
-    print('Сюжет:', reason)
+    reason = rng.choice(story)
+    out('Сюжет:', reason)
     choice = input_choice('Как мстить?', ['Confront','Sabotage','Forgive'])
     if choice == 'Forgive':
-        print('Месть отменена. Вы чувствуете облегчение.')
+        out('Месть отменена. Вы чувствуете облегчение.')
     else:
-        outcome = random.choice(['Success','Backfire','Unclear'])
-        print('Исход:', outcome)
+        outcome = rng.choice(['Success','Backfire','Unclear'])
+        out('Исход:', outcome)
     press_enter()
 
 def happy_car():
     clear()
-    print('=== Довольная машина ===')
+    out('=== Довольная машина ===')
     mood = 5
     fuel = 3
     for i in range(5):
         clear()
-        print(f'Настроение: {mood}, Топливо: {fuel}')
+        out(f'Настроение: {mood}, Топливо: {fuel}')
         action = choose_option('Действие:', ['Почистить','Заменить масло','Покататься','Покормить топливом','Поговорить'])
         if action == 0:
             mood = min(10, mood+1)
@@ -4437,271 +4380,271 @@ def happy_car():
             safe_print('Машина отвечает "Бип-бип!"')
         else:
             safe_print('Вы ничего не сделали.')
-    print('Итог — машина довольна на', mood)
+    out('Итог — машина довольна на', mood)
     press_enter()
 
 def the_path():
     clear()
-    print('=== Путь ===')
+    out('=== Путь ===')
     steps = input_int('Сколько шагов пройти (по умолчанию 12): ', 1) or 12
     encounters = ['старый мост','дерево с запиской','пустая колодец','сторожевой камень','мираж']
     mood = 0
     for s in range(steps):
-        item = random.choice(encounters)
-        print(f'Шаг {s+1}: вы встретили {item}')
-        cmd = input('Взаимодействовать? (y/n): ').strip().lower()
+        item = rng.choice(encounters)
+        out(f'Шаг {s+1}: вы встретили {item}')
+        cmd = ask('Взаимодействовать? (y/n): ').strip().lower()
         if cmd == 'y':
-            outcome = random.choice(['+','-','neutral'])
+            outcome = rng.choice(['+','-','neutral'])
             if outcome == '+':
-                mood += 1; print('Это принесло утешение.')
+                mood += 1; out('Это принесло утешение.')
             elif outcome == '-':
-                mood -= 1; print('Это было опасно.')
+                mood -= 1; out('Это было опасно.')
             else:
-                print('Ничего не произошло.')
-        time.sleep(0.4)
-    print('Итоговое состояние:', mood)
+                out('Ничего не произошло.')
+        sleep(0.4)
+    out('Итоговое состояние:', mood)
     press_enter()
 
 def lights_out():
     clear()
-    print('=== Свет выключен ===')
-    print('Вы в доме, свет гаснет. Нужно добраться до двери на ощупь.')
+    out('=== Свет выключен ===')
+    out('Вы в доме, свет гаснет. Нужно добраться до двери на ощупь.')
     pos = 0
     target = 6
     while pos < target:
         step = input_choice('Куда двигаться?', ['Left','Right','Forward','Listen'])
         if step == 'Forward':
             pos += 1
-            print('Вы продвинулись вперёд.')
+            out('Вы продвинулись вперёд.')
         elif step == 'Listen':
-            hint = random.choice(['шаги справа','вода слева','тишина'])
-            print('Вы слышите:', hint)
+            hint = rng.choice(['шаги справа','вода слева','тишина'])
+            out('Вы слышите:', hint)
         else:
-            print('Вы двинулись в сторону и потеряли время.')
+            out('Вы двинулись в сторону и потеряли время.')
             pos += 0
-        if random.random() < 0.12:
-            print('Что-то зашевелилось в темноте...')
-        time.sleep(0.5)
-    print('Вы нашли дверь и вышли на свет.')
+        if rng.random() < 0.12:
+            out('Что-то зашевелилось в темноте...')
+        sleep(0.5)
+    out('Вы нашли дверь и вышли на свет.')
     press_enter()
 
 def scareman():
     clear()
-    print('=== Страхолюдина ===')
+    out('=== Страхолюдина ===')
     fear = 0
     for i in range(5):
-        event = random.choice(['шепот','тень','вопль','шелест'])
-        print('Событие:', event)
-        resp = input('Спрятаться или бежать? (h/run): ').strip().lower()
+        event = rng.choice(['шепот','тень','вопль','шелест'])
+        out('Событие:', event)
+        resp = ask('Спрятаться или бежать? (h/run): ').strip().lower()
         if resp == 'h':
-            fear += random.randint(0,1)
+            fear += rng.randint(0,1)
             safe_print('Вы затаились...')
         else:
-            fear += random.randint(1,3)
+            fear += rng.randint(1,3)
             safe_print('Вы бежите — сердце колотится!')
-    print('Уровень страха:', fear)
+    out('Уровень страха:', fear)
     press_enter()
 
 def clown_game():
     clear()
-    print('=== Клоун ===')
+    out('=== Клоун ===')
     mood = 0
     for i in range(4):
         action = choose_option('Что делать?', ['Смеяться','Подходить ближе','Убежать','Остаться'])
         if action == 0:
             mood += 1; safe_print('Клоун улыбается. Вы чувствуете лёгкое облегчение.')
         elif action == 1:
-            mood += random.choice([-2,2]); safe_print('Клоун реагирует непредсказуемо.')
+            mood += rng.choice([-2,2]); safe_print('Клоун реагирует непредсказуемо.')
         elif action == 2:
             mood += -1; safe_print('Вы убежали — но клоун догнал вас в кошмаре.')
         else:
             safe_print('Ничего не происходит.')
-    print('Итог:', mood)
+    out('Итог:', mood)
     press_enter()
 
 def spirits_months():
     clear()
-    print('=== Духи месяцев года ===')
+    out('=== Духи месяцев года ===')
     months = ['январь','февраль','март','апрель','май','июнь','июль','август','сентябрь','октябрь','ноябрь','декабрь']
-    print('Вы вызываете духа месяца...')
-    chosen = random.choice(months)
-    print('Дух', chosen, 'рассказывает пророчество:', random.choice(['жаркое лето','холодная зима','урожай','буря']))
+    out('Вы вызываете духа месяца...')
+    chosen = rng.choice(months)
+    out('Дух', chosen, 'рассказывает пророчество:', rng.choice(['жаркое лето','холодная зима','урожай','буря']))
     press_enter()
 
 def spirits_seasons():
     clear()
-    print('=== Духи времён года ===')
+    out('=== Духи времён года ===')
     seasons = ['весна','лето','осень','зима']
     for s in seasons:
-        print(s, '->', random.choice(['торжествует','спит','плачет','поёт']))
+        out(s, '->', rng.choice(['торжествует','спит','плачет','поёт']))
     press_enter()
 
 def spirits_weekdays():
     clear()
-    print('=== Духи дней недели ===')
+    out('=== Духи дней недели ===')
     days = ['Понедельник','Вторник','Среда','Четверг','Пятница','Суббота','Воскресенье']
     for d in days:
-        print(d, '-', random.choice(['энергия','покой','тоска','веселье','хандра','радость','сонливость']))
+        out(d, '-', rng.choice(['энергия','покой','тоска','веселье','хандра','радость','сонливость']))
     press_enter()
 
 def abandoned_place():
     clear()
-    print('=== Заброшка ===')
+    out('=== Заброшка ===')
     rooms = ['кухня','подвал','чердак','зал','веранда']
-    pos = random.choice(rooms)
-    print('Вы в', pos)
+    pos = rng.choice(rooms)
+    out('Вы в', pos)
     for i in range(5):
-        obj = random.choice(['старый диван','разбитое окно','письмо','кровавая метка','детская игрушка'])
-        print('Найдено:', obj)
-        ans = input('Забрать / Уйти? (take/leave): ').strip().lower()
-        if ans == 'take' and random.random() < 0.2:
-            print('Вы получили таинственный предмет...')
-        time.sleep(0.6)
+        obj = rng.choice(['старый диван','разбитое окно','письмо','кровавая метка','детская игрушка'])
+        out('Найдено:', obj)
+        ans = ask('Забрать / Уйти? (take/leave): ').strip().lower()
+        if ans == 'take' and rng.random() < 0.2:
+            out('Вы получили таинственный предмет...')
+        sleep(0.6)
     press_enter()
 
 def zombie_apocalypse():
     clear()
-    print('=== Зомби апокалипсис ===')
+    out('=== Зомби апокалипсис ===')
     survivors = 3
     supplies = 5
     days = input_int('Сколько дней вы хотите выживать? (по умолчанию 5): ', 1) or 5
     for d in range(days):
-        print(f'День {d+1}: supplies {supplies}, survivors {survivors}')
-        event = random.choice(['raid','quiet','zombie_horde'])
+        out(f'День {d+1}: supplies {supplies}, survivors {survivors}')
+        event = rng.choice(['raid','quiet','zombie_horde'])
         if event == 'raid':
-            lost = random.randint(0,1)
+            lost = rng.randint(0,1)
             survivors -= lost
-            supplies -= random.randint(0,2)
-            print('Налёт мародёров!')
+            supplies -= rng.randint(0,2)
+            out('Налёт мародёров!')
         elif event == 'zombie_horde':
-            lost = random.randint(0,2)
+            lost = rng.randint(0,2)
             survivors -= lost
-            print('Наши потеряли', lost)
+            out('Наши потеряли', lost)
         else:
-            supplies += random.randint(0,2)
-            print('Тихий день — пополнили запасы.')
+            supplies += rng.randint(0,2)
+            out('Тихий день — пополнили запасы.')
         if survivors <= 0 or supplies < 0:
-            print('Все пали.')
+            out('Все пали.')
             press_enter()
             return
-        time.sleep(0.6)
-    print('Вы выжили! Осталось людей:', survivors)
+        sleep(0.6)
+    out('Вы выжили! Осталось людей:', survivors)
     press_enter()
 
 def dont_eat_cake():
     clear()
-    print('=== Не ешь кекс ===')
-    print('Перед вами кекс. Не ешьте его.')
+    out('=== Не ешь кекс ===')
+    out('Перед вами кекс. Не ешьте его.')
     for i in range(3):
-        ans = input('Сдержитесь? (y/n): ').strip().lower()
+        ans = ask('Сдержитесь? (y/n): ').strip().lower()
         if ans == 'y':
-            print('Вы сильны!')
+            out('Вы сильны!')
         else:
-            print('Вы съели кекс и случилось странное...')
+            out('Вы съели кекс и случилось странное...')
             break
-        time.sleep(0.5)
+        sleep(0.5)
     press_enter()
 
 def five_nights_freddy():
     clear()
-    print('=== 5 ночей с Freddy (упрощено) ===')
+    out('=== 5 ночей с Freddy (упрощено) ===')
     nights = input_int('Ночей (по умолчанию 3): ', 1) or 3
     sanity = 10
     for n in range(nights):
-        print('Ночь', n+1)
-        checks = random.randint(1,3)
+        out('Ночь', n+1)
+        checks = rng.randint(1,3)
         for c in range(checks):
-            if random.random() < 0.25:
-                sanity -= random.randint(1,3)
-                print('Аниматроник рядом! Потеря рассудка.')
+            if rng.random() < 0.25:
+                sanity -= rng.randint(1,3)
+                out('Аниматроник рядом! Потеря рассудка.')
             else:
-                print('Тишина...')
-            time.sleep(0.6)
+                out('Тишина...')
+            sleep(0.6)
         if sanity <= 0:
-            print('Вы потеряли рассудок.')
+            out('Вы потеряли рассудок.')
             press_enter()
             return
-    print('Вы пережили ночи! Рассудок:', sanity)
+    out('Вы пережили ночи! Рассудок:', sanity)
     press_enter()
 
 def run_run_run():
     clear()
-    print('=== БЕГИ ===')
+    out('=== БЕГИ ===')
     distance = 0
     while distance < 20:
-        cmd = input('Бежать быстро или медленно? (fast/slow): ').strip().lower()
+        cmd = ask('Бежать быстро или медленно? (fast/slow): ').strip().lower()
         if cmd == 'fast':
-            distance += random.randint(2,5)
-            print('Вы ускорились.')
+            distance += rng.randint(2,5)
+            out('Вы ускорились.')
         else:
-            distance += random.randint(0,2)
-            print('Вы медленно бежите.')
-        if random.random() < 0.1:
-            print('Что-то догоняет вас!')
-        time.sleep(0.4)
-    print('Вы убежали на безопасное расстояние.')
+            distance += rng.randint(0,2)
+            out('Вы медленно бежите.')
+        if rng.random() < 0.1:
+            out('Что-то догоняет вас!')
+        sleep(0.4)
+    out('Вы убежали на безопасное расстояние.')
     press_enter()
 
 def be_quieter():
     clear()
-    print('=== Будь тише! ===')
+    out('=== Будь тише! ===')
     noise = 0
     for i in range(6):
-        action = input('Сделать тихо или шумно? (quiet/noisy): ').strip().lower()
+        action = ask('Сделать тихо или шумно? (quiet/noisy): ').strip().lower()
         if action == 'quiet':
             noise += 0
-            print('Тихо...')
+            out('Тихо...')
         else:
-            noise += random.randint(1,3)
-            print('Шум!')
-        if noise >= 6 and random.random() < 0.5:
-            print('Вы привлекли внимание.')
+            noise += rng.randint(1,3)
+            out('Шум!')
+        if noise >= 6 and rng.random() < 0.5:
+            out('Вы привлекли внимание.')
             press_enter()
             return
-        time.sleep(0.4)
-    print('Вы прошли незамеченным.')
+        sleep(0.4)
+    out('Вы прошли незамеченным.')
     press_enter()
 
 def oddities():
     clear()
-    print('=== Странности ===')
+    out('=== Странности ===')
     for i in range(5):
-        event = random.choice(['зеркало показывает не тебя','часы идут назад','дерево шепчет','тень улыбается'])
-        print('Странность:', event)
-        input('Нажмите Enter, чтобы продолжить...')
+        event = rng.choice(['зеркало показывает не тебя','часы идут назад','дерево шепчет','тень улыбается'])
+        out('Странность:', event)
+        ask('Нажмите Enter, чтобы продолжить...')
     press_enter()
 
 def talk_planets():
     clear()
-    print('=== Говори с планетами ===')
+    out('=== Говори с планетами ===')
     planets = ['Mercury','Venus','Earth','Mars','Jupiter','Saturn']
     for _ in range(4):
-        p = random.choice(planets)
-        print(p, 'говорит:', random.choice(['Помоги мне','Я одинок','Спасибо','Я в порядке']))
-        input('Ответить (Enter): ')
+        p = rng.choice(planets)
+        out(p, 'говорит:', rng.choice(['Помоги мне','Я одинок','Спасибо','Я в порядке']))
+        ask('Ответить (Enter): ')
     press_enter()
 
 def apocalypse():
     clear()
-    print('=== Конец света ===')
-    scenario = random.choice(['метеориты','ядерная война','паника','климатическая катастрофа'])
-    print('Сценарий:', scenario)
+    out('=== Конец света ===')
+    scenario = rng.choice(['метеориты','ядерная война','паника','климатическая катастрофа'])
+    out('Сценарий:', scenario)
     choice = input_choice('Что делать?', ['Hide','Flee','Join others','Record'])
-    print('Исход вашего выбора:', random.choice(['Выживете','Погибнете','Останетесь в подвешенном состоянии']))
+    out('Исход вашего выбора:', rng.choice(['Выживете','Погибнете','Останетесь в подвешенном состоянии']))
     press_enter()
 
 def revive_ability():
     clear()
-    print('=== Способность оживлять ===')
+    out('=== Способность оживлять ===')
     tries = input_int('Сколько раз применить способность? (по умолчанию 3): ', 1) or 3
     for i in range(tries):
         target = input_choice('Кого оживить?', ['Растение','Животное','Покинутый предмет','Камень'])
-        success = random.random() < 0.5
+        success = rng.random() < 0.5
         if success:
-            print('Оживление успешно —', target, 'ожило!')
+            out('Оживление успешно —', target, 'ожило!')
         else:
-            print('Не удалось. Цена: вы чувствуете слабость.')
-        time.sleep(0.6)
+            out('Не удалось. Цена: вы чувствуете слабость.')
+        sleep(0.6)
     press_enter()
 
 # -----------------------
@@ -4710,291 +4653,672 @@ def revive_ability():
 
 def revenge_vs_players():
     clear()
-    print('=== Месть с другими игроками ===')
+    out('=== Месть с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
     names = names_list(n)
     scores = {p:0 for p in names}
     for r in range(4):
-        victim = random.choice(names)
-        print('Раунд', r+1, 'жертва:', victim)
+        victim = rng.choice(names)
+        out('Раунд', r+1, 'жертва:', victim)
         for p in names:
             if p == 'You':
                 action = choose_option('Что вы делаете?', ['Саботаж','Публичная порка','Прощение','Игнорировать'])
                 if action in (0,1):
-                    scores[p] += random.randint(0,2)
+                    scores[p] += rng.randint(0,2)
             else:
-                if random.random() < 0.6:
-                    scores[p] += random.randint(0,2)
-        time.sleep(0.6)
+                if rng.random() < 0.6:
+                    scores[p] += rng.randint(0,2)
+        sleep(0.6)
     clear()
-    print('Результаты мстителей:')
+    out('Результаты мстителей:')
     for p in names:
-        print(p, scores[p])
+        out(p, scores[p])
     press_enter()
 
 def apocalypse_vs_players():
     clear()
-    print('=== Конец света с другими игроками ===')
+    out('=== Конец света с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 5): ', 2) or 5
     names = names_list(n)
-    resources = {p: random.randint(1,5) for p in names}
+    resources = {p: rng.randint(1,5) for p in names}
     rounds = input_int('Раундов выживания (по умолчанию 6): ', 1) or 6
     for r in range(rounds):
-        print('Раунд', r+1)
-        event = random.choice(['radiation','storm','panic','calm'])
+        out('Раунд', r+1)
+        event = rng.choice(['radiation','storm','panic','calm'])
         if event == 'storm':
-            loser = random.choice(names)
+            loser = rng.choice(names)
             resources[loser] = max(0, resources[loser]-2)
-            print(loser, 'потерял ресурсы.')
+            out(loser, 'потерял ресурсы.')
         elif event == 'panic':
-            giver = random.choice(names)
-            taker = random.choice([x for x in names if x!=giver])
+            giver = rng.choice(names)
+            taker = rng.choice([x for x in names if x!=giver])
             transfer = min(2, resources[giver])
             resources[giver] -= transfer
             resources[taker] += transfer
-            print(giver, 'поделился с', taker)
+            out(giver, 'поделился с', taker)
         else:
-            print('Стабильно.')
-        time.sleep(0.6)
-    print('Итоги ресурсов:')
+            out('Стабильно.')
+        sleep(0.6)
+    out('Итоги ресурсов:')
     for p in names:
-        print(p, resources[p])
+        out(p, resources[p])
     press_enter()
 
 def five_nights_vs_players():
     clear()
-    print('=== 5 ночей с Freddy с другими игроками ===')
+    out('=== 5 ночей с Freddy с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 3): ', 1) or 3
     names = names_list(n)
     sanity = {p:10 for p in names}
     nights = input_int('Ночей (по умолчанию 3): ',1) or 3
     for night in range(nights):
-        print('Ночь', night+1)
+        out('Ночь', night+1)
         for p in names:
-            loss = random.randint(0,3)
+            loss = rng.randint(0,3)
             sanity[p] -= loss
-            print(p, 'потерял', loss)
-        time.sleep(0.6)
-    print('Остатки разума:')
+            out(p, 'потерял', loss)
+        sleep(0.6)
+    out('Остатки разума:')
     for p in names:
-        print(p, sanity[p])
+        out(p, sanity[p])
     press_enter()
 
 def abandoned_vs_players():
     clear()
-    print('=== Заброшка с другими игроками ===')
+    out('=== Заброшка с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ', 1) or 4
     names = names_list(n)
     health = {p:10 for p in names}
     rooms = ['кухня','чердак','подвал','зал']
     for r in range(5):
-        room = random.choice(rooms)
-        print('Комната:', room)
+        room = rng.choice(rooms)
+        out('Комната:', room)
         for p in names:
             if p == 'You':
-                cmd = input('Кирпич/искать/уйти (brick/search/leave): ').strip().lower()
-                if cmd == 'search' and random.random() < 0.3:
-                    health[p] += 1; print('Вы нашли аптечку.')
+                cmd = ask('Кирпич/искать/уйти (brick/search/leave): ').strip().lower()
+                if cmd == 'search' and rng.random() < 0.3:
+                    health[p] += 1; out('Вы нашли аптечку.')
             else:
-                if random.random() < 0.2:
+                if rng.random() < 0.2:
                     health[p] -= 1
-        time.sleep(0.6)
-    print('Здоровье игроков:')
+        sleep(0.6)
+    out('Здоровье игроков:')
     for p in names:
-        print(p, health[p])
+        out(p, health[p])
     press_enter()
 
 def oddities_vs_players():
     clear()
-    print('=== Странности с другими игроками ===')
+    out('=== Странности с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 5): ', 1) or 5
     names = names_list(n)
     weird = {p:0 for p in names}
     for i in range(6):
-        effect = random.choice(['mirror','voices','timewarp','shadows'])
-        print('Эффект:', effect)
+        effect = rng.choice(['mirror','voices','timewarp','shadows'])
+        out('Эффект:', effect)
         for p in names:
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 weird[p] += 1
-        time.sleep(0.5)
-    print('Показатели странностей:')
+        sleep(0.5)
+    out('Показатели странностей:')
     for p in names:
-        print(p, weird[p])
+        out(p, weird[p])
     press_enter()
 
 def revive_vs_players():
     clear()
-    print('=== Способность оживлять с другими игроками ===')
+    out('=== Способность оживлять с другими игроками ===')
     n = input_int('Игроков (включая вас) (по умолчанию 4): ',1) or 4
     names = names_list(n)
-    alive = {p: random.choice([True, True, False]) for p in names}
-    print('Исходное состояние (alive):', alive)
+    alive = {p: rng.choice([True, True, False]) for p in names}
+    out('Исходное состояние (alive):', alive)
     for p in names:
         if p == 'You':
-            target = input('Кого вы оживите? (имя) или Enter случайно: ').strip()
+            target = ask('Кого вы оживите? (имя) или Enter случайно: ').strip()
             if target not in names:
-                target = random.choice(names)
-            success = random.random() < 0.6
+                target = rng.choice(names)
+            success = rng.random() < 0.6
             alive[target] = success
-            print('Вы пытались оживить', target, 'успех=', success)
+            out('Вы пытались оживить', target, 'успех=', success)
         else:
-            if random.random() < 0.4:
-                t = random.choice(names)
-                alive[t] = random.random() < 0.5
-    print('Финальное состояние alive:', alive)
+            if rng.random() < 0.4:
+                t = rng.choice(names)
+                alive[t] = rng.random() < 0.5
+    out('Финальное состояние alive:', alive)
     press_enter()
 # -------------------------
 # Collect games into menu
+# Реестр игр: у каждой записи название, категория и флаг «с другими игроками».
+# Функция игры указывается строкой: 'имя' — функция из этого файла,
+# 'модуль:имя' — из отдельного модуля. Модуль импортируется при первом
+# запуске игры, поэтому игры с тяжёлыми движками (сапёр, змейка, соты,
+# «Змеи и лестницы», стеклянный мост, рулетка) лежат в своих модулях и
+# не загружаются, пока в них не сыграют.
 # -------------------------
+QUIZ = 'Викторины'
+PUZZLE = 'Головоломки'
+MEMORY = 'Память'
+REACTION = 'Реакция'
+ACTION = 'Погони и бои'
+PARTY = 'Настольные и социальные'
+HORROR = 'Страшные'
+SIM = 'Симуляторы'
+STORY = 'Истории'
+
+class Game:
+    __slots__ = ('title', 'target', 'category', 'multiplayer', '_func')
+
+    def __init__(self, title, target, category, multiplayer=False):
+        self.title = title
+        self.target = target
+        self.category = category
+        self.multiplayer = multiplayer
+        self._func = None
+
+    def load(self):
+        """
+        Вернуть функцию игры (при первом вызове — найти по имени и, для
+        'модуль:функция', импортировать модуль).
+        """
+        if self._func is None:
+            if callable(self.target):
+                self._func = self.target
+            elif ':' in self.target:
+                import importlib
+                module, _, name = self.target.partition(':')
+                self._func = getattr(importlib.import_module(module), name)
+            else:
+                self._func = globals()[self.target]
+        return self._func
+
+    def __call__(self):
+        return self.load()()
+
 GAMES = [
-    ('Math Quiz', math_quiz),
-    ('Guess the Number', guess_number),
-    ('Minesweeper (Сапёр)', minesweeper),
-    ('Dogonalki (Догонялки)', dogonalki),
-    ('Hide & Seek (Прятки)', hide_and_seek),
-    ('Snakes and Ladders (Змеи и Лестницы)', snakes_and_ladders),
-    ('Прятки-догонялки ВИРУС', hide_chase_virus),
-    ('Бункер', bunker),
-    ('Догонялки с мячом', chase_with_ball),
-    ('Выживание', survival_game),
-    ('Рельсы', rails_game),
-    ('Гонки', racing_game),
-    ('Вышибалы', dodgeball),
-    ('Туман', fog_game),
-    ('Рейд', raid_game),
-    ('Термометр', thermometer_game),
-    ('Змейка', snake_game),
-    ('Решение поезда', trolley_game),
-    ('Живой автомобиль', living_car),
-    ('Живой автомобиль с глазами и ртом', living_car_with_face),
-    ('Красный свет - зелёный свет', red_green_light),
-    ('Третий лишний', odd_one_out),
-    ('Сахарные соты', sugar_hives),
-    ('Последний выживший', last_survivor),
-    ('Стеклянный мост', glass_bridge),
-    ('Драка', fight_game),
-    ('Сумо', sumo),
-    ('Карате', karate),
-    ('Всё оживает!', everything_alive),
-    ('Болтай с ожившими предметами', chat_with_items),
-    ('Комнаты', rooms_game),
-    ('Монстр', monster_game),
-    ('Катастрофа', catastrophe),
-    ('Преследование (ты — преследователь)', pursuit_player_chaser),
-    ('Преследование с мячом (ты — преследователь)', pursuit_with_ball_player_chaser),
-    ('Сказка', fairy_tale),
-    ('Проклятие', curse_game),
-    ('Настолка "Бункер"', bunker_boardgame),
-    ('Предатель', traitor_game),
-    ('Страх', fear_game),
-    ('Паук', spider_game),
-    ('День рождение', birthday_game),
-    ('Стоматолог', dentist_game),
-    ('Аквафобия', aquaphobia),
-    ('Арахнофобия', arachnophobia),
-    ('Клаустрофобия', claustrophobia),
-    ('Lumber Jack', lumber_jack),
-    ('Pizza Memory', pizza_memory),
-    ('Food Memory', food_memory),
-    ('Sound Memory', sound_memory),
-    ('Memory (Pairs)', memory_classic),
-    ("Liar's Bar", liars_bar),
-    ('Hitman', hitman),
-    ('True or False', true_or_false),
-    ('Death Columns', death_columns),
-    ('Guess the Word', guess_the_word),
-    ("Who's SUS?", whos_sus),
-    ('Мафия', mafia_game),
-    ('Оживший мир', living_world),
-    ('Русская рулетка', russian_roulette),
-    ('Интерпретация', interpretation_game),
-    ('Репутация', reputation),
-    ('Танки', tanks_game),
-    ('Симулятор компьютерного вируса', virus_simulator),
-    ('Симулятор стройки', construction_simulator),
-    ('Школа', school_simulator),
-    ('Сложный Math Quiz', hard_math_quiz),
-    ('Кликер', clicker),
-    ('Math Quiz на время', timed_math_quiz),
-    ('Очень сложный Math Quiz', very_hard_math_quiz),
-    ('Math Quiz но с другими игроками', math_quiz_vs_players),
-    ('Планетарий', planetarium),
-    ('Ожившие планеты', living_planets),
-    ('Звёзды', stars_game),
-    ('Блеск', shine_game),
-    ('Quiz (basic)', quiz_easy),
-    ('Сложный Quiz', quiz_hard),
-    ('Quiz на время', quiz_timed),
-    ('Очень сложный Quiz', quiz_very_hard),
-    ('Quiz но с другими игроками', quiz_vs_players),
-    ('Сапёр с другими игроками', minesweeper_vs_players),
-    ('Догонялки с другими игроками', chase_vs_players),
-    ('Догонялки с мячом с другими игроками', chase_ball_vs_players),
-    ('Кликер с другими игроками', clicker_vs_players),
-    ('Memory с другими игроками', memory_vs_players),
-    ('Pizza Memory с другими игроками', pizza_memory_vs_players),
-    ('Food Memory с другими игроками', food_memory_vs_players),
-    ('Sound Memory с другими игроками', sound_memory_vs_players),
-    ('Симулятор стройки с другими игроками', construction_vs_players),
-    ('Комнаты с другими игроками', rooms_vs_players),
-    ('Проклятие с другими игроками', curse_vs_players),
-    ('Живой автомобиль с глазами и ртом с другими игроками', living_car_vs_players),
-    ('Месть', revenge_game),
-    ('Довольная машина', happy_car),
-    ('Путь', the_path),
-    ('Свет выключен', lights_out),
-    ('Страхолюдина', scareman),
-    ('Клоун', clown_game),
-    ('Духи месяцев года', spirits_months),
-    ('Духи времён года', spirits_seasons),
-    ('Духи дней недели', spirits_weekdays),
-    ('Заброшка', abandoned_place),
-    ('Зомби апокалипсис', zombie_apocalypse),
-    ('Не ешь кекс', dont_eat_cake),
-    ('5 ночей с Freddy', five_nights_freddy),
-    ('БЕГИ', run_run_run),
-    ('Будь тише!', be_quieter),
-    ('Странности', oddities),
-    ('Говори с планетами', talk_planets),
-    ('Конец света', apocalypse),
-    ('Способность оживлять', revive_ability),
-    ('Месть с другими игроками', revenge_vs_players),
-    ('Конец света с другими игроками', apocalypse_vs_players),
-    ('5 ночей с Freddy с другими игроками', five_nights_vs_players),
-    ('Заброшка с другими игроками', abandoned_vs_players),
-    ('Странности с другими игроками', oddities_vs_players),
-    ('Способность оживлять с другими игроками', revive_vs_players),
+    Game('Math Quiz', 'math_quiz', QUIZ),
+    Game('Guess the Number', 'guess_number', QUIZ),
+    Game('Minesweeper (Сапёр)', 'minesweeper:minesweeper', PUZZLE),
+    Game('Dogonalki (Догонялки)', 'dogonalki', ACTION),
+    Game('Hide & Seek (Прятки)', 'hide_and_seek', ACTION),
+    Game('Snakes and Ladders (Змеи и Лестницы)', 'snakes_and_ladders:snakes_and_ladders', PARTY, multiplayer=True),
+    Game('Прятки-догонялки ВИРУС', 'hide_chase_virus', ACTION),
+    Game('Бункер', 'bunker', SIM),
+    Game('Догонялки с мячом', 'chase_with_ball', ACTION),
+    Game('Выживание', 'survival_game', SIM),
+    Game('Рельсы', 'rails_game', PUZZLE),
+    Game('Гонки', 'racing_game', ACTION),
+    Game('Вышибалы', 'dodgeball', ACTION),
+    Game('Туман', 'fog_game', PUZZLE),
+    Game('Рейд', 'raid_game', ACTION),
+    Game('Термометр', 'thermometer_game', QUIZ),
+    Game('Змейка', 'snake_game:snake_game', ACTION),
+    Game('Решение поезда', 'trolley_game', STORY),
+    Game('Живой автомобиль', 'living_car', SIM),
+    Game('Живой автомобиль с глазами и ртом', 'living_car_with_face', SIM),
+    Game('Красный свет - зелёный свет', 'red_green_light', REACTION),
+    Game('Третий лишний', 'odd_one_out', QUIZ),
+    Game('Сахарные соты', 'sugar_hives:sugar_hives', PUZZLE),
+    Game('Последний выживший', 'last_survivor', PARTY, multiplayer=True),
+    Game('Стеклянный мост', 'glass_bridge:glass_bridge', PUZZLE),
+    Game('Драка', 'fight_game', ACTION),
+    Game('Сумо', 'sumo', ACTION),
+    Game('Карате', 'karate', REACTION),
+    Game('Всё оживает!', 'everything_alive', STORY),
+    Game('Болтай с ожившими предметами', 'chat_with_items', STORY),
+    Game('Комнаты', 'rooms_game', STORY),
+    Game('Монстр', 'monster_game', HORROR),
+    Game('Катастрофа', 'catastrophe', SIM),
+    Game('Преследование (ты — преследователь)', 'pursuit_player_chaser', ACTION),
+    Game('Преследование с мячом (ты — преследователь)', 'pursuit_with_ball_player_chaser', ACTION),
+    Game('Сказка', 'fairy_tale', STORY),
+    Game('Проклятие', 'curse_game', HORROR),
+    Game('Настолка "Бункер"', 'bunker_boardgame', PARTY, multiplayer=True),
+    Game('Предатель', 'traitor_game', PARTY, multiplayer=True),
+    Game('Страх', 'fear_game', HORROR),
+    Game('Паук', 'spider_game', HORROR),
+    Game('День рождение', 'birthday_game', SIM),
+    Game('Стоматолог', 'dentist_game', REACTION),
+    Game('Аквафобия', 'aquaphobia', HORROR),
+    Game('Арахнофобия', 'arachnophobia', HORROR),
+    Game('Клаустрофобия', 'claustrophobia', HORROR),
+    Game('Lumber Jack', 'lumber_jack', REACTION),
+    Game('Pizza Memory', 'pizza_memory', MEMORY),
+    Game('Food Memory', 'food_memory', MEMORY),
+    Game('Sound Memory', 'sound_memory', MEMORY),
+    Game('Memory (Pairs)', 'memory_classic', MEMORY),
+    Game("Liar's Bar", 'liars_bar', PARTY),
+    Game('Hitman', 'hitman', PARTY),
+    Game('True or False', 'true_or_false', QUIZ),
+    Game('Death Columns', 'death_columns', PUZZLE),
+    Game('Guess the Word', 'guess_the_word', QUIZ),
+    Game("Who's SUS?", 'whos_sus', PARTY),
+    Game('Мафия', 'mafia_game', PARTY, multiplayer=True),
+    Game('Оживший мир', 'living_world', STORY),
+    Game('Русская рулетка', 'russian_roulette:russian_roulette', PARTY, multiplayer=True),
+    Game('Интерпретация', 'interpretation_game', QUIZ),
+    Game('Репутация', 'reputation', SIM),
+    Game('Танки', 'tanks_game', ACTION),
+    Game('Симулятор компьютерного вируса', 'virus_simulator', SIM),
+    Game('Симулятор стройки', 'construction_simulator', SIM),
+    Game('Школа', 'school_simulator', SIM),
+    Game('Сложный Math Quiz', 'hard_math_quiz', QUIZ),
+    Game('Кликер', 'clicker', REACTION),
+    Game('Math Quiz на время', 'timed_math_quiz', QUIZ),
+    Game('Очень сложный Math Quiz', 'very_hard_math_quiz', QUIZ),
+    Game('Math Quiz но с другими игроками', 'math_quiz_vs_players', QUIZ, multiplayer=True),
+    Game('Планетарий', 'planetarium', STORY),
+    Game('Ожившие планеты', 'living_planets', STORY),
+    Game('Звёзды', 'stars_game', STORY),
+    Game('Блеск', 'shine_game', STORY),
+    Game('Quiz (basic)', 'quiz_easy', QUIZ),
+    Game('Сложный Quiz', 'quiz_hard', QUIZ),
+    Game('Quiz на время', 'quiz_timed', QUIZ),
+    Game('Очень сложный Quiz', 'quiz_very_hard', QUIZ),
+    Game('Quiz но с другими игроками', 'quiz_vs_players', QUIZ, multiplayer=True),
+    Game('Сапёр с другими игроками', 'minesweeper:minesweeper_vs_players', PUZZLE, multiplayer=True),
+    Game('Догонялки с другими игроками', 'chase_vs_players', ACTION, multiplayer=True),
+    Game('Догонялки с мячом с другими игроками', 'chase_ball_vs_players', ACTION, multiplayer=True),
+    Game('Кликер с другими игроками', 'clicker_vs_players', REACTION, multiplayer=True),
+    Game('Memory с другими игроками', 'memory_vs_players', MEMORY, multiplayer=True),
+    Game('Pizza Memory с другими игроками', 'pizza_memory_vs_players', MEMORY, multiplayer=True),
+    Game('Food Memory с другими игроками', 'food_memory_vs_players', MEMORY, multiplayer=True),
+    Game('Sound Memory с другими игроками', 'sound_memory_vs_players', MEMORY, multiplayer=True),
+    Game('Симулятор стройки с другими игроками', 'construction_vs_players', SIM, multiplayer=True),
+    Game('Комнаты с другими игроками', 'rooms_vs_players', STORY, multiplayer=True),
+    Game('Проклятие с другими игроками', 'curse_vs_players', HORROR, multiplayer=True),
+    Game('Живой автомобиль с глазами и ртом с другими игроками', 'living_car_vs_players', SIM, multiplayer=True),
+    Game('Месть', 'revenge_game', STORY),
+    Game('Довольная машина', 'happy_car', SIM),
+    Game('Путь', 'the_path', STORY),
+    Game('Свет выключен', 'lights_out', HORROR),
+    Game('Страхолюдина', 'scareman', HORROR),
+    Game('Клоун', 'clown_game', HORROR),
+    Game('Духи месяцев года', 'spirits_months', STORY),
+    Game('Духи времён года', 'spirits_seasons', STORY),
+    Game('Духи дней недели', 'spirits_weekdays', STORY),
+    Game('Заброшка', 'abandoned_place', HORROR),
+    Game('Зомби апокалипсис', 'zombie_apocalypse', HORROR),
+    Game('Не ешь кекс', 'dont_eat_cake', HORROR),
+    Game('5 ночей с Freddy', 'five_nights_freddy', HORROR),
+    Game('БЕГИ', 'run_run_run', ACTION),
+    Game('Будь тише!', 'be_quieter', HORROR),
+    Game('Странности', 'oddities', HORROR),
+    Game('Говори с планетами', 'talk_planets', STORY),
+    Game('Конец света', 'apocalypse', SIM),
+    Game('Способность оживлять', 'revive_ability', STORY),
+    Game('Месть с другими игроками', 'revenge_vs_players', STORY, multiplayer=True),
+    Game('Конец света с другими игроками', 'apocalypse_vs_players', SIM, multiplayer=True),
+    Game('5 ночей с Freddy с другими игроками', 'five_nights_vs_players', HORROR, multiplayer=True),
+    Game('Заброшка с другими игроками', 'abandoned_vs_players', HORROR, multiplayer=True),
+    Game('Странности с другими игроками', 'oddities_vs_players', HORROR, multiplayer=True),
+    Game('Способность оживлять с другими игроками', 'revive_vs_players', STORY, multiplayer=True),
 ]
 
+def register_game(title, target, category, multiplayer=False):
+    """
+    Добавить игру в меню. target — функция или строка 'модуль:функция'
+    (модуль импортируется только когда игру запустят).
+    """
+    game = Game(title, target, category, multiplayer)
+    GAMES.append(game)
+    return game
+
+def find_game(name):
+    """
+    Найти запись реестра по имени функции или названию.
+    """
+    for game in GAMES:
+        target = game.target if isinstance(game.target, str) else game.target.__name__
+        if name in (game.title, target, target.rpartition(':')[2]):
+            return game
+    raise KeyError(name)
+
+# -------------------------
+# Profiling (по желанию)
+# MINIGAMES_PROFILE_DIR=каталог (или --profile каталог) включает профилирование
+# каждого запуска игры; MINIGAMES_PROFILE=cpu,mem выбирает, что собирать
+# (по умолчанию оба). Для каждой игры в каталоге копятся:
+#   <игра>.prof — суммарная статистика cProfile (читается pstats/snakeviz),
+#   <игра>.json — число запусков, время, пик памяти, места выделения памяти,
+#   <игра>.txt  — читаемый отчёт по двум файлам выше.
+# Отчёты суммируются между запусками и сессиями (и между процессами, если
+# каталог общий). tracemalloc — на весь процесс: при нескольких сессиях
+# на сервере пик памяти включает и соседние сессии. cProfile в процессе
+# может работать только один (с Python 3.12 второй падает с «Another
+# profiling tool is already active»), поэтому пока одна сессия сервера
+# профилируется, игры других сессий идут без cpu — в отчёте они считаются
+# в «без cProfile».
+# -------------------------
+PROFILE_DIR = os.environ.get('MINIGAMES_PROFILE_DIR') or None
+PROFILE_MODES = set(os.environ.get('MINIGAMES_PROFILE', 'cpu,mem').split(','))
+PROFILE_TOP = 25
+
+_profile_lock = None
+_cpu_lock = None            # занят, пока работает cProfile
+_tracemalloc_users = 0
+
+def launch(game):
+    """
+    Запустить игру из реестра — с профилированием, если оно включено.
+    """
+    if PROFILE_DIR is None:
+        return game.load()()
+    return _launch_profiled(game)
+
+def _launch_profiled(game):
+    import cProfile
+    import threading
+    import tracemalloc
+    global _profile_lock, _cpu_lock, _tracemalloc_users
+    if _profile_lock is None:
+        _profile_lock = threading.Lock()
+        _cpu_lock = threading.Lock()
+    func = game.load()
+    name = func.__name__ if callable(game.target) else game.target.replace(':', '.')
+    cpu = 'cpu' in PROFILE_MODES and _cpu_lock.acquire(blocking=False)
+    prof = cProfile.Profile() if cpu else None
+    skipped = 'cpu' in PROFILE_MODES and not cpu
+    mem = 'mem' in PROFILE_MODES
+    best = {'size': 0, 'snapshot': None}
+
+    def probe():
+        # снимок в момент ожидания ввода, когда всё состояние игры ещё живо
+        size = tracemalloc.get_traced_memory()[0]
+        if size > best['size']:
+            best['size'] = size
+            best['snapshot'] = tracemalloc.take_snapshot()
+
+    if mem:
+        with _profile_lock:
+            if _tracemalloc_users == 0:
+                tracemalloc.start()
+            _tracemalloc_users += 1
+        tracemalloc.reset_peak()
+    token = _input_probe.set(probe) if mem else None
+    t0 = time.perf_counter()
+    try:
+        return prof.runcall(func) if prof else func()
+    finally:
+        wall = time.perf_counter() - t0
+        if cpu:
+            _cpu_lock.release()
+        peak = 0
+        if mem:
+            _input_probe.reset(token)
+            probe()
+            peak = tracemalloc.get_traced_memory()[1]
+            with _profile_lock:
+                _tracemalloc_users -= 1
+                if _tracemalloc_users == 0:
+                    tracemalloc.stop()
+        with _profile_lock:
+            _write_profile(name, prof, wall, peak, best['snapshot'], skipped)
+
+def _write_profile(name, prof, wall, peak, snapshot, cpu_skipped=False):
+    import json
+    import pstats
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    base = os.path.join(PROFILE_DIR, name)
+    summary = {'runs': 0, 'wall_total': 0.0, 'wall_max': 0.0, 'peak_max': 0, 'alloc_sites': {},
+               'cpu_skipped': 0}
+    if os.path.exists(base + '.json'):
+        with open(base + '.json', encoding='utf-8') as f:
+            summary.update(json.load(f))
+    summary['runs'] += 1
+    summary['wall_total'] += wall
+    summary['wall_max'] = max(summary['wall_max'], wall)
+    summary['peak_max'] = max(summary['peak_max'], peak)
+    summary['cpu_skipped'] += cpu_skipped
+    if snapshot is not None:
+        import tracemalloc
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        sites = summary['alloc_sites']
+        for stat in snapshot.statistics('lineno')[:PROFILE_TOP]:
+            frame = stat.traceback[0]
+            key = f'{frame.filename}:{frame.lineno}'
+            sites[key] = max(sites.get(key, 0), stat.size)
+        summary['alloc_sites'] = dict(sorted(sites.items(), key=lambda kv: -kv[1])[:PROFILE_TOP])
+    with open(base + '.json', 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    with open(base + '.txt', 'w', encoding='utf-8') as f:
+        f.write(f'Игра: {name}\n')
+        f.write(f'Запусков: {summary["runs"]}, время всего: {summary["wall_total"]:.2f}s, '
+                f'самый долгий: {summary["wall_max"]:.2f}s\n')
+        f.write(f'Пик памяти (tracemalloc): {summary["peak_max"] / 1024:.1f} KiB\n')
+        if summary['cpu_skipped']:
+            f.write(f'Без cProfile (профилировалась другая сессия): {summary["cpu_skipped"]}\n')
+        if summary['alloc_sites']:
+            f.write('\nКрупнейшие места выделения памяти:\n')
+            for key, size in summary['alloc_sites'].items():
+                f.write(f'  {size / 1024:10.1f} KiB  {key}\n')
+        stats = None
+        if os.path.exists(base + '.prof'):
+            stats = pstats.Stats(base + '.prof', stream=f)
+        if prof is not None:
+            if stats is not None:
+                stats.add(prof)
+            else:
+                stats = pstats.Stats(prof, stream=f)
+            stats.dump_stats(base + '.prof')
+        if stats is not None:
+            f.write('\nСамые затратные функции (cumulative):\n')
+            stats.sort_stats('cumulative').print_stats(PROFILE_TOP)
+
 # -------------------------
 # Main menu & launcher
 # -------------------------
-def main_menu():
+def main_menu(seed=None):
+    """
+    Меню хаба. seed — сид сессии: из него выводятся сиды всех запусков игр,
+    так что та же последовательность ввода с тем же сидом повторяет сессию.
+    Без seed сид берётся из текущего генератора.
+    """
+    if seed is None:
+        seed = get_rng().randrange(2**32)
+    session = random.Random(seed)
+    next_seed = None
+    last_seed = None
     while True:
         clear()
-        print('=== Minigames Hub (Python, no external modules) ===\n')
-        for idx, (title, _) in enumerate(GAMES, start=1):
-            print(f'{idx}. {title}')
-        print('0. Выход')
-        choice = input_int('\nВыберите игру (номер): ', 0, len(GAMES))
-        if choice is None:
+        out('=== Minigames Hub (Python, no external modules) ===\n')
+        out('\n'.join(f'{idx}. {game.title}' for idx, game in enumerate(GAMES, start=1)))
+        out('0. Выход')
+        seeds = f'\nСид сессии: {seed}'
+        if last_seed is not None:
+            seeds += f', сид прошлой игры: {last_seed}'
+        if next_seed is not None:
+            seeds += f', сид следующей игры: {next_seed}'
+        out(seeds)
+        cmd = ask('\nВыберите игру (номер, s — задать сид игры): ').strip().lower()
+        if cmd == '':
+            continue
+        if cmd == 's':
+            next_seed = input_int('Сид следующей игры (Enter — случайный): ', 0)
+            continue
+        try:
+            choice = int(cmd)
+        except ValueError:
+            out('Введите целое число.')
+            press_enter()   # иначе clear() в начале цикла сотрёт сообщение
+            continue
+        if not 0 <= choice <= len(GAMES):
+            out(f'Введите число от 0 до {len(GAMES)}.')
+            press_enter()
             continue
         if choice == 0:
-            print('Пока! Спасибо за игру.')
-            time.sleep(0.3)
+            out('Пока! Спасибо за игру.')
+            sleep(0.3)
             break
-        game = GAMES[choice-1][1]
+        game = GAMES[choice-1]
+        game_seed = session.randrange(2**32) if next_seed is None else next_seed
+        next_seed = None
+        last_seed = game_seed
         try:
-            game()
+            with use_rng(game_seed):
+                launch(game)
+        except EOFError:
+            raise
         except Exception as e:
-            print('Произошла ошибка в игре:', e)
+            out('Произошла ошибка в игре:', e)
             import traceback
-            traceback.print_exc()
+            out(traceback.format_exc(), end='')
             press_enter()
 
+# -------------------------
+# Server: много игроков в одном процессе
+# Построчный TCP-протокол (подходит telnet / nc). Сетевой ввод/вывод всех
+# подключений обслуживает один цикл asyncio; игры синхронные, поэтому каждая
+# сессия main_menu живёт в своём потоке с маленьким стеком и своей консолью.
+# -------------------------
+SESSION_STACK_SIZE = 256 * 1024
+SESSION_TERMINAL = os.terminal_size((80, 24))
+
+class _StreamIn:
+    """
+    stdin для потока сессии: readline() ждёт строку из asyncio.StreamReader.
+    """
+    def __init__(self, reader, loop):
+        self.reader = reader
+        self.loop = loop
+
+    def readline(self):
+        import asyncio
+        import re
+        fut = asyncio.run_coroutine_threadsafe(self.reader.readline(), self.loop)
+        try:
+            data = fut.result()
+        except Exception:
+            # соединение разорвано или сервер останавливается
+            return ''
+        # убрать команды согласования telnet (IAC ...)
+        data = re.sub(rb'\xff[\xfb-\xfe].|\xff[\xf0-\xfa]', b'', data)
+        return data.decode('utf-8', 'replace')
+
+class _StreamOut:
+    """
+    stdout для потока сессии: пишет в asyncio.StreamWriter через цикл событий.
+    """
+    def __init__(self, writer, loop):
+        self.writer = writer
+        self.loop = loop
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        data = text.replace('\n', '\r\n').encode('utf-8')
+        try:
+            self.loop.call_soon_threadsafe(self._write, data)
+        except RuntimeError:
+            pass  # цикл уже закрыт
+
+    def _write(self, data):
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+    def flush(self):
+        # ждём, пока клиент заберёт данные, — медленный клиент не раздует буфер
+        import asyncio
+        try:
+            asyncio.run_coroutine_threadsafe(self.writer.drain(), self.loop).result()
+        except Exception:
+            pass
+
+def _run_session(console):
+    with use_console(console):
+        try:
+            main_menu(new_seed())
+        except (EOFError, KeyboardInterrupt):
+            pass
+        finally:
+            console.flush()
+
+def _start_session_thread(target):
+    """
+    Запустить target в фоновом потоке со стеком SESSION_STACK_SIZE. Размер
+    стека в threading общий для процесса, поэтому он ставится только на время
+    создания потока и сразу возвращается прежним.
+    """
+    import threading
+    old = threading.stack_size(SESSION_STACK_SIZE)
+    try:
+        thread = threading.Thread(target=target, name='session', daemon=True)
+        thread.start()
+    finally:
+        threading.stack_size(old)
+    return thread
+
+def serve(host='127.0.0.1', port=2323, max_sessions=1000):
+    """
+    Запустить многопользовательский сервер: каждое подключение получает свою
+    сессию main_menu в своём потоке. Одновременно — не больше max_sessions
+    сессий, остальным подключениям сервер отвечает, что переполнен.
+    Блокирует до Ctrl+C.
+    """
+    import asyncio
+    active = 0
+
+    async def handle(reader, writer):
+        nonlocal active
+        loop = asyncio.get_running_loop()
+        if active >= max_sessions:
+            writer.write('Сервер переполнен, попробуйте позже.\r\n'.encode('utf-8'))
+            writer.close()
+            return
+        active += 1
+        console = TerminalConsole(_StreamIn(reader, loop), _StreamOut(writer, loop),
+                                  ansi=True, size=SESSION_TERMINAL)
+        done = loop.create_future()
+
+        def run():
+            try:
+                _run_session(console)
+            finally:
+                try:
+                    loop.call_soon_threadsafe(lambda: done.done() or done.set_result(None))
+                except RuntimeError:
+                    pass    # сервер уже остановлен
+        try:
+            _start_session_thread(run)
+            await done
+        finally:
+            active -= 1
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, host, port)
+        out(f'Сервер слушает {host}:{port} (до {max_sessions} игроков). Ctrl+C — остановить.')
+        flush()     # вывод консоли буферизован, а дальше сервер только ждёт
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
 if __name__ == '__main__':
+    args = sys.argv[1:]
+    if '--fast' in args:
+        _default_clock = FastClock()
+    if '--profile' in args:
+        i = args.index('--profile') + 1
+        PROFILE_DIR = args[i] if i < len(args) and not args[i].startswith('--') else 'profiles'
+    if '--serve' in args:
+        i = args.index('--serve') + 1
+        addr = args[i] if i < len(args) and not args[i].startswith('--') else '2323'
+        host, _, port = addr.rpartition(':')
+        try:
+            serve(host or '127.0.0.1', int(port))
+        except KeyboardInterrupt:
+            out('\nСервер остановлен.')
+        finally:
+            flush()
+        sys.exit(0)
+    seed = None
+    if '--seed' in args:
+        i = args.index('--seed') + 1
+        seed = int(args[i]) if i < len(args) and args[i].isdigit() else None
     try:
-        main_menu()
-    except KeyboardInterrupt:
-        print('\nВыход. До свидания.')
+        main_menu(seed)
+    except (KeyboardInterrupt, EOFError):
+        out('\nВыход. До свидания.')
+        get_console().flush()
         sys.exit(0)
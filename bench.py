@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# bench.py
+# Бенчмарки горячих мест хаба (только стандартная библиотека).
+#
+#   python bench.py                          # прогнать всё, таблица в консоль
+#   python bench.py --json out.json          # сохранить результаты в JSON
+#   python bench.py --baseline base.json     # сравнить с базой, код 1 при регрессии
+#   python bench.py -k minesweeper --quick   # только часть, быстро
+#
+# Игры гоняются целиком через run_scripted (HeadlessConsole + VirtualClock),
+# поэтому паузы не ждут, а меряется именно работа Python-кода.
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+import Littleminigames as hub
+from glass_bridge import glass_bridge_simulate
+from minesweeper import MineSolver, minesweeper, minesweeper_generate, minesweeper_vs_players
+from russian_roulette import ROULETTE_RULES, _ROULETTE_MEMO, roulette_elimination, roulette_simulate
+from snake_game import SnakeAutopilot, SnakeBoard, snake_game
+from snakes_and_ladders import SNL_LADDERS, SNL_SIZE, SNL_SNAKES, SnakesLaddersChain, snl_table, snl_tournament
+from sugar_hives import HiveBoard, sugar_hives
+
+# -------------------------
+# Registry
+# -------------------------
+BENCHMARKS = []
+
+def benchmark(name, **grid):
+    """
+    Зарегистрировать бенчмарк. Функция получает параметры из grid
+    (все комбинации) и возвращает функцию без аргументов — её и меряем.
+    """
+    def deco(setup):
+        BENCHMARKS.append((name, setup, grid))
+        return setup
+    return deco
+
+def cases(selected=None):
+    for name, setup, grid in BENCHMARKS:
+        keys = list(grid)
+        for values in itertools.product(*(grid[k] for k in keys)):
+            params = dict(zip(keys, values))
+            case = name + ''.join(f'[{k}={v}]' for k, v in params.items())
+            if selected and not any(s in case for s in selected):
+                continue
+            yield case, setup, params
+
+def scripted(game, inputs, seed=1):
+    return lambda: hub.run_scripted(game, inputs, seed=seed)
+
+# -------------------------
+# Benchmarks
+# -------------------------
+@benchmark('minesweeper_generate', size=(16, 64, 200))
+def bench_minesweeper_generate(size):
+    mines = size * size // 6
+    return scripted(minesweeper, [size, size, mines, 'n', f'r {size//2} {size//2}', 'q', ''])
+
+@benchmark('minesweeper_flood_fill', size=(16, 64, 200))
+def bench_minesweeper_flood_fill(size):
+    # одна мина — первое открытие раскрывает почти всё поле
+    return scripted(minesweeper, [size, size, 1, 'n', f'r {size//2} {size//2}', 'q', ''])
+
+@benchmark('minesweeper_no_guess', size=((9, 9, 10), (16, 16, 40), (16, 30, 99)))
+def bench_minesweeper_no_guess(size):
+    rows, cols, mines = size
+    def run():
+        for seed in range(10):
+            minesweeper_generate(rows, cols, mines, random.Random(seed), (rows//2, cols//2), True)
+    return run
+
+@benchmark('minesweeper_solver_game', size=((9, 9, 10), (16, 30, 99)))
+def bench_minesweeper_solver_game(size):
+    # партия целиком ходами решателя (best_move на каждый ход)
+    rows, cols, mines = size
+    def run():
+        field, _ = minesweeper_generate(rows, cols, mines, random.Random(1), (rows//2, cols//2))
+        field.reveal(field.index(rows//2, cols//2))
+        memo = {}
+        while field.hidden_safe > 0:
+            solver = MineSolver(field, mines, memo)
+            solver.scan()
+            i, p = solver.best_move()
+            if field.mine[i]:
+                break
+            field.reveal(i)
+    return run
+
+@benchmark('minesweeper_vs_players', players=(4, 100), size=(16, 64), skill=(0, 10))
+def bench_minesweeper_vs_players(players, size, skill):
+    mines = size * size // 10
+    return scripted(minesweeper_vs_players, [players, size, size, mines, skill] + ['', ''] * 200)
+
+@benchmark('sugar_hives_moves', size=(6, 20, 60))
+def bench_sugar_hives(size):
+    r = random.Random(size)
+    moves = []
+    for _ in range(50):
+        a, b = r.randrange(size), r.randrange(size - 1)
+        moves.append(f'{a} {b} {a} {b+1}' if r.random() < 0.5 else f'{b} {a} {b+1} {a}')
+    return scripted(sugar_hives, [1, size, size, ''] + moves + [''])
+
+@benchmark('sugar_hives_marathon', size=(100, 200))
+def bench_sugar_hives_marathon(size):
+    # 20 годных ходов (по подсказке) на большом поле вместе с каскадами
+    def run():
+        board = HiveBoard(size, size, ['*', '#', '@', '%'], random.Random(size))
+        for _ in range(20):
+            i, j = board.hint()
+            board.swap(i, j)
+            board.resolve([i, j])
+            if not board.move_count:
+                board.shuffle()
+    return run
+
+@benchmark('snake_steps', size=(10, 40, 100))
+def bench_snake(size):
+    k = max(1, size // 4)
+    loop = ['d'] * k + ['s'] * k + ['a'] * k + ['w'] * k
+    return scripted(snake_game, [size, '1', ''] + loop * 10 + ['q', ''])
+
+@benchmark('snake_autopilot', size=(10, 40, 100))
+def bench_snake_autopilot(size):
+    # 5000 шагов автопилота без экрана
+    def run():
+        rnd = random.Random(size)
+        board = SnakeBoard(size, size, rnd)
+        pilot = SnakeAutopilot(board)
+        for _ in range(5000):
+            d = pilot.decide()
+            if d is None or board.step(d, rnd) == 'crash' or board.food is None:
+                break
+    return run
+
+@benchmark('snl_chain', size=(100, 400))
+def bench_snl_chain(size):
+    # точный разбор поля без кеша
+    return lambda: SnakesLaddersChain(SNL_LADDERS, SNL_SNAKES, size)
+
+@benchmark('snl_tournament', seats=(2, 4))
+def bench_snl_tournament(seats):
+    # 10000 партий пакетным движком
+    table = snl_table()
+    return lambda: snl_tournament(table, SNL_SIZE, seats, 10000, random.Random(seats))
+
+@benchmark('glass_bridge_simulate', bridge=((18, 16), (1000, 100000)))
+def bench_glass_bridge_simulate(bridge):
+    # 1000 прогонов шоу без экрана
+    length, players = bridge
+    def run():
+        rnd = random.Random(length)
+        for _ in range(1000):
+            glass_bridge_simulate(length, players, rnd)
+    return run
+
+@benchmark('roulette_simulate', rule=('spin', 'nospin'))
+def bench_roulette_simulate(rule):
+    # 10000 партий 6 гнёзд / 2 патрона / 4 игрока на модели барабана
+    def run():
+        rnd = random.Random(6)
+        for _ in range(10000):
+            roulette_simulate(6, 2, 4, rule, rnd)
+    return run
+
+@benchmark('roulette_elimination', players=(6, 50))
+def bench_roulette_elimination(players):
+    # точный разбор без кеша конфигураций
+    def run():
+        _ROULETTE_MEMO.clear()
+        for rule in ROULETTE_RULES:
+            roulette_elimination(6, 5, players, rule)
+    return run
+
+@benchmark('memory_vs_players_turns', players=(4, 16), pairs=(8, 32))
+def bench_memory_vs_players(players, pairs):
+    r = random.Random(pairs)
+    picks = [str(r.randrange(pairs * 2)) for _ in range(400)]
+    return scripted(hub.memory_vs_players, [players, pairs] + picks)
+
+@benchmark('simulate_npc_choice', choices=(3, 30, 300))
+def bench_simulate_npc_choice(choices):
+    opts = [f'c{i}' for i in range(choices)]
+    bias = {opts[0]: 2.0, opts[-1]: 1.0}
+    def run():
+        with hub.use_rng(1):
+            for _ in range(200):
+                hub.simulate_npc_choice('P2', opts, bias)
+    return run
+
+@benchmark('chase_vs_players', players=(5, 50), length=(30, 300))
+def bench_chase_vs_players(players, length):
+    # вся партия: ходы, проверка поимок и финиша, пока не останется один
+    return scripted(hub.chase_vs_players, [players, length, ''] + ['r'] * 400 + [''])
+
+# -------------------------
+# Runner
+# -------------------------
+def measure(func, repeat, min_time):
+    """
+    Как timeit: подобрать число повторов на замер не короче min_time,
+    сделать repeat замеров и вернуть времена одного вызова.
+    """
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            func()
+        dt = time.perf_counter() - t0
+        if dt >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2 if dt == 0 else max(2, min(10, int(min_time / dt) + 1))
+    times = [dt / loops]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            func()
+        times.append((time.perf_counter() - t0) / loops)
+    return times, loops
+
+def run(selected=None, repeat=5, min_time=0.2):
+    results = {}
+    for case, setup, params in cases(selected):
+        times, loops = measure(setup(**params), repeat, min_time)
+        results[case] = {
+            'best': min(times),
+            'median': statistics.median(times),
+            'loops': loops,
+            'repeat': repeat,
+        }
+        print(f'{case:55s} {results[case]["median"]*1e3:10.3f} ms', flush=True)
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Вернуть список регрессий: случаи, где медиана выросла больше чем в threshold раз.
+    """
+    regressions = []
+    for case, res in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        ratio = res['median'] / base['median'] if base['median'] else float('inf')
+        mark = 'REGRESSION' if ratio > threshold else ''
+        print(f'{case:55s} x{ratio:6.2f} {mark}')
+        if ratio > threshold:
+            regressions.append((case, ratio))
+    return regressions
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Бенчмарки Minigames Hub')
+    ap.add_argument('-k', dest='selected', action='append',
+                    help='запускать только случаи, содержащие подстроку (можно несколько)')
+    ap.add_argument('--json', help='записать результаты в JSON-файл')
+    ap.add_argument('--baseline', help='JSON с базовыми результатами для сравнения')
+    ap.add_argument('--threshold', type=float, default=1.25,
+                    help='допустимый рост медианы относительно базы (по умолчанию 1.25)')
+    ap.add_argument('--repeat', type=int, default=5)
+    ap.add_argument('--quick', action='store_true', help='меньше повторов (для быстрой проверки)')
+    args = ap.parse_args(argv)
+    repeat, min_time = (2, 0.02) if args.quick else (args.repeat, 0.2)
+    results = run(args.selected, repeat, min_time)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'results': results,
+            }, f, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'\nРегрессий: {len(regressions)} (порог x{args.threshold})')
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# bridgestats.py
+# Стеклянный мост в формате шоу: проверка точного распределения выживших
+# симуляцией (только стандартная библиотека).
+#
+#   python bridgestats.py                            # стандартные мосты, по 200000 прогонов
+#   python bridgestats.py 18x16 40x100000 -n 1000000 # свои мосты (длина x участники)
+#   python bridgestats.py -j 8 --seed 7              # 8 процессов, другой сид
+#   python bridgestats.py --json bridge.json         # сохранить результаты в JSON
+#
+# Прогоны режутся на пачки со своим сидом из (--seed, мост, номер пачки),
+# поэтому результат не зависит от числа процессов.
+# Для каждого моста печатаются точное и симулированное среднее число
+# выживших и по каждому исходу (с ожидаемой частотой от 5) — z-оценка
+# отклонения частоты от точной вероятности. Код выхода 1, если где-то
+# |z| > 5 или выпал исход с нулевой точной вероятностью.
+
+import argparse
+import math
+import sys
+
+from glass_bridge import glass_bridge_simulate, glass_bridge_survivors
+from statutil import add_run_args, mean_ci, run_chunks, worker_pool, write_json
+
+PRESETS = ((18, 16), (18, 456), (100, 60), (1000, 100000))
+CHUNK = 20000
+Z_FAIL = 5.0
+
+def run_chunk(length, players, rnd, runs):
+    """
+    Пачка прогонов (выполняется в процессе пула): (исход -> число, сумма, сумма квадратов).
+    """
+    counts = {}
+    total = total_sq = 0
+    for _ in range(runs):
+        s = glass_bridge_simulate(length, players, rnd)
+        counts[s] = counts.get(s, 0) + 1
+        total += s
+        total_sq += s * s
+    return counts, total, total_sq
+
+def check(length, players, runs, pool=None, seed=0):
+    dist = glass_bridge_survivors(length, players)
+    parts, seconds = run_chunks(run_chunk, (length, players), runs, CHUNK, pool, seed,
+                                key=f'{length}x{players}')
+    counts = {}
+    total = total_sq = 0
+    for part_counts, part_total, part_sq in parts:
+        for s, n in part_counts.items():
+            counts[s] = counts.get(s, 0) + n
+        total += part_total
+        total_sq += part_sq
+    worst = 0.0
+    for s, p in enumerate(dist):
+        # на исходах с ожидаемой частотой меньше 5 нормальное приближение не работает
+        if runs * p >= 5 and p < 1:
+            z = (counts.get(s, 0) - runs * p) / math.sqrt(runs * p * (1 - p))
+            worst = max(worst, abs(z))
+    unexpected = sum(n for s, n in counts.items() if dist[s] == 0)
+    return {
+        'bridge': f'{length}x{players}',
+        'runs': runs,
+        'mean_exact': sum(s * p for s, p in enumerate(dist)),
+        'mean_ci95': list(mean_ci(total, total_sq, runs)),
+        'max_abs_z': worst,
+        'impossible_outcomes': unexpected,
+        'ok': worst <= Z_FAIL and unexpected == 0,
+        'seconds': seconds,
+    }
+
+def report(res):
+    m, lo, hi = res['mean_ci95']
+    return (f"Мост {res['bridge']}: {res['runs']} прогонов за {res['seconds']:.1f} с "
+            f"({res['runs'] / max(res['seconds'], 1e-9):.0f} прогонов/с)\n"
+            f"  выживших: {m:.3f} [{lo:.3f} .. {hi:.3f}], точно {res['mean_exact']:.3f}\n"
+            f"  max |z| по исходам: {res['max_abs_z']:.2f}"
+            + ('' if res['ok'] else '   РАСХОЖДЕНИЕ'))
+
+def parse_bridge(text):
+    try:
+        length, players = (int(x) for x in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'ожидается ДЛИНАxУЧАСТНИКИ, например 18x16: {text!r}')
+    if length < 1 or players < 1:
+        raise argparse.ArgumentTypeError(f'некорректный мост: {text!r}')
+    return length, players
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Проверка точного распределения выживших на стеклянном мосту')
+    ap.add_argument('bridges', nargs='*', type=parse_bridge,
+                    help='мосты вида 18x16 (по умолчанию: ' + ' '.join('x'.join(map(str, b)) for b in PRESETS) + ')')
+    add_run_args(ap, 200000, 'прогонов на мост', dest='runs')
+    args = ap.parse_args(argv)
+    results = []
+    with worker_pool(args.workers) as pool:
+        for length, players in args.bridges or PRESETS:
+            res = check(length, players, args.runs, pool, args.seed)
+            results.append(res)
+            print(report(res), flush=True)
+    write_json(args.json, args.seed, results)
+    return 0 if all(r['ok'] for r in results) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
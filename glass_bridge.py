@@ -0,0 +1,147 @@
+# glass_bridge.py
+# «Стеклянный мост»: точное распределение выживших, прогон шоу без экрана
+# и игра — в одиночку или шоу с другими участниками.
+
+from Littleminigames import ask, clear, input_int, out, press_enter, rng, sleep
+
+# -----------------------
+# 6) Стеклянный мост (Glass Bridge) - choose safe tiles
+# -----------------------
+def glass_bridge_survivors(length, players):
+    """
+    Точное распределение числа выживших в шоу: dist[s] — вероятность, что
+    мост пройдут ровно s из players. Каждую плитку, на которую ещё никто не
+    наступал, проверяет ровно один участник — первый дошедший до неё; с
+    вероятностью 1/2 он её разбивает, и её безопасная сторона становится
+    известна всем, кто идёт следом. Поэтому число упавших — Binomial(length, 1/2),
+    обрезанное на players. Считается в целых числах, во float переводится
+    только ответ.
+    """
+    total = 1 << length
+    dist = [0.0] * (players + 1)
+    c = 1
+    below = 0
+    for k in range(min(length, players - 1) + 1):
+        dist[players - k] = c / total
+        below += c
+        c = c * (length - k) // (k + 1)
+    dist[0] = (total - below) / total
+    return dist
+
+def glass_bridge_seat_chance(length, seat):
+    """
+    Шанс дойти для участника, идущего seat-м: до него должно упасть меньше seat.
+    """
+    c = 1
+    below = 0
+    for k in range(min(length, seat - 1) + 1):
+        below += c
+        c = c * (length - k) // (k + 1)
+    return below / (1 << length)
+
+def glass_bridge_simulate(length, players, rnd):
+    """
+    Прогон шоу без экрана, вернуть число выживших. Исходы первых шагов по
+    неизвестным плиткам — строка случайных бит ('1' — угадал, '0' — разбил):
+    участник проходит известную часть моста и идёт до первого '0' после неё,
+    который ищет str.find, так что участник стоит O(1) вызовов.
+    """
+    bits = format(rnd.getrandbits(length), f'0{length}b')
+    front = 0
+    for k in range(players):
+        miss = bits.find('0', front)
+        if miss < 0:
+            return players - k
+        front = miss + 1
+    return 0
+
+def glass_bridge_show():
+    """
+    Шоу: участники идут по мосту по очереди, разбитая плитка показывает
+    безопасную сторону всем, кто идёт следом. Вы — один из участников.
+    """
+    length = input_int('Длина моста (по умолчанию 18): ', 1) or 18
+    players = input_int('Участников (по умолчанию 16): ', 1) or 16
+    seat = input_int(f'Ваш номер 1..{players} (Enter — жребий): ', 1, players) or rng.randint(1, players)
+    dist = glass_bridge_survivors(length, players)
+    expected = sum(s * p for s, p in enumerate(dist))
+    out(f'Вы идёте {seat}-м. Шанс дойти: {glass_bridge_seat_chance(length, seat):.1%}. '
+        f'В среднем мост проходят {expected:.1f} из {players}.')
+    press_enter()
+    safe = [rng.choice(['L','R']) for _ in range(length)]
+    front = 0    # плитки до front уже известны всем
+    fallen = 0
+    alive = True
+    for k in range(1, players + 1):
+        if front == length:
+            out(f'Мост известен целиком: оставшиеся {players - k + 1} проходят его без риска.')
+            break
+        if k != seat:
+            while front < length:
+                front += 1
+                if rng.choice(['L','R']) != safe[front - 1]:
+                    fallen += 1
+                    out(f'Участник {k} разбил плитку на шаге {front}.')
+                    break
+            else:
+                out(f'Участник {k} угадал все оставшиеся плитки!')
+            sleep(0.3)
+            continue
+        clear()
+        out(f'Ваша очередь. Известно плиток: {front} из {length}.')
+        while front < length:
+            out('Мост: ' + ' '.join(safe[:front] + ['?'] * (length - front)))
+            choice = ask(f'Шаг {front+1}/{length} (L/R): ').strip().upper()
+            if choice == '':
+                out('Вы вышли.')
+                press_enter()
+                return
+            if choice not in ('L','R'):
+                out('Неверный ввод.')
+                continue
+            front += 1
+            if choice == safe[front - 1]:
+                out('Удачно! Идём дальше.')
+            else:
+                out('Хруст! Вы упали через стекло.')
+                fallen += 1
+                alive = False
+                break
+        press_enter()
+    out(f'Мост прошли {players - fallen} из {players}.')
+    out('Вы прошли мост. Ура!' if alive else 'Вы не дошли.')
+    press_enter()
+
+def glass_bridge():
+    clear()
+    out('=== Стеклянный мост ===')
+    out('1) Один игрок   2) Шоу: участники идут по очереди')
+    mode = input_int('Режим (по умолчанию 1): ', 1, 2) or 1
+    if mode == 2:
+        glass_bridge_show()
+        return
+    length = input_int('Длина моста (по умолчанию 12): ', 4) or 12
+    # each step has two tiles (left/right), only one safe
+    safe = [rng.choice(['L','R']) for _ in range(length)]
+    pos = 0
+    out('На каждом шаге выберите L или R. Неправильный шаг — падение.')
+    press_enter()
+    while pos < length:
+        clear()
+        out(f'Шаг {pos+1}/{length}')
+        choice = ask('Выберите (L/R): ').strip().upper()
+        if choice == '':
+            out('Вы вышли.')
+            break
+        if choice not in ('L','R'):
+            out('Неверный ввод.')
+            sleep(0.5); continue
+        if choice == safe[pos]:
+            out('Удачно! Идём дальше.')
+            pos += 1
+        else:
+            out('Хруст! Вы упали через стекло.')
+            press_enter()
+            return
+    out('Вы прошли мост. Ура!')
+    press_enter()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# minestats.py
+# Оценка сложности поля сапёра методом Монте-Карло (только стандартная библиотека).
+#
+#   python minestats.py                              # стандартные поля, по 10000 партий
+#   python minestats.py 9x9x10 16x30x99 -n 1000000   # свои поля (ряды x столбцы x мины)
+#   python minestats.py -n 200000 -j 8 --seed 7      # 8 процессов, другой сид
+#   python minestats.py --json stats.json            # сохранить результаты в JSON
+#
+# Каждая партия играется без терминала одной и той же политикой: первая клетка —
+# центр поля (она всегда безопасна), дальше MineSolver.best_move — доказанно
+# безопасная клетка, а если её нет — клетка с наименьшей вероятностью мины
+# («угадывание»). Партии режутся на пачки, у каждой пачки свой сид из
+# (--seed, номер пачки), поэтому результат не зависит от числа процессов.
+
+import argparse
+import sys
+
+from minesweeper import MineSolver, minesweeper_generate
+from statutil import add_run_args, mean_ci, run_chunks, wilson, worker_pool, write_json
+
+PRESETS = ((8, 8, 10), (9, 9, 10), (16, 16, 40), (16, 30, 99))
+CHUNK = 500
+
+# -------------------------
+# One game
+# -------------------------
+def play(rows, cols, mines, rnd, memo=None):
+    """
+    Сыграть одну партию решателем. Вернуть (выиграна, угадываний, открытий).
+    """
+    first = (rows // 2, cols // 2)
+    field, _ = minesweeper_generate(rows, cols, mines, rnd, first)
+    solver = MineSolver(field, mines, memo)
+    opened = []
+    field.reveal(field.index(*first), opened)
+    solver.add_revealed(opened)
+    guesses = 0
+    reveals = 1
+    while field.hidden_safe > 0:
+        i, p = solver.best_move()
+        reveals += 1
+        if p > 0:
+            guesses += 1
+        if field.mine[i]:
+            return False, guesses, reveals
+        opened = []
+        field.reveal(i, opened)
+        solver.add_revealed(opened)
+    return True, guesses, reveals
+
+def play_chunk(rows, cols, mines, rnd, games):
+    """
+    Сыграть пачку партий (выполняется в процессе пула) и вернуть сводку:
+    партии, победы, гистограмму угадываний (отдельно для побед) и суммы
+    открытий для среднего и дисперсии.
+    """
+    memo = {}
+    stats = {'games': 0, 'wins': 0, 'guesses': {}, 'win_guesses': {}, 'reveals': 0, 'reveals_sq': 0}
+    for _ in range(games):
+        won, guesses, reveals = play(rows, cols, mines, rnd, memo)
+        stats['games'] += 1
+        stats['wins'] += won
+        stats['guesses'][guesses] = stats['guesses'].get(guesses, 0) + 1
+        if won:
+            stats['win_guesses'][guesses] = stats['win_guesses'].get(guesses, 0) + 1
+        stats['reveals'] += reveals
+        stats['reveals_sq'] += reveals * reveals
+    return stats
+
+# -------------------------
+# Statistics
+# -------------------------
+def merge(a, b):
+    for key in ('games', 'wins', 'reveals', 'reveals_sq'):
+        a[key] += b[key]
+    for key in ('guesses', 'win_guesses'):
+        for k, v in b[key].items():
+            a[key][k] = a[key].get(k, 0) + v
+    return a
+
+def summarize(rows, cols, mines, stats, seconds):
+    n = stats['games']
+    lo, hi = wilson(stats['wins'], n)
+    guess_total = sum(k * v for k, v in stats['guesses'].items())
+    guess_sq = sum(k * k * v for k, v in stats['guesses'].items())
+    hist = {k: stats['guesses'][k] for k in sorted(stats['guesses'])}
+    return {
+        'board': f'{rows}x{cols}x{mines}',
+        'games': n,
+        'win_rate': stats['wins'] / n if n else 0.0,
+        'win_rate_ci95': [lo, hi],
+        'no_guess_rate': hist.get(0, 0) / n if n else 0.0,
+        'no_guess_rate_ci95': list(wilson(hist.get(0, 0), n)),
+        'mean_guesses_ci95': list(mean_ci(guess_total, guess_sq, n)),
+        'mean_reveals_ci95': list(mean_ci(stats['reveals'], stats['reveals_sq'], n)),
+        'guesses': hist,
+        'wins_by_guesses': {k: stats['win_guesses'].get(k, 0) for k in hist},
+        'seconds': seconds,
+    }
+
+# -------------------------
+# Runner
+# -------------------------
+def estimate(rows, cols, mines, games, pool=None, seed=0):
+    """
+    Сыграть games партий на поле rows x cols с mines минами и вернуть сводку.
+    pool — multiprocessing.Pool; без него всё считается в этом процессе.
+    """
+    parts, seconds = run_chunks(play_chunk, (rows, cols, mines), games, CHUNK, pool, seed,
+                                key=f'{rows}x{cols}x{mines}')
+    total = {'games': 0, 'wins': 0, 'guesses': {}, 'win_guesses': {}, 'reveals': 0, 'reveals_sq': 0}
+    for part in parts:
+        merge(total, part)
+    return summarize(rows, cols, mines, total, seconds)
+
+def report(res):
+    lo, hi = res['win_rate_ci95']
+    g, glo, ghi = res['mean_guesses_ci95']
+    r, rlo, rhi = res['mean_reveals_ci95']
+    lines = [
+        f"Поле {res['board']}: {res['games']} партий за {res['seconds']:.1f} с "
+        f"({res['games'] / max(res['seconds'], 1e-9):.0f} партий/с)",
+        f"  победы:            {res['win_rate']:7.2%}  [{lo:.2%} .. {hi:.2%}]",
+        f"  без угадывания:    {res['no_guess_rate']:7.2%}",
+        f"  угадываний:        {g:7.3f}  [{glo:.3f} .. {ghi:.3f}]",
+        f"  открытий за игру:  {r:7.2f}  [{rlo:.2f} .. {rhi:.2f}]",
+        '  угадываний  партий    доля  победы',
+    ]
+    for k, v in res['guesses'].items():
+        wins = res['wins_by_guesses'][k]
+        lines.append(f'  {k:10d} {v:7d} {v / res["games"]:7.2%} {wins / v:7.2%}')
+    return '\n'.join(lines)
+
+def parse_board(text):
+    try:
+        rows, cols, mines = (int(x) for x in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'ожидается РЯДЫxСТОЛБЦЫxМИНЫ, например 9x9x10: {text!r}')
+    if rows < 2 or cols < 2 or not 1 <= mines < rows * cols:
+        raise argparse.ArgumentTypeError(f'некорректное поле: {text!r}')
+    return rows, cols, mines
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Оценка сложности полей сапёра методом Монте-Карло')
+    ap.add_argument('boards', nargs='*', type=parse_board,
+                    help='поля вида 9x9x10 (по умолчанию: ' + ' '.join('x'.join(map(str, b)) for b in PRESETS) + ')')
+    add_run_args(ap, 10000, 'партий на поле')
+    args = ap.parse_args(argv)
+    results = []
+    with worker_pool(args.workers) as pool:
+        for rows, cols, mines in args.boards or PRESETS:
+            res = estimate(rows, cols, mines, args.games, pool, args.seed)
+            results.append(res)
+            print(report(res), flush=True)
+    write_json(args.json, args.seed, results)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,857 @@
+# minesweeper.py
+# Сапёр: поле в плоских bytearray, решатель, генерация полей без угадывания
+# и обе игры — «Сапёр» и «Сапёр с другими игроками».
+
+import math
+from bisect import bisect_right
+from collections import deque
+
+from Littleminigames import (
+    IndexedSet, ask, clear, input_int, names_list, out, press_enter, rng, sleep
+)
+
+# -------------------------
+# Minesweeper engine (общий для minesweeper и minesweeper_vs_players)
+# Поле хранится в плоских bytearray: mine, count, revealed, flagged.
+# Клетка (r, c) лежит по индексу (r+1)*W + c+1, где W = cols+2: вокруг поля
+# рамка из клеток, помеченных открытыми, так что соседей (offsets) можно
+# обходить без проверок границ.
+# Числа соседей считаются сразу для всего поля: каждая клетка — 4 бита
+# одного большого int, и сумма по окрестности 3x3 — это несколько сдвигов
+# и сложений (максимум 9 помещается в 4 бита, переносов нет).
+# -------------------------
+_NIBBLE_LO = bytes(b & 0x0F for b in range(256))
+_NIBBLE_HI = bytes(b >> 4 for b in range(256))
+_NIBBLE_SHL = bytes((b << 4) & 0xFF for b in range(256))
+# Символ клетки по байту-ключу: число | мина<<4 | открыта<<5 | флаг<<6
+# (так MineField.render рисует целый ряд одним translate).
+_MINE_GLYPHS = bytes(ord('F' if k & 64 else '#' if not k & 32 else '*' if k & 16
+                         else '.' if not k & 15 else str(k & 15) if k & 15 < 10 else '?')
+                     for k in range(256))
+
+MINES_VIEW_ROWS = 30
+MINES_VIEW_COLS = 40
+
+class MineField:
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.width = w = cols + 2
+        self.size = n = (rows + 2) * w
+        self.offsets = (-w-1, -w, -w+1, -1, 1, w-1, w, w+1)
+        self.mine = bytearray(n)
+        self.count = bytearray(n)
+        self.flagged = bytearray(n)
+        self.revealed = bytearray(n)
+        self.revealed[:w] = self.revealed[n-w:] = b'\x01' * w
+        self.revealed[w:n-w:w] = self.revealed[2*w-1:n-w:w] = b'\x01' * rows
+        self.mine_cells = []
+        self.hidden_safe = rows * cols
+        self._frame = int.from_bytes(self.revealed, 'big')
+        self._regions = None
+
+    def index(self, r, c):
+        return (r + 1) * self.width + c + 1
+
+    def coords(self, i):
+        r, c = divmod(i, self.width)
+        return r - 1, c - 1
+
+    def place(self, cells):
+        """
+        Поставить мины в клетки с номерами cells (0..rows*cols-1, построчно)
+        и пересчитать числа.
+        """
+        cols = self.cols
+        base = self.width + 1
+        mine = self.mine
+        for cell in cells:
+            i = base + cell + 2 * (cell // cols)
+            if not mine[i]:
+                mine[i] = 1
+                self.mine_cells.append(i)
+        self.hidden_safe = self.rows * cols - len(self.mine_cells)
+        self._count()
+
+    def place_random(self, mines, rnd, first=None):
+        """
+        Расставить mines мин случайно. Если задана первая клетка first (r, c),
+        мины не попадают ни в неё, ни (если хватает места) в её соседей —
+        первое открытие всегда безопасно и сразу что-то раскрывает.
+        Позиции выбираются прямо из свободных клеток, без повторных попыток.
+        """
+        n = self.rows * self.cols
+        excluded = set()
+        if first is not None:
+            r, c = first
+            excluded = {(r + dr) * self.cols + c + dc
+                        for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                        if 0 <= r + dr < self.rows and 0 <= c + dc < self.cols}
+            if mines > n - len(excluded):
+                excluded = {r * self.cols + c}
+        mines = min(mines, n - len(excluded))
+        # первые mines свободных клеток случайной перестановки — равномерная выборка
+        picked = rnd.sample(range(n), mines + len(excluded))
+        self.place([cell for cell in picked if cell not in excluded][:mines])
+
+    def _count(self):
+        n = self.size
+        m = bytes(self.mine) + b'\x00' * (n & 1)
+        packed = (int.from_bytes(m[0::2], 'little')
+                  | int.from_bytes(m[1::2].translate(_NIBBLE_SHL), 'little'))
+        h = packed + (packed << 4) + (packed >> 4)
+        shift = 4 * self.width
+        v = (h + (h << shift) + (h >> shift)) & ((1 << 4 * len(m)) - 1)
+        raw = v.to_bytes(len(m) // 2, 'little')
+        count = bytearray(len(m))
+        count[0::2] = raw.translate(_NIBBLE_LO)
+        count[1::2] = raw.translate(_NIBBLE_HI)
+        del count[n:]
+        self.count = count
+        self._regions = None
+
+    def _label_zeros(self):
+        """
+        Разметить области нулей один раз на поле. Нули ищутся отрезками по
+        рядам (регулярным выражением по маске), отрезки соседних рядов,
+        касающиеся хотя бы углом, объединяются (union-find).
+        Область — список отрезков (start, end) в индексах поля.
+        """
+        import re
+        w = self.width
+        mask = (int.from_bytes(self.count, 'big') | int.from_bytes(self.mine, 'big')
+                | self._frame).to_bytes(self.size, 'big')
+        runs = [m.span() for m in re.finditer(rb'\x00+', mask)]
+        parent = list(range(len(runs)))
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+        p = 0
+        for k, (s, e) in enumerate(runs):
+            while p < k and runs[p][1] + w < s:
+                p += 1
+            q = p
+            while q < k and runs[q][0] + w <= e:
+                parent[find(q)] = find(k)
+                q += 1
+        index, regions, run_region = {}, [], []
+        for k, run in enumerate(runs):
+            root = find(k)
+            if root not in index:
+                index[root] = len(regions)
+                regions.append([])
+            regions[index[root]].append(run)
+            run_region.append(index[root])
+        self._run_starts = [s for s, _ in runs]
+        self._run_region = run_region
+        self._regions = regions
+
+    def reveal(self, i, opened_cells=None):
+        """
+        Открыть безопасную клетку i. Ноль открывает свою область нулей
+        вместе с каймой целиком: для каждого отрезка области — три среза
+        по рядам выше, на и ниже него.
+        Вернуть число открытых клеток (их индексы добавляются в opened_cells).
+        """
+        revealed = self.revealed
+        revealed[i] = 1
+        opened = 1
+        if opened_cells is not None:
+            opened_cells.append(i)
+        if self.count[i] == 0:
+            if self._regions is None:
+                self._label_zeros()
+            w = self.width
+            region = self._regions[self._run_region[bisect_right(self._run_starts, i) - 1]]
+            for s, e in region:
+                for a in (s - w - 1, s - 1, s + w - 1):
+                    b = a + e - s + 2
+                    new = revealed[a:b].count(0)
+                    if new:
+                        if opened_cells is not None:
+                            opened_cells.extend(k for k in range(a, b) if not revealed[k])
+                        revealed[a:b] = b'\x01' * (b - a)
+                        opened += new
+        self.hidden_safe -= opened
+        return opened
+
+    def reveal_mines(self):
+        for i in self.mine_cells:
+            self.revealed[i] = 1
+
+    def glyph(self, i):
+        if self.flagged[i]:
+            return 'F'
+        if not self.revealed[i]:
+            return '#'
+        if self.mine[i]:
+            return '*'
+        return str(self.count[i]) if self.count[i] else '.'
+
+    def render(self, focus_r=0, focus_c=0):
+        """
+        Текст поля с номерами рядов/столбцов. Большое поле показывается
+        окном MINES_VIEW_ROWS x MINES_VIEW_COLS вокруг клетки (focus_r, focus_c).
+        """
+        r0 = max(0, min(focus_r - MINES_VIEW_ROWS // 2, self.rows - MINES_VIEW_ROWS))
+        c0 = max(0, min(focus_c - MINES_VIEW_COLS // 2, self.cols - MINES_VIEW_COLS))
+        r1 = min(self.rows, r0 + MINES_VIEW_ROWS)
+        c1 = min(self.cols, c0 + MINES_VIEW_COLS)
+        cw = len(str(c1 - 1)) + 1
+        rw = len(str(r1 - 1))
+        lines = [' ' * (rw + 1) + ''.join(f'{c:{cw}d}' for c in range(c0, c1))]
+        pad = ' ' * (cw - 1)
+        for r in range(r0, r1):
+            a = self.index(r, c0)
+            b = a + c1 - c0
+            key = (int.from_bytes(self.count[a:b], 'big')
+                   | int.from_bytes(self.mine[a:b].replace(b'\x01', b'\x10'), 'big')
+                   | int.from_bytes(self.revealed[a:b].replace(b'\x01', b'\x20'), 'big')
+                   | int.from_bytes(self.flagged[a:b].replace(b'\x01', b'\x40'), 'big'))
+            cells = key.to_bytes(b - a, 'big').translate(_MINE_GLYPHS).decode('ascii')
+            lines.append(f'{r:{rw}d} ' + pad + pad.join(cells))
+        return '\n'.join(lines)
+
+# Многочлены по числу мин: список, p[k] — число расстановок с k минами.
+def _poly_add(acc, poly, shift=0):
+    """
+    acc += poly * x**shift (на месте).
+    """
+    end = len(poly) + shift
+    if len(acc) < end:
+        acc.extend([0] * (end - len(acc)))
+    acc[shift:end] = [a + b for a, b in zip(acc[shift:end], poly)]
+
+def _poly_mul(a, b):
+    res = [0] * (len(a) + len(b) - 1)
+    n = len(b)
+    for i, x in enumerate(a):
+        if x:
+            res[i:i + n] = [r + x * y for r, y in zip(res[i:i + n], b)]
+    return res
+
+class MineSolver:
+    """
+    Решатель сапёра без угадывания. Видит только открытые клетки и их числа
+    (и общее число мин), мины поля не подсматривает.
+    Правила: одиночная клетка (число = уже найденные мины + все скрытые
+    соседи или число = найденные мины) и подмножества (скрытые соседи одного
+    числа целиком входят в соседей другого — разница даёт остальное).
+    """
+    def __init__(self, field, total_mines, memo=None):
+        self.field = field
+        self.total_mines = total_mines
+        self.memo = {} if memo is None else memo   # компонента границы -> подсчёт
+        self.known_mine = bytearray(field.size)
+        self.known_mines = 0
+        self.frontier = set()
+        self.dirty = set()      # числа, чьи соседи менялись с прошлого шага
+        self.safe = set()       # доказанно безопасные, но ещё не выданные best_move
+
+    def scan(self):
+        """
+        Собрать границу по всему полю (для уже начатой партии).
+        """
+        f = self.field
+        count, revealed, mine = f.count, f.revealed, f.mine
+        for r in range(f.rows):
+            base = f.index(r, 0)
+            for i in range(base, base + f.cols):
+                if not revealed[i]:
+                    continue
+                if mine[i]:
+                    # открытая (взорвавшаяся) мина — известная мина
+                    self.mark_mines((i,))
+                elif count[i] or not all(revealed[i + d] for d in f.offsets):
+                    # открытый ноль со скрытыми соседями бывает, если клетки
+                    # открывают по одной (сапёр с игроками)
+                    self.frontier.add(i)
+                    self.dirty.add(i)
+
+    def add_cell(self, i):
+        """
+        Учесть одну клетку, открытую без волны (сапёр с игроками),
+        в том числе взорвавшуюся мину.
+        """
+        if self.field.mine[i]:
+            self.mark_mines((i,))
+        else:
+            self.frontier.add(i)
+            self.dirty.add(i)
+            self.add_revealed((i,))
+
+    def add_revealed(self, cells):
+        count, offsets = self.field.count, self.field.offsets
+        frontier, dirty = self.frontier, self.dirty
+        for i in cells:
+            if count[i]:
+                frontier.add(i)
+                dirty.add(i)
+            for d in offsets:
+                if i + d in frontier:
+                    dirty.add(i + d)
+
+    def constraint(self, i):
+        """
+        Для открытого числа i вернуть (скрытые неизвестные соседи, сколько среди них мин).
+        """
+        revealed, known = self.field.revealed, self.known_mine
+        unknown = []
+        rem = self.field.count[i]
+        for d in self.field.offsets:
+            k = i + d
+            if known[k]:
+                rem -= 1
+            elif not revealed[k]:
+                unknown.append(k)
+        return unknown, rem
+
+    def step(self):
+        """
+        Один проход правил. Вернуть (безопасные клетки, мины), доказанные сейчас.
+        """
+        safe, mines = set(), set()
+        # сначала дешёвое правило одиночной клетки только для изменившихся чисел
+        dirty, self.dirty = self.dirty, set()
+        for i in dirty:
+            if i in self.frontier:
+                unknown, rem = self.constraint(i)
+                if not unknown:
+                    self.frontier.discard(i)
+                elif rem == 0:
+                    safe.update(unknown)
+                elif rem == len(unknown):
+                    mines.update(unknown)
+        if safe or mines:
+            return safe, mines
+        cons = {}
+        for i in list(self.frontier):
+            unknown, rem = self.constraint(i)
+            if not unknown:
+                self.frontier.discard(i)
+                continue
+            if rem == 0:
+                safe.update(unknown)
+            elif rem == len(unknown):
+                mines.update(unknown)
+            else:
+                cons[i] = (frozenset(unknown), rem)
+        if safe or mines:
+            return safe, mines
+        w = self.field.width
+        near = [dr * w + dc for dr in range(-2, 3) for dc in range(-2, 3) if dr or dc]
+        for i, (a, ra) in cons.items():
+            for d in near:
+                other = cons.get(i + d)
+                if other is None or not a < other[0]:
+                    continue
+                diff = other[0] - a
+                rd = other[1] - ra
+                if rd == 0:
+                    safe |= diff
+                elif rd == len(diff):
+                    mines |= diff
+        if safe or mines:
+            return safe, mines
+        # глобальное правило: все мины уже найдены — остальное безопасно
+        if self.known_mines == self.total_mines:
+            f = self.field
+            for r in range(f.rows):
+                base = f.index(r, 0)
+                for i in range(base, base + f.cols):
+                    if not f.revealed[i] and not self.known_mine[i]:
+                        safe.add(i)
+        return safe, mines
+
+    def mark_mines(self, mines):
+        offsets, frontier = self.field.offsets, self.frontier
+        for i in mines:
+            if not self.known_mine[i]:
+                self.known_mine[i] = 1
+                self.known_mines += 1
+                self.dirty.update(i + d for d in offsets if i + d in frontier)
+
+    def solve(self):
+        """
+        Открывать доказанно безопасные клетки, пока это возможно.
+        Вернуть True, если поле решено целиком без угадывания.
+        """
+        f = self.field
+        while f.hidden_safe > 0:
+            safe, mines = self.step()
+            if not safe and not mines:
+                return False
+            self.mark_mines(mines)
+            opened = []
+            for i in safe:
+                if not f.revealed[i]:
+                    f.reveal(i, opened)
+            self.add_revealed(opened)
+        return True
+
+    # --- вероятности ---
+    def _components(self):
+        """
+        Разбить границу на независимые компоненты: наборы скрытых клеток,
+        связанных общими числами. Вернуть список [(клетки, ограничения)].
+        """
+        cons = []
+        for i in self.frontier:
+            unknown, rem = self.constraint(i)
+            if unknown:
+                cons.append((tuple(sorted(unknown)), rem))
+        parent = {}
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+        for cells, _ in cons:
+            for c in cells:
+                parent.setdefault(c, c)
+            root = find(cells[0])
+            for c in cells[1:]:
+                parent[find(c)] = root
+        groups = {}
+        for con in set(cons):
+            groups.setdefault(find(con[0][0]), []).append(con)
+        return [(sorted({c for cells, _ in g for c in cells}), sorted(g)) for g in groups.values()]
+
+    def _enumerate(self, cells, cons):
+        """
+        Точный подсчёт расстановок мин в компоненте. Клетки перебираются по
+        порядку обхода в ширину; состояние — сколько мин ещё нужно открытым
+        (начатым, но не законченным) числам, одинаковые состояния сливаются
+        (это и есть мемоизация перебора). Прямой и обратный проходы дают
+        counts[k] — число расстановок с k минами — и для каждой клетки
+        per_cell[c][k] — сколько из них с миной в c.
+        Вернуть (counts, per_cell) или None, если состояний слишком много.
+        """
+        key = tuple(cons)
+        if key in self.memo:
+            return self.memo[key]
+        # порядок клеток: обход в ширину по общим числам, от самой «крайней»
+        links = {c: set() for c in cells}
+        degree = dict.fromkeys(cells, 0)
+        for cs, _ in cons:
+            for c in cs:
+                links[c].update(cs)
+                degree[c] += 1
+        order, seen = [], set()
+        for start in sorted(cells, key=lambda c: (degree[c], c)):
+            if start in seen:
+                continue
+            seen.add(start)
+            queue = deque([start])
+            while queue:
+                c = queue.popleft()
+                order.append(c)
+                for nb in sorted(links[c] - seen):
+                    seen.add(nb)
+                    queue.append(nb)
+        pos = {c: k for k, c in enumerate(order)}
+        n = len(order)
+        first = [min(pos[c] for c in cs) for cs, _ in cons]
+        last = [max(pos[c] for c in cs) for cs, _ in cons]
+        touches = [[] for _ in range(n)]
+        for j, (cs, _) in enumerate(cons):
+            for c in cs:
+                touches[pos[c]].append(j)
+        # открытые числа на каждой границе b (назначены клетки 0..b-1)
+        opened = [[j for j in range(len(cons)) if first[j] < b <= last[j]] for b in range(n + 1)]
+
+        forward = [{(): [1]}]
+        steps = []
+        for b in range(n):
+            slot = {j: k for k, j in enumerate(opened[b])}
+            nxt, moves = {}, {}
+            for state, dist in forward[b].items():
+                moves[state] = []
+                for v in (0, 1):
+                    need = {}
+                    ok = True
+                    for j in touches[b]:
+                        left = (state[slot[j]] if j in slot else cons[j][1]) - v
+                        if left < 0 or (last[j] == b and left) or left > last[j] - b:
+                            ok = False
+                            break
+                        need[j] = left
+                    if not ok:
+                        continue
+                    new = tuple(need[j] if j in need else state[slot[j]] for j in opened[b + 1])
+                    moves[state].append((v, new))
+                    acc = nxt.get(new)
+                    if acc is None:
+                        nxt[new] = [0] + dist if v else dist[:]
+                    else:
+                        _poly_add(acc, dist, v)
+            if len(nxt) > 50000:
+                return None
+            forward.append(nxt)
+            steps.append(moves)
+
+        backward = [None] * n + [{(): [1]}]
+        per_cell = {}
+        for b in range(n - 1, -1, -1):
+            layer = {}
+            mined = []
+            after = backward[b + 1]
+            for state, moves in steps[b].items():
+                acc = []
+                for v, new in moves:
+                    _poly_add(acc, after[new], v)
+                    if v:
+                        # расстановки с миной в клетке b: начало * хвост
+                        _poly_add(mined, _poly_mul(forward[b][state], after[new]), 1)
+                layer[state] = acc
+            backward[b] = layer
+            per_cell[order[b]] = mined
+        result = (backward[0].get((), [0]), per_cell)
+        if len(self.memo) > 10000:
+            self.memo.clear()
+        self.memo[key] = result
+        return result
+
+    def probabilities(self):
+        """
+        Точные вероятности мины для скрытых клеток при равновероятных
+        расстановках, согласных с открытыми числами и общим числом мин.
+        Вернуть (вероятности клеток границы, вероятность для любой другой
+        скрытой клетки, сколько таких клеток).
+        """
+        f = self.field
+        comps = self._components()
+        frontier_cells = sum(len(cells) for cells, _ in comps)
+        hidden = sum(f.revealed[f.index(r, 0):f.index(r, f.cols)].count(0) for r in range(f.rows))
+        rest = hidden - (self.known_mines - self._revealed_mines()) - frontier_cells
+        left = self.total_mines - self.known_mines
+        probs = {}
+        dists = []
+        for cells, cons in comps:
+            res = self._enumerate(cells, cons)
+            if res is None:
+                # слишком большая компонента — грубая оценка по самому строгому числу
+                for cs, rem in cons:
+                    for c in cs:
+                        probs[c] = max(probs.get(c, 0.0), rem / len(cs))
+                continue
+            dists.append(res)
+
+        def ways(n, k):
+            return math.comb(n, k) if 0 <= k <= n else 0
+
+        # свёртки «все компоненты, кроме j» через префиксы и суффиксы
+        prefix = [[1]]
+        for counts, _ in dists:
+            prefix.append(_poly_mul(prefix[-1], counts))
+        suffix = [[1]]
+        for counts, _ in reversed(dists):
+            suffix.append(_poly_mul(suffix[-1], counts))
+        suffix.reverse()
+        total = sum(cnt * ways(rest, left - k) for k, cnt in enumerate(prefix[-1]))
+        if not total:
+            return probs, (left / rest if rest else 0.0), rest
+        for j, (counts, per_cell) in enumerate(dists):
+            others = _poly_mul(prefix[j], suffix[j + 1])
+            weight = [sum(o * ways(rest, left - kj - ko) for ko, o in enumerate(others))
+                      for kj in range(len(counts))]
+            for c, mined in per_cell.items():
+                probs[c] = sum(m * weight[k] for k, m in enumerate(mined)) / total
+        p_rest = (sum(cnt * ways(rest - 1, left - k - 1) for k, cnt in enumerate(prefix[-1])) / total
+                  if rest else 0.0)
+        return probs, p_rest, rest
+
+    def _revealed_mines(self):
+        f = self.field
+        return sum(1 for i in f.mine_cells if f.revealed[i])
+
+    def best_move(self, pool=None):
+        """
+        Лучший ход: доказанно безопасная клетка, а если такой нет —
+        клетка с наименьшей вероятностью мины. Найденные по пути мины
+        отмечаются в known_mine. pool — IndexedSet закрытых клеток: клетка
+        вне границы тогда берётся из него случайно, а не первая по порядку.
+        Вернуть (клетка, вероятность мины) или None.
+        """
+        f = self.field
+        while True:
+            while self.safe:
+                i = self.safe.pop()
+                if not f.revealed[i]:
+                    return i, 0.0
+            safe, mines = self.step()
+            if safe:
+                self.safe = safe
+                continue
+            if not mines:
+                break
+            self.mark_mines(mines)
+        probs, p_rest, rest = self.probabilities()
+        best = min(probs.items(), key=lambda item: (item[1], item[0]), default=None)
+        if rest and (best is None or p_rest < best[1]):
+            # вне границы все клетки равны; углы чаще оказываются нулями
+            taken = set(probs)
+            if pool:
+                for _ in range(32):
+                    i = pool.choice(rng)
+                    if not self.known_mine[i] and i not in taken:
+                        return i, p_rest
+            corners = [f.index(r, c) for r in (0, f.rows - 1) for c in (0, f.cols - 1)]
+            cells = corners + [i for r in range(f.rows)
+                               for i in range(f.index(r, 0), f.index(r, f.cols))]
+            for i in cells:
+                if not f.revealed[i] and not self.known_mine[i] and i not in taken:
+                    return i, p_rest
+        return best
+
+def minesweeper_generate(rows, cols, mines, rnd, first, no_guess=False, attempts=200):
+    """
+    Создать поле с безопасной первой клеткой first.
+    С no_guess=True решатель проходит поле от first; где он застрял, мины
+    у одного из чисел границы переносятся в ещё не тронутую глубину поля,
+    и решение продолжается. Решённое поле перепроверяется с нуля новым
+    решателем. Так поле доводится до решаемого без угадывания за несколько
+    правок вместо сотен перегенераций.
+    Возвращает (поле, решается_без_угадывания или None, если не проверялось).
+    """
+    field = MineField(rows, cols)
+    field.place_random(mines, rnd, first)
+    if not no_guess:
+        return field, None
+    start = field.index(*first)
+    keep = {start + d for d in field.offsets} | {start}
+    saved, hidden = bytes(field.revealed), field.hidden_safe
+    solver, verified = None, False
+    for _ in range(attempts):
+        if solver is None:
+            # проверка с нуля: только она и считается
+            field.revealed[:] = saved
+            field.hidden_safe = hidden
+            solver = MineSolver(field, mines)
+            opened = []
+            field.reveal(start, opened)
+            solver.add_revealed(opened)
+            verified = True
+        if solver.solve():
+            if verified:
+                break
+            solver = None
+            continue
+        stuck = [i for i in solver.frontier if solver.constraint(i)[0]]
+        unknown = solver.constraint(rnd.choice(stuck))[0] if stuck else []
+        moving = [i for i in unknown if field.mine[i]]
+        revealed = field.revealed
+        # глубина: скрытые клетки без открытых соседей, свободные от мин
+        deep = [i for r in range(rows) for i in range(field.index(r, 0), field.index(r, cols))
+                if not revealed[i] and not field.mine[i] and i not in keep
+                and not any(revealed[i + d] for d in field.offsets)]
+        if not moving or len(deep) < len(moving):
+            field = MineField(rows, cols)
+            field.place_random(mines, rnd, first)
+            solver = None
+            continue
+        for src, dst in zip(moving, rnd.sample(deep, len(moving))):
+            field.mine[src] = 0
+            field.mine[dst] = 1
+        field.mine_cells = [i for i in field.mine_cells if field.mine[i]] + [i for i in deep if field.mine[i]]
+        field._count()
+        solver.dirty.update(solver.frontier)
+        verified = False
+    else:
+        field.revealed[:] = saved
+        field.hidden_safe = hidden
+        return field, False
+    field.revealed[:] = saved
+    field.hidden_safe = hidden
+    return field, True
+
+# -------------------------
+# Game 3: Minesweeper (Сапёр)
+# -------------------------
+def minesweeper():
+    clear()
+    out('=== Minesweeper (Сапёр) ===')
+    rows = input_int('Рядов (по умолчанию 8): ', 2) or 8
+    cols = input_int('Столбцов (по умолчанию 8): ', 2) or 8
+    max_mines = rows*cols - 1
+    mines_count = input_int(f'Количество мин (по умолчанию 10): ', 1, max_mines) or min(10, max_mines)
+    no_guess = ask('Поле без угадывания? (y/N): ').strip().lower() in ('y', 'yes', 'д', 'да')
+
+    # мины расставляются при первом открытии, чтобы первая клетка была безопасной
+    field = MineField(rows, cols)
+    started = False
+    focus = (0, 0)
+    hint = ''
+    memo = {}
+    def render():
+        clear()
+        out(field.render(*focus))
+    while True:
+        render()
+        if hint:
+            out(hint)
+            hint = ''
+        out('\nКоманды: r row col  - открыть; f row col - пометить/снять флаг; h - подсказка; q - выйти')
+        cmd = ask('> ').strip().lower()
+        if cmd == 'q' or cmd == '':
+            out('Выход из Сапёра.')
+            break
+        if cmd == 'h':
+            if not started:
+                hint = 'Подсказка: первая клетка всегда безопасна — открывайте любую.'
+                continue
+            move = MineSolver(field, mines_count, memo)
+            move.scan()
+            move = move.best_move()
+            if move is None:
+                continue
+            i, p = move
+            focus = field.coords(i)
+            if p == 0:
+                hint = f'Подсказка: r {focus[0]} {focus[1]} — точно безопасно.'
+            else:
+                hint = f'Подсказка: r {focus[0]} {focus[1]} — без риска не обойтись, мина с вероятностью {p:.0%}.'
+            continue
+        parts = cmd.split()
+        if len(parts) < 3:
+            out('Неверная команда.')
+            sleep(0.6)
+            continue
+        action, *rest = parts
+        try:
+            row = int(rest[0]); col = int(rest[1])
+        except:
+            out('Неверные координаты.')
+            sleep(0.6)
+            continue
+        if not (0 <= row < rows and 0 <= col < cols):
+            out('Координаты вне поля.')
+            sleep(0.6)
+            continue
+        focus = (row, col)
+        i = field.index(row, col)
+        if action == 'f':
+            field.flagged[i] ^= 1
+            continue
+        if action == 'r':
+            if field.flagged[i]:
+                out('Сначала снимите флаг.')
+                sleep(0.6)
+                continue
+            if not started:
+                flagged = field.flagged
+                field, solvable = minesweeper_generate(rows, cols, mines_count, rng, (row, col), no_guess)
+                field.flagged = flagged
+                started = True
+                if solvable is False:
+                    out('Не удалось построить поле без угадывания — играем на обычном.')
+                    sleep(0.6)
+            if field.revealed[i]:
+                out('Уже открыта.')
+                sleep(0.6)
+                continue
+            if field.mine[i]:
+                field.reveal_mines()
+                render()
+                out('\nБах! Вы подорвались на мине. Игра окончена.')
+                break
+            field.reveal(i)
+            if field.hidden_safe <= 0:
+                render()
+                out('\nПоздравляю! Вы открыли все безопасные клетки и выиграли!')
+                break
+    press_enter()
+
+# -----------------------
+# 1) Сапёр с другими игроками (multiplayer Minesweeper race)
+# Each player in turn reveals a cell on shared board; the one who hits mine is out.
+# Last remaining wins.
+# -----------------------
+def minesweeper_npc_move(solver, hidden, skill):
+    """
+    Ход NPC в сапёре: с вероятностью skill/10 — ход решателя (безопасная
+    клетка или наименее рискованная), иначе — случайная закрытая клетка.
+    hidden — IndexedSet закрытых клеток. Вернуть индекс клетки или None.
+    """
+    if not hidden:
+        return None
+    if rng.random() * 10 < skill:
+        move = solver.best_move(hidden)
+        if move is not None:
+            return move[0]
+    return hidden.choice(rng)
+
+def minesweeper_vs_players():
+    clear()
+    out('=== Сапёр с другими игроками ===')
+    n = input_int('Игроков (включая вас) (по умолчанию 4): ', 2) or 4
+    rows = input_int('Строки (по умолчанию 6): ', 3) or 6
+    cols = input_int('Столбцы (по умолчанию 8): ', 3) or 8
+    mines_count = input_int('Число мин (по умолчанию 8): ', 1, rows*cols-1) or 8
+    skill = input_int('Сила NPC от 0 (наугад) до 10 (решатель) (по умолчанию 5): ', 0, 10)
+    if skill is None:
+        skill = 5
+    names = names_list(n)
+    field = MineField(rows, cols)
+    field.place_random(mines_count, rng)
+    # закрытые клетки — для случайного хода за O(1); решатель один на партию
+    hidden = IndexedSet(i for r in range(rows) for i in range(field.index(r, 0), field.index(r, cols)))
+    solver = MineSolver(field, mines_count)
+    alive = names[:]
+    turn = 0
+    focus = (rows // 2, cols // 2)
+    while len(alive) > 1 and hidden:
+        current = alive[turn % len(alive)]
+        clear()
+        shown = ', '.join(alive[:12]) + (f' и ещё {len(alive) - 12}' if len(alive) > 12 else '')
+        out(f'Текущие игроки ({len(alive)}): {shown}')
+        out(f'Закрыто клеток: {len(hidden)}   (# - закрыта, * - мина, . - пусто)')
+        out(field.render(*focus))
+        out('Ход:', current)
+        if current == 'You':
+            sel_r = input_int('Выберите строку: ', 0, rows-1)
+            sel_c = input_int('Выберите столбец: ', 0, cols-1)
+            if sel_r is None or sel_c is None:
+                out('Пропуск хода.')
+                sel = None
+            else:
+                sel = field.index(sel_r, sel_c)
+        else:
+            sel = minesweeper_npc_move(solver, hidden, skill)
+            if sel is not None:
+                out(f'{current} выбирает {field.coords(sel)}')
+            sleep(0.6)
+        if sel is None:
+            turn += 1
+            continue
+        i = sel
+        focus = field.coords(i)
+        if field.revealed[i]:
+            out('Уже открыто — теряется ход.')
+            turn += 1
+            sleep(0.6)
+            continue
+        field.revealed[i] = 1
+        hidden.discard(i)
+        solver.add_cell(i)
+        if field.mine[i]:
+            out(f'Бах! {current} подорвался на мине и выбывает.')
+            alive.remove(current)
+            sleep(1.0)
+            # after mine explosion, continue with same next index (no increment)
+            # if current removed, turn remains same index
+            continue
+        else:
+            out(f'Открыто число: {field.count[i]}')
+        turn += 1
+        sleep(0.7)
+    clear()
+    if len(alive) > 1:
+        out('Поле открыто целиком. Выжили:', ', '.join(alive))
+    elif alive:
+        out('Победитель:', alive[0])
+    else:
+        out('Никто не остался жив.')
+    press_enter()
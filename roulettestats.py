@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# roulettestats.py
+# Русская рулетка: проверка точных вероятностей выбыть симуляцией барабана
+# (только стандартная библиотека).
+#
+#   python roulettestats.py                          # стандартные конфигурации, по 1000000 партий
+#   python roulettestats.py 6x1x3 6x2x5 --rule nospin -n 5000000 -j 8
+#   python roulettestats.py --json roulette.json     # сохранить результаты в JSON
+#
+# Конфигурация — ГНЁЗДАxПАТРОНЫxИГРОКИ. Партии играются roulette_simulate на
+# модели Revolver и режутся на пачки со своим сидом из (--seed, номер пачки),
+# поэтому результат не зависит от числа процессов. Для каждого места
+# печатаются частота выбывания с 95% интервалом и точный ответ
+# roulette_elimination. Код выхода 1, если точный ответ вне 99.9% интервала.
+
+import argparse
+import sys
+from fractions import Fraction
+
+from russian_roulette import ROULETTE_RULES, roulette_elimination, roulette_simulate
+from statutil import add_run_args, run_chunks, wilson, worker_pool, write_json
+
+PRESETS = ((6, 1, 2), (6, 1, 3), (6, 2, 4), (6, 5, 6))
+CHUNK = 50000
+Z999 = 3.290527
+
+def play_chunk(chambers, bullets, players, rule, rnd, games):
+    """
+    Сыграть пачку партий (выполняется в процессе пула).
+    """
+    dead = [0] * players
+    for _ in range(games):
+        for seat in roulette_simulate(chambers, bullets, players, rule, rnd):
+            dead[seat] += 1
+    return games, dead
+
+def estimate(chambers, bullets, players, rule, games, pool=None, seed=0):
+    parts, seconds = run_chunks(play_chunk, (chambers, bullets, players, rule), games, CHUNK, pool, seed,
+                                key=f'{chambers}x{bullets}x{players}/{rule}')
+    n = 0
+    dead = [0] * players
+    for part_games, part_dead in parts:
+        n += part_games
+        for seat, d in enumerate(part_dead):
+            dead[seat] += d
+    exact = roulette_elimination(chambers, bullets, players, rule)
+    ok = all(lo <= float(p) <= hi for (lo, hi), p in
+             zip((wilson(d, n, Z999) for d in dead), exact))
+    return {
+        'config': f'{chambers}x{bullets}x{players}',
+        'rule': rule,
+        'games': n,
+        'eliminated': [d / n for d in dead],
+        'eliminated_ci95': [list(wilson(d, n)) for d in dead],
+        'eliminated_exact': [str(p) for p in exact],
+        'ok': ok,
+        'seconds': seconds,
+    }
+
+def report(res):
+    lines = [
+        f"{res['config']} ({res['rule']}): {res['games']} партий за {res['seconds']:.1f} с "
+        f"({res['games'] / max(res['seconds'], 1e-9):.0f} партий/с)" + ('' if res['ok'] else '   РАСХОЖДЕНИЕ'),
+        '  место   выбыл                            точно',
+    ]
+    for seat, p in enumerate(res['eliminated']):
+        lo, hi = res['eliminated_ci95'][seat]
+        exact = res['eliminated_exact'][seat]
+        lines.append(f'  {seat + 1:5d}  {p:7.3%}  [{lo:.3%} .. {hi:.3%}]  {float(Fraction(exact)):7.3%}  ({exact})')
+    return '\n'.join(lines)
+
+def parse_config(text):
+    try:
+        chambers, bullets, players = (int(x) for x in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'ожидается ГНЁЗДАxПАТРОНЫxИГРОКИ, например 6x1x3: {text!r}')
+    if chambers < 1 or not 0 <= bullets <= chambers or players < 2:
+        raise argparse.ArgumentTypeError(f'некорректная конфигурация: {text!r}')
+    return chambers, bullets, players
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Проверка точных вероятностей русской рулетки')
+    ap.add_argument('configs', nargs='*', type=parse_config,
+                    help='конфигурации вида 6x1x3 (по умолчанию: ' + ' '.join('x'.join(map(str, c)) for c in PRESETS) + ')')
+    ap.add_argument('--rule', choices=sorted(ROULETTE_RULES), action='append',
+                    help='правило барабана (по умолчанию оба)')
+    add_run_args(ap, 1_000_000, 'партий на конфигурацию')
+    args = ap.parse_args(argv)
+    results = []
+    with worker_pool(args.workers) as pool:
+        for chambers, bullets, players in args.configs or PRESETS:
+            for rule in args.rule or sorted(ROULETTE_RULES):
+                res = estimate(chambers, bullets, players, rule, args.games, pool, args.seed)
+                results.append(res)
+                print(report(res), flush=True)
+    write_json(args.json, args.seed, results)
+    return 0 if all(r['ok'] for r in results) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
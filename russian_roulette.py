@@ -0,0 +1,156 @@
+# russian_roulette.py
+# Русская рулетка: модель барабана, точные шансы выбыть для каждого места
+# и игра.
+
+from collections import deque
+
+from Littleminigames import ask, clear, input_int, out, press_enter, rng, sleep
+
+# -----------------------
+# 2) Русская рулетка
+# -----------------------
+ROULETTE_RULES = {
+    'spin': 'барабан крутят перед каждым выстрелом',
+    'nospin': 'барабан крутят один раз, дальше он проворачивается на гнездо',
+}
+
+class Revolver:
+    """
+    Барабан: chambers гнёзд, loaded — заряженные гнёзда (разные), pos —
+    гнездо напротив ствола. Выстрел расходует патрон, после спуска барабан
+    проворачивается на одно гнездо.
+    """
+    def __init__(self, chambers, bullets, rnd):
+        self.chambers = chambers
+        self.rnd = rnd
+        self.loaded = set(rnd.sample(range(chambers), bullets))
+        self.spin()
+
+    def spin(self):
+        self.pos = self.rnd.randrange(self.chambers)
+
+    def pull(self):
+        fired = self.pos in self.loaded
+        self.loaded.discard(self.pos)
+        self.pos = (self.pos + 1) % self.chambers
+        return fired
+
+_ROULETTE_MEMO = {}
+
+def roulette_elimination(chambers, bullets, players, rule='spin'):
+    """
+    Точные вероятности (Fraction) выбыть для каждого места: место 0 стреляет
+    первым, игра идёт, пока не останется один игрок или не кончатся патроны.
+    Состояние — (живых n, патронов b[, гнёзд до конца оборота r]) и место
+    относительно стреляющего; после выстрела места сдвигаются на одно.
+
+    spin: каждый спуск — выстрел с вероятностью b/chambers. Пока никто не
+    выбыл, ход идёт по кругу: x_k = a_k + q * x_(k-1), где q — шанс осечки;
+    это цикл, он решается явно через x_0 = sum q^j a_(-j) / (1 - q^n).
+    nospin: раскладка патронов по гнёздам оборота равновероятна, поэтому
+    следующее гнездо заряжено с вероятностью b/r (без возвращения). За один
+    оборот все патроны расходуются, так что цикла нет.
+
+    Ответ запоминается для каждой конфигурации (chambers, bullets, players, rule).
+    """
+    key = (chambers, bullets, players, rule)
+    if key in _ROULETTE_MEMO:
+        return _ROULETTE_MEMO[key]
+    if rule not in ROULETTE_RULES:
+        raise ValueError(f'неизвестное правило: {rule!r}')
+    if not 0 <= bullets <= chambers or players < 1:
+        raise ValueError('нужно 0 <= патронов <= гнёзд и хотя бы один игрок')
+    from fractions import Fraction
+    memo = {}
+
+    def spin(n, b):
+        if n == 1 or b == 0:
+            return [Fraction(0)] * n
+        if (n, b) in memo:
+            return memo[n, b]
+        p = Fraction(b, chambers)
+        q = 1 - p
+        after = spin(n - 1, b - 1)
+        a = [p] + [p * after[k - 1] for k in range(1, n)]
+        x0 = sum(q ** j * a[-j] for j in range(n)) / (1 - q ** n)
+        x = [x0]
+        for k in range(1, n):
+            x.append(a[k] + q * x[k - 1])
+        memo[n, b] = x
+        return x
+
+    def nospin(n, r, b):
+        if n == 1 or b == 0:
+            return [Fraction(0)] * n
+        if (n, r, b) in memo:
+            return memo[n, r, b]
+        p = Fraction(b, r)
+        die = nospin(n - 1, r - 1, b - 1)
+        live = nospin(n, r - 1, b) if p < 1 else None
+        x = []
+        for k in range(n):
+            v = p if k == 0 else p * die[k - 1]
+            if live is not None:
+                v += (1 - p) * live[k - 1]
+            x.append(v)
+        memo[n, r, b] = x
+        return x
+
+    result = spin(players, bullets) if rule == 'spin' else nospin(players, chambers, bullets)
+    _ROULETTE_MEMO[key] = result
+    return result
+
+def roulette_simulate(chambers, bullets, players, rule, rnd):
+    """
+    Одна партия без экрана на модели барабана. Вернуть места выбывших по порядку.
+    """
+    gun = Revolver(chambers, bullets, rnd)
+    alive = deque(range(players))
+    dead = []
+    while len(alive) > 1 and gun.loaded:
+        if rule == 'spin':
+            gun.spin()
+        if gun.pull():
+            dead.append(alive.popleft())
+        else:
+            alive.rotate(-1)
+    return dead
+
+def russian_roulette():
+    clear()
+    out('=== Русская рулетка ===')
+    chambers = input_int('Кол-во патронов в барабане (1..6, по умолчанию 6): ', 1, 6) or 6
+    bullets = input_int('Сколько патронов зарядить (по умолчанию 1): ', 0, chambers) or 1
+    players = input_int('Игроков (включая вас) (по умолчанию 3): ', 2) or 3
+    answer = ask('Крутить барабан перед каждым выстрелом? (Y/n): ').strip().lower()
+    rule = 'nospin' if answer in ('n', 'н', 'нет', 'no') else 'spin'
+    order = ['You'] + [f'P{i}' for i in range(2, players+1)]
+    out(f'Правило: {ROULETTE_RULES[rule]}. Шанс выбыть:')
+    out('  ' + '  '.join(f'{name} {float(p):.1%}' for name, p in
+                         zip(order, roulette_elimination(chambers, bullets, players, rule))))
+    gun = Revolver(chambers, bullets, rng)
+    alive = deque(order)
+    while len(alive) > 1 and gun.loaded:
+        current = alive[0]
+        if rule == 'spin':
+            out(f'Ход: {current}. Нажмите Enter чтобы крутнуть барабан и нажать на спуск.')
+            gun.spin()
+        else:
+            out(f'Ход: {current}. Нажмите Enter чтобы нажать на спуск.')
+        ask()
+        if gun.pull():
+            out(f'{current} убит!')
+            if current == 'You':
+                out('Вы проиграли.')
+                press_enter()
+                return
+            alive.popleft()
+        else:
+            out(f'{current} жив.')
+            alive.rotate(-1)
+        sleep(0.5)
+    if len(alive) == 1:
+        out('Оставшийся игрок победил:', alive[0])
+    else:
+        out('Патроны кончились. Выжили:', ', '.join(sorted(alive, key=order.index)))
+    press_enter()
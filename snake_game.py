@@ -0,0 +1,347 @@
+# snake_game.py
+# Змейка: поле, гамильтонов цикл, автопилот и игра — пошаговая или
+# в реальном времени.
+
+from collections import deque
+from contextlib import nullcontext
+
+from Littleminigames import (
+    IndexedSet, ask, can_read_keys, cbreak, clear, flush, input_int, out, perf, press_enter,
+    read_keys, rng, sleep
+)
+
+# -----------------------
+# Game: Змейка (Snake) - простейшая консольная змейка (без curses)
+# Note: movement is turn-based; player inputs direction each step.
+# -----------------------
+_SNAKE_GLYPHS = bytes(ord('.' if b == 0 else 'S') for b in range(256))
+
+class SnakeBoard:
+    """
+    Поле змейки: плоский bytearray с рамкой (1 — стена или тело, 0 — свободно),
+    тело — deque индексов (голова слева), свободные клетки — IndexedSet,
+    так что ход, проверка столкновения и выбор места для еды — O(1).
+    """
+    def __init__(self, rows, cols, rnd):
+        self.rows = rows
+        self.cols = cols
+        self.width = w = cols + 2
+        self.grid = bytearray(b'\x01') * ((rows + 2) * w)
+        for r in range(rows):
+            base = self.index(r, 0)
+            self.grid[base:base + cols] = bytes(cols)
+        start = self.index(rows // 2, cols // 2)
+        self.body = deque([start])
+        self.grid[start] = 1
+        self.free = IndexedSet(i for r in range(rows) for i in range(self.index(r, 0), self.index(r, cols))
+                               if i != start)
+        self.moves = {'w': -w, 's': w, 'a': -1, 'd': 1}
+        self.food = None
+        self.place_food(rnd)
+
+    def index(self, r, c):
+        return (r + 1) * self.width + c + 1
+
+    def coords(self, i):
+        r, c = divmod(i, self.width)
+        return r - 1, c - 1
+
+    def place_food(self, rnd):
+        """
+        Положить еду в случайную свободную клетку; если их нет — food = None.
+        """
+        self.food = self.free.choice(rnd) if self.free else None
+
+    def step(self, d, rnd):
+        """
+        Сдвинуть голову на d. Вернуть 'crash' (стена или тело, в том числе
+        хвост), 'eat' (съели еду, змейка выросла) или 'move'.
+        """
+        head = self.body[0] + d
+        if self.grid[head]:
+            return 'crash'
+        self.body.appendleft(head)
+        self.grid[head] = 1
+        self.free.discard(head)
+        if head == self.food:
+            self.place_food(rnd)
+            return 'eat'
+        tail = self.body.pop()
+        self.grid[tail] = 0
+        self.free.add(tail)
+        return 'move'
+
+    def render(self):
+        lines = []
+        food_r, food_c = self.coords(self.food) if self.food is not None else (-1, -1)
+        for r in range(self.rows):
+            base = self.index(r, 0)
+            row = self.grid[base:base + self.cols].translate(_SNAKE_GLYPHS).decode('ascii')
+            if r == food_r:
+                row = row[:food_c] + 'F' + row[food_c + 1:]
+            lines.append(' '.join(row))
+        return '\n'.join(lines)
+
+def snake_cycle(rows, cols):
+    """
+    Гамильтонов цикл по полю rows x cols — список клеток (r, c) по порядку,
+    или None, если поле уже 2. Верхний ряд слева направо, дальше «змейкой»
+    по столбцам 1..cols-1, и вверх по столбцу 0. Если оба размера нечётные,
+    полного цикла нет: последние два ряда проходятся зигзагом по столбцам,
+    а угол (rows-1, 0) остаётся вне цикла.
+    """
+    if min(rows, cols) < 2:
+        return None
+    if rows % 2 and not cols % 2:
+        return [(r, c) for c, r in snake_cycle(cols, rows)]
+    odd = rows % 2
+    cells = [(0, c) for c in range(cols)]
+    for r in range(1, rows - 2 if odd else rows):
+        span = range(cols - 1, 0, -1) if r % 2 else range(1, cols)
+        cells.extend((r, c) for c in span)
+    if odd:
+        for k, c in enumerate(range(cols - 1, 0, -1)):
+            pair = ((rows - 2, c), (rows - 1, c))
+            cells.extend(pair if k % 2 == 0 else pair[::-1])
+    cells.extend((r, 0) for r in range(rows - 2 if odd else rows - 1, 0, -1))
+    return cells
+
+class SnakeAutopilot:
+    """
+    Автопилот змейки. Змейка идёт по гамильтонову циклу snake_cycle и
+    срезает путь: кратчайший путь к еде (поиск в ширину, путь запоминается
+    до съедения) принимается, только если шаг идёт вперёд по циклу и не
+    обгоняет хвост с запасом; иначе — самый дальний безопасный шаг вперёд
+    по циклу, а в крайнем случае просто следующая клетка цикла. Тело тогда
+    всегда лежит на отрезке цикла за головой, и змейка не врезается.
+    На поле с обоими нечётными размерами угол (rows-1, 0) вне цикла: он
+    соседствует с клетками k и k+2 цикла и получает номер k+1, то есть
+    змейка может пройти через него вместо клетки k+1. Тело занимает не
+    больше одной из этих двух клеток, поэтому при длине rows*cols - 2 поле
+    добирается до конца, только если еда лежит на клетке k, (rows-1, 1);
+    иначе автопилот сдаётся (decide возвращает None), а не врезается.
+    """
+    SLACK = 3   # запас клеток цикла перед хвостом при срезании
+
+    def __init__(self, board):
+        self.board = board
+        cycle = snake_cycle(board.rows, board.cols)
+        if cycle is None:
+            raise ValueError('автопилоту нужно поле хотя бы 2x2')
+        self.pos = [-1] * len(board.grid)
+        for k, (r, c) in enumerate(cycle):
+            self.pos[board.index(r, c)] = k
+        self.cells = len(cycle)
+        self.finish = None      # клетка k (см. выше), если цикл неполный
+        if self.cells < board.rows * board.cols:
+            r = board.rows - 1
+            self.finish = board.index(r, 1)
+            self.pos[board.index(r, 0)] = self.pos[self.finish] + 1
+        self.path = None        # запомненный путь к еде (None — ещё не искали)
+        self.path_food = None
+        self.steps = tuple(board.moves.values())
+
+    def _bfs(self, start, goal, blocked):
+        """
+        Кратчайший путь от start до goal по свободным клеткам (без start),
+        клетки, где blocked[i] != 0, непроходимы (кроме goal).
+        """
+        prev = {start: None}
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            if i == goal:
+                path = deque()
+                while i != start:
+                    path.appendleft(i)
+                    i = prev[i]
+                return path
+            for d in self.steps:
+                k = i + d
+                if k not in prev and (not blocked[k] or k == goal):
+                    prev[k] = i
+                    queue.append(k)
+        return None
+
+    def decide(self):
+        """
+        Вернуть смещение следующего хода (одно из board.moves) или None,
+        если поле до конца не пройти.
+        """
+        b = self.board
+        head = b.body[0]
+        if self.finish is not None and len(b.body) >= self.cells - 1 and b.food != self.finish:
+            return None
+        if b.food != self.path_food:
+            # новая еда — путь к ней ищется заново (один раз на каждую еду)
+            self.path = None
+            self.path_food = b.food
+        pos, n = self.pos, self.cells
+        tail = b.body[-1]
+        ahead = lambda i: (pos[i] - pos[head]) % n
+        if len(b.body) * 2 < n:
+            # при длине 1 хвост совпадает с головой — впереди весь цикл
+            limit = (ahead(tail) or n) - 1 - self.SLACK
+            if b.food is not None and ahead(b.food) <= limit:
+                limit = ahead(b.food)
+                if self.finish is not None and pos[b.food] == pos[self.finish] + 1:
+                    limit -= 1   # еда в углу или его паре — сначала к клетке k
+        else:
+            limit = 1   # поле больше чем наполовину занято — только по циклу
+        if limit > 1:
+            if self.path is None and b.food is not None:
+                self.path = self._bfs(head, b.food, b.grid) or deque()
+            if self.path:
+                nxt = self.path[0]
+                if not b.grid[nxt] and 1 <= ahead(nxt) <= limit:
+                    self.path.popleft()
+                    return nxt - head
+                self.path.clear()
+        best, best_ahead = None, 0
+        for d in self.steps:
+            k = head + d
+            if not b.grid[k]:
+                a = ahead(k)
+                # при равенстве (угол вне цикла и его пара) — туда, где еда
+                if best_ahead < a <= max(limit, 1) or a == best_ahead and k == b.food:
+                    best, best_ahead = k, a
+        if best is None:
+            return self.steps[0]   # ходов нет — змейка врежется
+        return best - head
+
+def snake_realtime(board, hz, pilot=None):
+    """
+    Змейка в реальном времени: тики с фиксированным шагом 1/hz, между тиками
+    собираются нажатые клавиши (терминал в cbreak, Enter не нужен).
+    Тики считаются от начала игры (next_tick += шаг), поэтому не дрейфуют;
+    если кадр опоздал больше чем на тик, пропущенные тики не догоняются
+    пачкой, а считаются. В строке состояния — фактическая частота, время
+    кадра, задержка от нажатия до экрана и число пропущенных тиков.
+    pilot — SnakeAutopilot: тогда змейкой правит он, а клавиша q всё так же
+    выходит; на консоли без ввода по клавишам тики просто ждут. Демо
+    останавливается, если автопилот сдался или прошёл rows * cols шагов
+    без еды (целый круг по полю — значит, до еды ему не добраться).
+    Вернуть (счёт, исход: 'crash', 'win', 'quit' или 'stuck').
+    """
+    period = 1.0 / hz
+    direction = board.moves['d']
+    turns = deque()            # (направление, время нажатия)
+    score = 0
+    ticks = missed = 0
+    hungry = 0                 # шагов с последней еды
+    frame = frame_max = lag = 0.0
+    keyboard = can_read_keys()
+    start = next_tick = perf()
+    with (cbreak() if keyboard else nullcontext()):
+        while True:
+            # до следующего тика — только ждать клавиши
+            while True:
+                wait = next_tick - perf()
+                if wait <= 0:
+                    break
+                if not keyboard:
+                    sleep(wait)
+                    continue
+                keys = read_keys(wait)
+                pressed = perf()
+                for ch in keys.lower():
+                    if ch == 'q':
+                        return score, 'quit'
+                    if ch in board.moves and len(turns) < 3:
+                        turns.append((board.moves[ch], pressed))
+            tick = perf()
+            pressed = None
+            if pilot is not None:
+                turns.clear()
+                direction = pilot.decide()
+                if direction is None:
+                    return score, 'stuck'
+            while turns:
+                d, t = turns.popleft()
+                # разворот назад в собственное тело не засчитываем
+                if d != direction and (d != -direction or len(board.body) == 1):
+                    direction, pressed = d, t
+                    break
+            result = board.step(direction, rng)
+            if result == 'eat':
+                score += 1
+                hungry = 0
+            else:
+                hungry += 1
+            ticks += 1
+            elapsed = tick - start
+            clear()
+            out(board.render())
+            out(f'Score: {score}   {(ticks - 1) / elapsed if elapsed > 0 else hz:5.1f} Гц из {hz}'
+                f'   кадр {frame * 1e3:.1f} мс (макс {frame_max * 1e3:.1f})'
+                f'   нажатие→экран {lag * 1e3:.0f} мс   пропущено тиков: {missed}')
+            out('автопилот, q — выход' if pilot else 'w/a/s/d — повернуть, q — выход')
+            flush()
+            shown = perf()
+            frame = shown - tick
+            frame_max = max(frame_max, frame)
+            if pressed is not None:
+                lag = shown - pressed
+            if result == 'crash':
+                return score, 'crash'
+            if result == 'eat' and board.food is None:
+                return score, 'win'
+            if pilot is not None and hungry > board.rows * board.cols:
+                return score, 'stuck'
+            next_tick += period
+            late = shown - next_tick
+            if late > period:
+                skip = int(late / period)
+                missed += skip
+                next_tick += skip * period
+
+def snake_game():
+    clear()
+    out('=== Змейка ===')
+    size = input_int('Размер поля (по умолчанию 10): ', 5) or 10
+    board = SnakeBoard(size, size, rng)
+    # реальное время и демо останавливаются клавишей q, поэтому без ввода
+    # по клавишам остаётся только режим по шагам
+    modes = '1 — по шагам, 2 — в реальном времени, 3 — автопилот' if can_read_keys() else '1 — по шагам'
+    mode = ask(f'Режим: {modes} (по умолчанию 1): ').strip()
+    if mode in ('2', '3') and not can_read_keys():
+        mode = '1'
+    if mode in ('2', '3'):
+        hz = input_int('Скорость, тиков в секунду (по умолчанию 10): ', 1, 120) or 10
+        score, result = snake_realtime(board, hz, SnakeAutopilot(board) if mode == '3' else None)
+        if result == 'crash':
+            out('Вы врезались. Игра окончена. Счёт:', score)
+        elif result == 'win':
+            out('Змейка заняла всё поле — победа! Счёт:', score)
+        elif result == 'stuck':
+            out('Автопилот остановился: до остальной еды ему не добраться. Счёт:', score)
+        else:
+            out('Выход. Счёт:', score)
+        press_enter()
+        return
+    direction = board.moves['d']  # starts moving right
+    score = 0
+    out('Управление: w/a/s/d шаг за шагом. Цель: съесть как можно больше еды.')
+    press_enter()
+    while True:
+        clear()
+        out(board.render())
+        out('Score:', score)
+        cmd = ask('Ввод (w/a/s/d), q - выход: ').strip().lower()
+        if cmd == 'q' or cmd == '':
+            break
+        if cmd in board.moves:
+            direction = board.moves[cmd]
+        result = board.step(direction, rng)
+        if result == 'crash':
+            clear()
+            out('Вы врезались. Игра окончена. Счёт:', score)
+            break
+        if result == 'eat':
+            score += 1
+            if board.food is None:
+                clear()
+                out(board.render())
+                out('Змейка заняла всё поле — победа! Счёт:', score)
+                break
+    press_enter()
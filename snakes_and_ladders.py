@@ -0,0 +1,244 @@
+# snakes_and_ladders.py
+# «Змеи и лестницы»: точный разбор поля как цепи Маркова, таблица переходов
+# для пакетных турниров и сама игра.
+
+from Littleminigames import ask, clear, input_int, out, press_enter, rng, sleep
+
+# -------------------------
+# Game 6: Snakes and Ladders
+# -------------------------
+SNL_SIZE = 100
+SNL_LADDERS = {2:38,7:14,8:31,15:26,28:84,21:42,36:44,51:67,71:91,78:98,87:94}
+SNL_SNAKES = {16:6,46:25,49:11,62:19,64:60,74:53,89:68,92:88,95:75,99:80}
+
+def snl_step(pos, roll, ladders, snakes, size=SNL_SIZE):
+    """
+    Клетка после броска roll с клетки pos: перелёт за size отскакивает
+    назад, потом срабатывает лестница или змея.
+    """
+    pos += roll
+    if pos > size:
+        pos = size - (pos - size)
+    if pos in ladders:
+        return ladders[pos]
+    return snakes.get(pos, pos)
+
+class SnakesLaddersChain:
+    """
+    Точный разбор поля как поглощающей цепи Маркова: состояния — клетки
+    0..size-1 (0 — старт до поля), size поглощает. Для каждой клетки —
+    ожидаемое число бросков до финиша (решение (I - Q) E = 1 методом Гаусса),
+    распределение номера броска, на котором игрок финиширует (прямой
+    прогон распределения, пока хвост не меньше TAIL), и отсюда точные шансы
+    мест за столом: все бросают по очереди одинаковый кубик.
+    """
+    TAIL = 1e-15
+    MAX_TURNS = 100000
+
+    def __init__(self, ladders, snakes, size=SNL_SIZE):
+        self.size = size
+        # moves[s] — клетки после бросков 1..6 с клетки s
+        self.moves = [[snl_step(s, d, ladders, snakes, size) for d in range(1, 7)]
+                      for s in range(size)]
+        self.expected_from = self._expected()
+        self.expected_turns = self.expected_from[0]
+        self.finish = self._finish()
+
+    def _expected(self):
+        n = self.size
+        a = [[0.0] * n + [1.0] for _ in range(n)]
+        for s in range(n):
+            a[s][s] += 1.0
+            for t in self.moves[s]:
+                if t < n:
+                    a[s][t] -= 1 / 6
+        for k in range(n):
+            p = max(range(k, n), key=lambda r: abs(a[r][k]))
+            if abs(a[p][k]) < 1e-12:
+                raise ValueError('с этого поля нельзя гарантированно дойти до финиша')
+            a[k], a[p] = a[p], a[k]
+            pivot = a[k]
+            for r in range(n):
+                if r != k and a[r][k]:
+                    f = a[r][k] / pivot[k]
+                    row = a[r]
+                    for j in range(k, n + 1):
+                        row[j] -= f * pivot[j]
+        return [a[s][n] / a[s][s] for s in range(n)]
+
+    def _finish(self):
+        """
+        finish[t] — вероятность финишировать ровно на t-м броске (finish[0] = 0).
+        """
+        n = self.size
+        dist = [0.0] * n
+        dist[0] = 1.0
+        finish = [0.0]
+        left = 1.0
+        while left > self.TAIL:
+            if len(finish) > self.MAX_TURNS:
+                raise ValueError('с этого поля нельзя гарантированно дойти до финиша')
+            new = [0.0] * n
+            done = 0.0
+            for s, p in enumerate(dist):
+                if p:
+                    p /= 6
+                    for t in self.moves[s]:
+                        if t < n:
+                            new[t] += p
+                        else:
+                            done += p
+            dist = new
+            finish.append(done)
+            left -= done
+        return finish
+
+    def survival(self):
+        """
+        survival[t] — вероятность ещё не финишировать после t бросков.
+        """
+        surv = [1.0]
+        for p in self.finish[1:]:
+            surv.append(max(0.0, surv[-1] - p))
+        return surv
+
+    def win_chances(self, seats):
+        """
+        Шанс победы каждого места (по порядку хода) при seats игроках.
+        Место i выигрывает на t-м броске, если до него в этом круге никто
+        не дошёл за t бросков, а после него — за t - 1.
+        """
+        surv = self.survival()
+        chances = [0.0] * seats
+        for t in range(1, len(self.finish)):
+            p = self.finish[t]
+            for i in range(seats):
+                chances[i] += p * surv[t] ** i * surv[t - 1] ** (seats - 1 - i)
+        total = sum(chances)
+        return [c / total for c in chances]
+
+    def expected_rounds(self, seats):
+        """
+        Средняя длина партии в кругах (круг — каждый бросил по разу).
+        """
+        return sum(s ** seats for s in self.survival())
+
+_SNL_CHAINS = {}
+
+def snakes_ladders_chain(ladders=SNL_LADDERS, snakes=SNL_SNAKES, size=SNL_SIZE):
+    """
+    Разбор поля (кешируется по описанию поля).
+    """
+    key = (size, tuple(sorted(ladders.items())), tuple(sorted(snakes.items())))
+    chain = _SNL_CHAINS.get(key)
+    if chain is None:
+        chain = _SNL_CHAINS[key] = SnakesLaddersChain(ladders, snakes, size)
+    return chain
+
+def snl_table(ladders=SNL_LADDERS, snakes=SNL_SNAKES, size=SNL_SIZE):
+    """
+    Таблица переходов для пакетной симуляции: table[6*s + d] = 6 * клетка
+    после броска d+1 с клетки s (отскок, лестница и змея уже учтены).
+    Клетки хранятся умноженными на 6, чтобы шаг был одним обращением к списку.
+    """
+    return [6 * snl_step(s, d, ladders, snakes, size) for s in range(size) for d in range(1, 7)]
+
+# байт 0..251 -> грань 0..5; 252..255 выбрасываются, чтобы грани были равновероятны
+_DIE_FACES = bytes(b % 6 for b in range(256))
+_DIE_DROP = bytes(range(252, 256))
+
+def snl_finish_turns(table, size, players, rnd, limit=100000):
+    """
+    Для players независимых игроков — номер броска, на котором каждый дошёл
+    до финиша. Игроки идут подряд по одному общему потоку бросков: кубики
+    берутся пачкой из randbytes (перевод в грани — translate на уровне C),
+    шаг — одно обращение к таблице snl_table.
+    """
+    goal = 6 * size
+    turns = []
+    s = n = 0
+    while len(turns) < players:
+        for r in rnd.randbytes(1 << 16).translate(_DIE_FACES, _DIE_DROP):
+            s = table[s + r]
+            n += 1
+            if s == goal:
+                turns.append(n)
+                if len(turns) == players:
+                    break
+                s = n = 0
+        if n > limit:
+            raise ValueError('с этого поля нельзя гарантированно дойти до финиша')
+    return turns
+
+def snl_tournament(table, size, seats, games, rnd):
+    """
+    Сыграть games партий на seats мест. Игроки друг другу не мешают, поэтому
+    партия — это seats независимых номеров финишного броска: побеждает
+    меньший, при равенстве — тот, кто ходит раньше; партия длится столько
+    кругов, сколько бросков понадобилось победителю.
+    Вернуть (победы по местам, сумма кругов, сумма квадратов кругов).
+    """
+    turns = snl_finish_turns(table, size, seats * games, rnd)
+    wins = [0] * seats
+    rounds = rounds_sq = 0
+    for g in range(0, seats * games, seats):
+        game = turns[g:g + seats]
+        m = min(game)
+        wins[game.index(m)] += 1
+        rounds += m
+        rounds_sq += m * m
+    return wins, rounds, rounds_sq
+
+def snakes_and_ladders():
+    clear()
+    out('=== Snakes and Ladders (Змеи и Лестницы) ===')
+    players_count = input_int('Число игроков (1-4): ', 1, 4) or 2
+    names = []
+    for i in range(players_count):
+        n = ask(f'Имя игрока {i+1} (Enter для "Player{i+1}"): ').strip() or f'Player{i+1}'
+        names.append(n)
+    while len(names) < 2:
+        names.append(f'CPU{len(names)+1}')
+    size = SNL_SIZE
+    ladders = SNL_LADDERS
+    snakes = SNL_SNAKES
+    chain = snakes_ladders_chain(ladders, snakes, size)
+    out(f'\nВ среднем до клетки {size} нужно {chain.expected_turns:.1f} бросков, '
+        f'партия длится {chain.expected_rounds(len(names)):.1f} кругов.')
+    for n, p in zip(names, chain.win_chances(len(names))):
+        out(f'  шанс {n}: {p:.1%}')
+    press_enter()
+    positions = {name:0 for name in names}
+    turn = 0
+    def roll(): return rng.randint(1,6)
+    while True:
+        clear()
+        out('Позиции:')
+        for n in names:
+            out(f'{n}: {positions[n]} (~{chain.expected_from[positions[n]]:.0f} бросков)', end='  ')
+        out('\n')
+        cur = names[turn % len(names)]
+        out(f'Ход игрока: {cur}')
+        if cur.startswith('CPU'):
+            sleep(0.6)
+            r = roll()
+            out(f'CPU бросил {r}')
+        else:
+            _ = ask('Нажмите Enter чтоб бросить кубик...')
+            r = roll()
+            out(f'Вы бросили {r}')
+        positions[cur] += r
+        if positions[cur] > size:
+            positions[cur] = size - (positions[cur] - size)
+        if positions[cur] in ladders:
+            out(f'Лестница! {positions[cur]} -> {ladders[positions[cur]]}')
+            positions[cur] = ladders[positions[cur]]
+        elif positions[cur] in snakes:
+            out(f'Змея! {positions[cur]} -> {snakes[positions[cur]]}')
+            positions[cur] = snakes[positions[cur]]
+        if positions[cur] == size:
+            out(f'\n{cur} достиг клетки {size} и победил! Поздравляем!')
+            break
+        turn += 1
+        sleep(0.8)
+    press_enter()
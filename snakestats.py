@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# snakestats.py
+# Самоигра змейки на автопилоте: нагрузка и регрессии (только стандартная библиотека).
+#
+#   python snakestats.py                         # поля 10, 15, 20, 40 — по 5 партий
+#   python snakestats.py 10 100 -n 5             # свои размеры поля, 5 партий
+#   python snakestats.py --max-steps 50000       # ограничить длину партии
+#   python snakestats.py -j 4                    # партии в 4 процессах
+#   python snakestats.py --json snake.json       # сохранить результаты в JSON
+#
+# Партии идут без экрана: SnakeBoard + SnakeAutopilot из snake_game.
+# Меряются шаги в секунду (решение + ход), средний счёт, исходы партий и
+# задержка одного решения автопилота (перцентили). Нечётное поле 15 в наборе
+# по умолчанию — регрессия неполного цикла; при авариях код выхода 1.
+
+import argparse
+import math
+import sys
+import time
+
+from snake_game import SnakeAutopilot, SnakeBoard
+from statutil import Z95, add_run_args, run_chunks, worker_pool, write_json
+
+SIZES = (10, 15, 20, 40)
+
+def play(size, rnd, max_steps, latencies):
+    """
+    Одна партия автопилотом. Время каждого решения (нс) добавляется в latencies.
+    Вернуть (исход, счёт, шагов): исход — 'win', 'crash', 'stuck' (автопилот
+    сдался на нечётном поле) или 'limit'.
+    """
+    board = SnakeBoard(size, size, rnd)
+    pilot = SnakeAutopilot(board)
+    clock = time.perf_counter_ns
+    score = 0
+    for steps in range(1, max_steps + 1):
+        t0 = clock()
+        d = pilot.decide()
+        latencies.append(clock() - t0)
+        if d is None:
+            return 'stuck', score, steps
+        result = board.step(d, rnd)
+        if result == 'crash':
+            return 'crash', score, steps
+        if result == 'eat':
+            score += 1
+            if board.food is None:
+                return 'win', score, steps
+    return 'limit', score, max_steps
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    k = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+def play_chunk(size, max_steps, rnd, games):
+    """
+    Сыграть пачку партий (выполняется в процессе пула).
+    Вернуть (исходы, счета, шагов, задержки решений в нс).
+    """
+    latencies = []
+    outcomes = {'win': 0, 'crash': 0, 'stuck': 0, 'limit': 0}
+    scores = []
+    steps = 0
+    for _ in range(games):
+        result, score, n = play(size, rnd, max_steps, latencies)
+        outcomes[result] += 1
+        scores.append(score)
+        steps += n
+    return outcomes, scores, steps, latencies
+
+def run_size(size, games, max_steps, pool=None, seed=0):
+    # пачка — одна партия: партии длинные, и так их проще раскидать по процессам
+    parts, seconds = run_chunks(play_chunk, (size, max_steps), games, 1, pool, seed, key=size)
+    latencies = []
+    outcomes = dict.fromkeys(('win', 'crash', 'stuck', 'limit'), 0)
+    scores = []
+    steps = 0
+    for part_outcomes, part_scores, part_steps, part_latencies in parts:
+        for result, k in part_outcomes.items():
+            outcomes[result] += k
+        scores += part_scores
+        steps += part_steps
+        latencies += part_latencies
+    latencies.sort()
+    mean = sum(scores) / games
+    sd = math.sqrt(sum((x - mean) ** 2 for x in scores) / (games - 1)) if games > 1 else 0.0
+    half = Z95 * sd / math.sqrt(games)
+    return {
+        'size': size,
+        'games': games,
+        'outcomes': outcomes,
+        'mean_score': mean,
+        'mean_score_ci95': [mean - half, mean + half],
+        'max_score': size * size - 1,
+        'steps': steps,
+        'steps_per_second': steps / seconds if seconds else 0.0,
+        'decision_us': {name: percentile(latencies, q) / 1e3
+                        for name, q in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))},
+        'seconds': seconds,
+    }
+
+def report(res):
+    lat = res['decision_us']
+    lo, hi = res['mean_score_ci95']
+    o = res['outcomes']
+    return (f"Поле {res['size']}x{res['size']}: {res['games']} партий, {res['steps']} шагов "
+            f"за {res['seconds']:.1f} с ({res['steps_per_second']:.0f} шагов/с)\n"
+            f"  счёт: {res['mean_score']:.1f} [{lo:.1f} .. {hi:.1f}] из {res['max_score']}"
+            f"   победы {o['win']}, аварии {o['crash']}, сдался {o['stuck']},"
+            f" упёрлись в лимит {o['limit']}\n"
+            f"  решение, мкс: p50 {lat['p50']:.1f}  p90 {lat['p90']:.1f}"
+            f"  p99 {lat['p99']:.1f}  max {lat['max']:.1f}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Самоигра змейки на автопилоте')
+    ap.add_argument('sizes', nargs='*', type=int, help='размеры поля (по умолчанию 10 15 20 40)')
+    add_run_args(ap, 5, 'партий на размер')
+    ap.add_argument('--max-steps', type=int, default=1_000_000, help='лимит шагов на партию')
+    args = ap.parse_args(argv)
+    results = []
+    with worker_pool(args.workers) as pool:
+        for size in args.sizes or SIZES:
+            res = run_size(size, args.games, args.max_steps, pool, args.seed)
+            results.append(res)
+            print(report(res), flush=True)
+    write_json(args.json, args.seed, results)
+    return 1 if any(res['outcomes']['crash'] for res in results) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# snlstats.py
+# Турниры «Змей и лестниц» без экрана (только стандартная библиотека).
+#
+#   python snlstats.py                                  # встроенное поле, 2-4 места, по 1000000 партий
+#   python snlstats.py -n 5000000 -j 8 --seats 4        # 8 процессов, только 4 места
+#   python snlstats.py --ladders 3:40,20:77 --snakes 97:5,50:10 --size 100
+#   python snlstats.py --json snl.json                  # сохранить результаты в JSON
+#
+# Ход — одно обращение к таблице переходов snl_table (отскок, лестницы и змеи
+# в ней уже учтены), кубики берутся пачками из randbytes. Партии режутся на
+# пачки со своим сидом из (--seed, номер пачки), поэтому результат не зависит
+# от числа процессов. Рядом печатается точный ответ SnakesLaddersChain.
+
+import argparse
+import sys
+
+from snakes_and_ladders import SNL_LADDERS, SNL_SIZE, SNL_SNAKES, snakes_ladders_chain, snl_table, snl_tournament
+from statutil import add_run_args, mean_ci, run_chunks, wilson, worker_pool, write_json
+
+CHUNK = 20000
+
+def play_chunk(table, size, seats, rnd, games):
+    """
+    Сыграть пачку партий (выполняется в процессе пула).
+    """
+    wins, rounds, rounds_sq = snl_tournament(table, size, seats, games, rnd)
+    return {'games': games, 'wins': wins, 'rounds': rounds, 'rounds_sq': rounds_sq}
+
+def estimate(ladders, snakes, size, seats, games, pool=None, seed=0):
+    """
+    Сыграть games партий на seats мест и сравнить с точным разбором поля.
+    """
+    chain = snakes_ladders_chain(ladders, snakes, size)
+    table = snl_table(ladders, snakes, size)
+    parts, seconds = run_chunks(play_chunk, (table, size, seats), games, CHUNK, pool, seed, key=seats)
+    total = {'games': 0, 'wins': [0] * seats, 'rounds': 0, 'rounds_sq': 0}
+    for part in parts:
+        total['games'] += part['games']
+        total['rounds'] += part['rounds']
+        total['rounds_sq'] += part['rounds_sq']
+        for i, w in enumerate(part['wins']):
+            total['wins'][i] += w
+    n = total['games']
+    exact = chain.win_chances(seats)
+    return {
+        'seats': seats,
+        'games': n,
+        'win_rate': [w / n for w in total['wins']],
+        'win_rate_ci95': [list(wilson(w, n)) for w in total['wins']],
+        'win_rate_exact': exact,
+        'mean_rounds_ci95': list(mean_ci(total['rounds'], total['rounds_sq'], n)),
+        'mean_rounds_exact': chain.expected_rounds(seats),
+        'seconds': seconds,
+        'games_per_minute': 60 * n / seconds if seconds else 0.0,
+    }
+
+def report(res):
+    r, rlo, rhi = res['mean_rounds_ci95']
+    lines = [
+        f"{res['seats']} места: {res['games']} партий за {res['seconds']:.1f} с "
+        f"({res['games_per_minute'] / 1e6:.2f} млн партий/мин)",
+        f"  кругов за партию:  {r:7.3f}  [{rlo:.3f} .. {rhi:.3f}]   точно {res['mean_rounds_exact']:.3f}",
+        '  место   победы                        точно',
+    ]
+    for i, p in enumerate(res['win_rate']):
+        lo, hi = res['win_rate_ci95'][i]
+        ex = res['win_rate_exact'][i]
+        mark = '' if lo <= ex <= hi else '  вне ДИ'
+        lines.append(f'  {i + 1:5d}  {p:7.3%}  [{lo:.3%} .. {hi:.3%}]  {ex:7.3%}{mark}')
+    return '\n'.join(lines)
+
+def parse_pairs(text):
+    """
+    '2:38,7:14' -> {2: 38, 7: 14}
+    """
+    try:
+        return {int(a): int(b) for a, b in (item.split(':') for item in text.split(',') if item)}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'ожидается ОТКУДА:КУДА через запятую, например 2:38,7:14: {text!r}')
+
+def check_board(ladders, snakes, size):
+    for a, b in ladders.items():
+        if not 0 < a < b <= size:
+            raise SystemExit(f'лестница {a}:{b} должна вести вверх в пределах 1..{size}')
+    for a, b in snakes.items():
+        if not 0 < b < a < size:
+            raise SystemExit(f'змея {a}:{b} должна вести вниз в пределах 1..{size - 1}')
+    if set(ladders) & set(snakes):
+        raise SystemExit('на одной клетке не может быть и лестницы, и змеи')
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Турниры «Змей и лестниц» и проверка точного разбора')
+    ap.add_argument('--seats', type=int, nargs='+', default=[2, 3, 4], choices=range(2, 5),
+                    help='числа мест (по умолчанию 2 3 4)')
+    ap.add_argument('--size', type=int, default=SNL_SIZE, help='последняя клетка поля')
+    ap.add_argument('--ladders', type=parse_pairs, help='лестницы ОТКУДА:КУДА,... (по умолчанию встроенные; пустая строка — без лестниц)')
+    ap.add_argument('--snakes', type=parse_pairs, help='змеи ОТКУДА:КУДА,... (по умолчанию встроенные; пустая строка — без змей)')
+    add_run_args(ap, 1_000_000, 'партий на число мест')
+    args = ap.parse_args(argv)
+    ladders = SNL_LADDERS if args.ladders is None else args.ladders
+    snakes = SNL_SNAKES if args.snakes is None else args.snakes
+    check_board(ladders, snakes, args.size)
+    try:
+        chain = snakes_ladders_chain(ladders, snakes, args.size)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f'Поле {args.size}: лестниц {len(ladders)}, змей {len(snakes)}, '
+          f'в среднем {chain.expected_turns:.2f} бросков до финиша', flush=True)
+    results = []
+    with worker_pool(args.workers) as pool:
+        for seats in args.seats:
+            res = estimate(ladders, snakes, args.size, seats, args.games, pool, args.seed)
+            results.append(res)
+            print(report(res), flush=True)
+    write_json(args.json, args.seed, results, board={'size': args.size, 'ladders': ladders, 'snakes': snakes})
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# statutil.py
+# Общее для скриптов статистики (*stats.py): доверительные интервалы, общие
+# ключи командной строки, прогон партий пачками в пуле процессов и запись
+# результатов в JSON. Только стандартная библиотека.
+
+import json
+import math
+import os
+import random
+import time
+from contextlib import contextmanager
+from multiprocessing import Pool
+
+Z95 = 1.959964
+
+# -------------------------
+# Intervals
+# -------------------------
+def wilson(successes, n, z=Z95):
+    """
+    Доверительный интервал Уилсона для доли (по умолчанию 95%).
+    """
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+def mean_ci(total, total_sq, n, z=Z95):
+    """
+    Среднее и нормальный доверительный интервал по сумме и сумме квадратов.
+    """
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean = total / n
+    var = max(0.0, (total_sq - n * mean * mean) / (n - 1)) if n > 1 else 0.0
+    half = z * math.sqrt(var / n)
+    return mean, mean - half, mean + half
+
+# -------------------------
+# Runner
+# -------------------------
+def add_run_args(ap, games, per, dest='games'):
+    """
+    Общие ключи: -n (сколько партий на каждый случай, per — подпись вроде
+    'партий на поле'), -j, --seed и --json.
+    """
+    ap.add_argument('-n', f'--{dest}', type=int, default=games, help=f'{per} (по умолчанию {games})')
+    ap.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                    help='процессов (по умолчанию — по числу ядер; 1 — без пула)')
+    ap.add_argument('--seed', type=int, default=0, help='сид (результат от -j не зависит)')
+    ap.add_argument('--json', help='записать результаты в JSON-файл')
+
+@contextmanager
+def worker_pool(workers):
+    """
+    Пул из workers процессов или None, если workers <= 1 (всё считается здесь).
+    """
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        yield pool
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+def _run_chunk(task):
+    job, params, seed, games = task
+    return job(*params, random.Random(seed), games)
+
+def run_chunks(job, params, games, chunk, pool=None, seed=0, key=''):
+    """
+    Сыграть games партий пачками по chunk: пачка — вызов job(*params, rnd, n)
+    в процессе пула, rnd — random.Random с сидом f'{seed}/{key}/{номер пачки}',
+    поэтому результат не зависит от числа процессов. job должна быть функцией
+    верхнего уровня модуля (её передают в пул по имени).
+    Вернуть (результаты пачек по порядку, секунды).
+    """
+    tasks = [(job, params, f'{seed}/{key}/{k}', min(chunk, games - start))
+             for k, start in enumerate(range(0, games, chunk))]
+    t0 = time.perf_counter()
+    parts = list(pool.imap(_run_chunk, tasks) if pool else map(_run_chunk, tasks))
+    return parts, time.perf_counter() - t0
+
+def write_json(path, seed, results, **extra):
+    """
+    Записать {'seed': ..., ...extra, 'results': [...]} в path (если path задан).
+    """
+    if not path:
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'seed': seed, **extra, 'results': results}, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,348 @@
+# sugar_hives.py
+# «Сахарные соты»: поле с поиском троек только через изменившиеся клетки
+# и игра (в том числе марафон).
+
+from Littleminigames import ask, clear, input_int, out, press_enter, rng, sleep
+
+# -----------------------
+# 4) Сахарные соты (Sugar Hives) - match puzzle: pick adjacent to form triples
+# -----------------------
+HIVE_VIEW_ROWS = 20
+HIVE_VIEW_COLS = 30
+HIVE_MARATHON = 200
+HIVE_GONE = b'\xff'
+
+class HiveBoard:
+    """
+    Поле «Сахарных сот»: плоский bytearray rows*cols с кодами символов
+    (0..len(types)-1), клетка (r, c) — индекс r*cols + c. Тройки ищутся не по
+    всему полю, а только через изменившиеся клетки: от каждой — влево/вправо
+    и вверх/вниз, пока символ тот же. Удалённые клетки сжимаются в столбце
+    срезом с шагом cols, сверху досыпаются коды из заранее набранной пачки
+    случайных, и изменившиеся клетки проверяются снова — каскад идёт, пока
+    поле не успокоится.
+
+    moves — bytearray флагов по номеру обмена 2*i + d (d = 0 — обмен i с i+1,
+    d = 1 — с i+cols): 1, если обмен сейчас даёт тройку; move_count — число
+    единиц. Это 2 байта на клетку (80 КБ на 200x200) вместо множества чисел.
+    Годность обмена зависит только от клеток на расстоянии до двух по ряду
+    и столбцу от его концов, поэтому после изменений перепроверяются лишь
+    обмены рядом с изменившимися клетками.
+    """
+    def __init__(self, rows, cols, types, rnd):
+        self.rows = rows
+        self.cols = cols
+        self.types = types
+        self.rnd = rnd
+        self.glyphs = bytes.maketrans(bytes(range(len(types))), ''.join(types).encode('ascii'))
+        self.buf = bytearray()
+        self.shuffle()
+
+    def index(self, r, c):
+        return r * self.cols + c
+
+    def coords(self, i):
+        return divmod(i, self.cols)
+
+    def draw(self, k):
+        """
+        k случайных кодов символов. Берутся из пачки, пачка досыпается
+        одним вызовом choices сразу на 4096 кодов.
+        """
+        buf = self.buf
+        if len(buf) < k:
+            buf.extend(self.rnd.choices(range(len(self.types)), k=max(4096, k)))
+        codes = buf[:k]
+        del buf[:k]
+        return codes
+
+    def shuffle(self):
+        """
+        Новое поле без готовых троек и хотя бы с одним возможным ходом.
+        """
+        while True:
+            self.fill()
+            self.refresh_all()
+            if self.move_count:
+                return
+
+    def fill(self):
+        cols, kinds = self.cols, len(self.types)
+        n = self.rows * cols
+        self.grid = g = self.draw(n)
+        # символ не повторяет двух одинаковых слева или двух одинаковых сверху
+        for i in range(n):
+            left = g[i - 1] if i % cols >= 2 and g[i - 1] == g[i - 2] else -1
+            up = g[i - cols] if i >= 2 * cols and g[i - cols] == g[i - 2 * cols] else -1
+            while g[i] == left or g[i] == up:
+                g[i] = self.rnd.randrange(kinds)
+
+    def swap(self, i, j):
+        g = self.grid
+        g[i], g[j] = g[j], g[i]
+
+    def in_line(self, i):
+        """
+        Стоит ли клетка i в тройке: смотрим только по две клетки в каждую сторону.
+        """
+        g, cols = self.grid, self.cols
+        s = g[i]
+        c = i % cols
+        n = 1
+        if c >= 1 and g[i - 1] == s:
+            n += 1
+            if c >= 2 and g[i - 2] == s:
+                n += 1
+        if c + 1 < cols and g[i + 1] == s:
+            n += 1
+            if c + 2 < cols and g[i + 2] == s:
+                n += 1
+        if n >= 3:
+            return True
+        n = 1
+        if i >= cols and g[i - cols] == s:
+            n += 1
+            if i >= 2 * cols and g[i - 2 * cols] == s:
+                n += 1
+        if i + cols < len(g) and g[i + cols] == s:
+            n += 1
+            if i + 2 * cols < len(g) and g[i + 2 * cols] == s:
+                n += 1
+        return n >= 3
+
+    def makes_line(self, i, j):
+        """
+        Даст ли обмен i и j тройку (поле после проверки не меняется).
+        """
+        g = self.grid
+        if g[i] == g[j]:
+            return False
+        self.swap(i, j)
+        ok = self.in_line(i) or self.in_line(j)
+        self.swap(i, j)
+        return ok
+
+    def move_key(self, i, j):
+        if i > j:
+            i, j = j, i
+        return 2 * i + (j - i != 1)
+
+    def is_move(self, i, j):
+        return self.moves[self.move_key(i, j)] == 1
+
+    def hint(self):
+        """
+        Случайный годный обмен (i, j) или None. Берётся k-я единица в moves
+        для случайного k: единицы считаются блоками через bytearray.count,
+        а внутри блока ищутся через find.
+        """
+        if not self.move_count:
+            return None
+        moves = self.moves
+        k = self.rnd.randrange(self.move_count)
+        start = 0
+        while True:
+            ones = moves.count(1, start, start + 1024)
+            if k < ones:
+                break
+            k -= ones
+            start += 1024
+        key = moves.find(1, start)
+        for _ in range(k):
+            key = moves.find(1, key + 1)
+        i = key >> 1
+        return i, i + (self.cols if key & 1 else 1)
+
+    def refresh_all(self):
+        cols = self.cols
+        n = len(self.grid)
+        self.moves = moves = bytearray(2 * n)
+        for i in range(n):
+            if i % cols + 1 < cols and self.makes_line(i, i + 1):
+                moves[2 * i] = 1
+            if i + cols < n and self.makes_line(i, i + cols):
+                moves[2 * i + 1] = 1
+        self.move_count = moves.count(1)
+
+    def refresh(self, cells):
+        """
+        Перепроверить обмены, чьи концы в пределах двух клеток (по ряду или
+        столбцу) от изменившихся cells.
+        """
+        cols = self.cols
+        n = len(self.grid)
+        near = set()
+        for i in cells:
+            start = i - i % cols
+            near.update(range(max(start, i - 2), min(start + cols, i + 3)))
+            near.update(range(max(i % cols, i - 2 * cols), min(n, i + 3 * cols), cols))
+        keys = set()
+        for i in near:
+            c = i % cols
+            if c + 1 < cols:
+                keys.add(2 * i)
+            if c > 0:
+                keys.add(2 * (i - 1))
+            if i + cols < n:
+                keys.add(2 * i + 1)
+            if i >= cols:
+                keys.add(2 * (i - cols) + 1)
+        moves = self.moves
+        count = self.move_count
+        for key in keys:
+            i = key >> 1
+            ok = self.makes_line(i, i + (cols if key & 1 else 1))
+            if moves[key] != ok:
+                moves[key] = ok
+                count += 1 if ok else -1
+        self.move_count = count
+
+    def matches_at(self, cells):
+        """
+        Клетки всех троек (и длиннее), проходящих через cells. Вне cells поле
+        уже спокойное, поэтому достаточно найти все серии в рядах и столбцах,
+        где лежат cells: серию ищет регулярное выражение по байтам рядов или
+        по срезу столбца с шагом cols. Ряды от верхнего до нижнего из cells
+        лежат в grid подряд и просматриваются одним проходом; серия, которая
+        перешла через край ряда, режется по рядам.
+        """
+        import re
+        run = re.compile(rb'(.)\1\1+', re.S)
+        g, cols = self.grid, self.cols
+        found = set()
+        top = min(cells) // cols * cols
+        bottom = (max(cells) // cols + 1) * cols
+        for m in run.finditer(g, top, bottom):
+            a, b = m.span()
+            if a // cols == (b - 1) // cols:
+                found.update(range(a, b))
+                continue
+            while a < b:
+                end = min(b, a - a % cols + cols)
+                if end - a >= 3:
+                    found.update(range(a, end))
+                a = end
+        for c in {i % cols for i in cells}:
+            for m in run.finditer(g[c::cols]):
+                found.update(range(c + m.start() * cols, c + m.end() * cols, cols))
+        return found
+
+    def collapse(self, matched):
+        """
+        Убрать matched: клетки над ними падают вниз, сверху досыпаются новые.
+        Вернуть изменившиеся клетки (в каждом затронутом столбце — от верха
+        до самой нижней удалённой).
+        """
+        g, cols = self.grid, self.cols
+        low = {}
+        for i in matched:
+            g[i] = HIVE_GONE[0]
+            c = i % cols
+            if low.get(c, -1) < i:
+                low[c] = i
+        changed = []
+        for c, i in low.items():
+            column = g[c:i + 1:cols]
+            keep = column.replace(HIVE_GONE, b'')
+            g[c:i + 1:cols] = self.draw(len(column) - len(keep)) + keep
+            changed.extend(range(c, i + 1, cols))
+        return changed
+
+    def resolve(self, cells):
+        """
+        Каскад от изменившихся клеток cells. Вернуть (очки, размеры волн):
+        k-я волна приносит (число клеток) * k — комбо.
+        """
+        score = 0
+        waves = []
+        touched = set(cells)
+        matched = self.matches_at(cells)
+        while matched:
+            waves.append(len(matched))
+            score += len(matched) * len(waves)
+            changed = self.collapse(matched)
+            touched.update(changed)
+            matched = self.matches_at(changed)
+        # индекс ходов нужен только для успокоившегося поля
+        self.refresh(touched)
+        return score, waves
+
+    def render(self, focus_r=0, focus_c=0):
+        """
+        Текст поля с номерами рядов/столбцов. Большое поле показывается
+        окном HIVE_VIEW_ROWS x HIVE_VIEW_COLS вокруг клетки (focus_r, focus_c).
+        """
+        r0 = max(0, min(focus_r - HIVE_VIEW_ROWS // 2, self.rows - HIVE_VIEW_ROWS))
+        c0 = max(0, min(focus_c - HIVE_VIEW_COLS // 2, self.cols - HIVE_VIEW_COLS))
+        r1 = min(self.rows, r0 + HIVE_VIEW_ROWS)
+        c1 = min(self.cols, c0 + HIVE_VIEW_COLS)
+        cw = len(str(c1 - 1)) + 1
+        rw = len(str(r1 - 1))
+        lines = [' ' * (rw + 1) + ''.join(f'{c:{cw}d}' for c in range(c0, c1))]
+        pad = ' ' * (cw - 1)
+        for r in range(r0, r1):
+            a = self.index(r, c0)
+            cells = self.grid[a:a + c1 - c0].translate(self.glyphs).decode('ascii')
+            lines.append(f'{r:{rw}d} ' + pad + pad.join(cells))
+        return '\n'.join(lines)
+
+def sugar_hives():
+    clear()
+    out('=== Сахарные соты ===')
+    out(f'1) Обычное поле   2) Марафон {HIVE_MARATHON}x{HIVE_MARATHON}')
+    mode = input_int('Режим (по умолчанию 1): ', 1, 2) or 1
+    if mode == 2:
+        rows = cols = HIVE_MARATHON
+    else:
+        rows = input_int('Рядов (по умолчанию 5): ', 3) or 5
+        cols = input_int('Столбцов (по умолчанию 6): ', 3) or 6
+    types = ['*', '#', '@', '%']
+    board = HiveBoard(rows, cols, types, rng)
+    score = 0
+    focus = (rows // 2, cols // 2)
+    def render():
+        clear()
+        out(board.render(*focus))
+        out('Score:', score)
+    press_enter()
+    while True:
+        render()
+        out('Выберите две соседние клетки, чтобы попытаться создать тройку.')
+        cmd = ask('Формат: r1 c1 r2 c2 (h — подсказка, Enter выйти): ').strip()
+        if cmd == '':
+            break
+        if cmd.lower() in ('h', 'hint'):
+            i, j = board.hint()
+            (r1, c1), (r2, c2) = board.coords(i), board.coords(j)
+            focus = (r1, c1)
+            out(f'Подсказка: {r1} {c1} {r2} {c2}')
+            sleep(1.0); continue
+        parts = cmd.split()
+        try:
+            r1,c1,r2,c2 = map(int, parts)
+        except ValueError:
+            out('Неверный ввод.')
+            sleep(0.5); continue
+        if not (0<=r1<rows and 0<=r2<rows and 0<=c1<cols and 0<=c2<cols):
+            out('Координаты вне диапазона. Начинайте с 0.')
+            sleep(0.5); continue
+        if abs(r1-r2) + abs(c1-c2) != 1:
+            out('Клетки должны быть соседними.')
+            sleep(0.5); continue
+        focus = (r1, c1)
+        i, j = board.index(r1, c1), board.index(r2, c2)
+        if not board.is_move(i, j):
+            out('Нет тройки — обмен отменён.')
+            sleep(0.6); continue
+        board.swap(i, j)
+        gained, waves = board.resolve([i, j])
+        score += gained
+        combo = f' Комбо x{len(waves)}: ' + ' + '.join(map(str, waves)) if len(waves) > 1 else ''
+        out(f'Удалено {sum(waves)}!{combo} (+{gained})')
+        sleep(0.6)
+        if not board.move_count:
+            out('Ходов больше нет — соты перемешаны.')
+            board.shuffle()
+            sleep(1.0)
+    out('Игра окончена. Счёт:', score)
+    press_enter()